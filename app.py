@@ -1,13 +1,17 @@
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, request, jsonify, render_template, stream_with_context
 from flask_cors import CORS
-import csv
-from datetime import datetime
+import json
 import os
 
+from config.settings import file_name, history_backend
+from modules.history import open_history, decode_cursor
+
 app = Flask(__name__)
 CORS(app)
 
-PATH = 'all excels/'
+MAX_PAGE_SIZE = 1000
+SORT_FIELDS = {'company': 'Company', 'title': 'Title', 'date_applied': 'Date Applied'}
+history = open_history()
 ##> ------ Karthik Sarode : karthik.sarode23@gmail.com - UI for excel files ------
 @app.route('/')
 def home():
@@ -17,40 +21,69 @@ def home():
 @app.route('/applied-jobs', methods=['GET'])
 def get_applied_jobs():
     '''
-    Retrieves a list of applied jobs from the applications history CSV file.
+    Streams a page of applied jobs from the applications history as NDJSON (one JSON object per line).
     
-    Returns a JSON response containing a list of jobs, each with details such as 
-    Job ID, Title, Company, HR Name, HR Link, Job Link, External Job link, and Date Applied.
+    Each job line has details such as Job ID, Title, Company, HR Name, HR Link, Job Link,
+    External Job link, and Date Applied. The last line is `{"next_cursor": ...}`, pass it
+    back as `cursor` to get the next page, it's `null` when there are no more jobs.
+
+    Query parameters:
+        limit (int): Jobs per page, 1 to 1000, default 100.
+        cursor (str): Cursor from the previous page.
+        sort (str): "company", "title" or "date_applied", default is the order jobs were saved in.
+        order (str): "asc" or "desc", default "asc".
+        company, title (str): Case insensitive filters on Company and Title.
+        date_from, date_to (str): Inclusive `YYYY-MM-DD` range filter on Date Applied.
     
     If the CSV file is not found, returns a 404 error with a relevant message.
-    If any other exception occurs, returns a 500 error with the exception message.
+    If the parameters are invalid, returns a 400 error with the reason.
     '''
 
     try:
-        jobs = []
-        with open(PATH + 'all_applied_applications_history.csv', 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                jobs.append({
-                    'Job_ID': row['Job ID'],
-                    'Title': row['Title'],
-                    'Company': row['Company'],
-                    'HR_Name': row['HR Name'],
-                    'HR_Link': row['HR Link'],
-                    'Job_Link': row['Job Link'],
-                    'External_Job_link': row['External Job link'],
-                    'Date_Applied': row['Date Applied']
-                })
-        return jsonify(jobs)
-    except FileNotFoundError:
+        limit = int(request.args.get('limit', 100))
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+        sort = request.args.get('sort', '')
+        if sort and sort not in SORT_FIELDS:
+            raise ValueError(f"sort must be one of {list(SORT_FIELDS)}")
+        order = request.args.get('order', 'asc')
+        if order not in ('asc', 'desc'):
+            raise ValueError("order must be 'asc' or 'desc'")
+        filters = {key: request.args.get(key, '').strip() for key in ('company', 'title', 'date_from', 'date_to')}
+        cursor = request.args.get('cursor') or None
+        if cursor: decode_cursor(cursor)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    if history_backend == "csv" and not os.path.exists(file_name):
         return jsonify({"error": "No applications history found"}), 404
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+
+    # One job more than the page is read, so there is a next page only if it exists
+    jobs = history.iter_applied_jobs(SORT_FIELDS.get(sort), order == 'desc', filters, cursor, limit + 1)
+
+    def generate():
+        last_cursor = None
+        has_more = False
+        count = 0
+        try:
+            for job_cursor, job in jobs:
+                if count == limit:
+                    has_more = True
+                    break
+                last_cursor = job_cursor
+                count += 1
+                yield json.dumps({key.replace(' ', '_'): value for key, value in job.items()}) + "\n"
+            yield json.dumps({"next_cursor": last_cursor if has_more else None}) + "\n"
+        except Exception as e:
+            print(f"Error streaming applied jobs: {str(e)}")  # Debug log
+            yield json.dumps({"error": str(e)}) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
 
 @app.route('/applied-jobs/<job_id>', methods=['PUT'])
 def update_applied_date(job_id):
     """
-    Updates the 'Date Applied' field of a job in the applications history CSV file.
+    Updates the 'Date Applied' field of a job in the applications history.
 
     Args:
         job_id (str): The Job ID of the job to be updated.
@@ -62,36 +95,47 @@ def update_applied_date(job_id):
         exception message.
     """
     try:
-        data = []
-        csvPath = PATH + 'all_applied_applications_history.csv'
-        
-        if not os.path.exists(csvPath):
-            return jsonify({"error": f"CSV file not found at {csvPath}"}), 404
-            
-        # Read current CSV content
-        with open(csvPath, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            fieldNames = reader.fieldnames
-            found = False
-            for row in reader:
-                if row['Job ID'] == job_id:
-                    row['Date Applied'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    found = True
-                data.append(row)
-        
-        if not found:
-            return jsonify({"error": f"Job ID {job_id} not found"}), 404
+        if history_backend == "csv" and not os.path.exists(file_name):
+            return jsonify({"error": f"CSV file not found at {file_name}"}), 404
 
-        with open(csvPath, 'w', encoding='utf-8', newline='') as file:
-            writer = csv.DictWriter(file, fieldnames=fieldNames)
-            writer.writeheader()
-            writer.writerows(data)
+        if not history.update_date_applied([job_id]):
+            return jsonify({"error": f"Job ID {job_id} not found"}), 404
         
         return jsonify({"message": "Date Applied updated successfully"}), 200
     except Exception as e:
         print(f"Error updating applied date: {str(e)}")  # Debug log
         return jsonify({"error": str(e)}), 500
 
+@app.route('/applied-jobs', methods=['PUT'])
+def update_applied_dates():
+    """
+    Updates the 'Date Applied' field of many jobs in the applications history in one transaction.
+
+    Request body (JSON):
+        job_ids (list[str]): The Job IDs of the jobs to be updated.
+        date_applied (str): Optional, defaults to current date and time.
+
+    Returns:
+        A JSON response with `updated` and `not_found` lists of Job IDs. If the request
+        body is invalid, returns a 400 error. If any other exception occurs, returns a
+        500 error with the exception message.
+    """
+    data = request.get_json(silent=True) or {}
+    job_ids = data.get('job_ids')
+    if not isinstance(job_ids, list) or not job_ids or not all(isinstance(job_id, str) for job_id in job_ids):
+        return jsonify({"error": "Expected a JSON body with a non-empty list of strings `job_ids`"}), 400
+    try:
+        if history_backend == "csv" and not os.path.exists(file_name):
+            return jsonify({"error": f"CSV file not found at {file_name}"}), 404
+
+        updated = history.update_date_applied(job_ids, data.get('date_applied'))
+        updated_ids = set(updated)
+        not_found = [job_id for job_id in dict.fromkeys(job_ids) if job_id not in updated_ids]
+        return jsonify({"updated": updated, "not_found": not_found}), 200
+    except Exception as e:
+        print(f"Error updating applied dates: {str(e)}")  # Debug log
+        return jsonify({"error": str(e)}), 500
+
 if __name__ == '__main__':
     app.run(debug=True)
 
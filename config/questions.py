@@ -118,6 +118,77 @@ confidence_level = "8"             # Any number between "1" to "10" including 1
 ##
 
 
+# Rules to answer Easy Apply questions. For each question, the first rule (highest "priority" first, then in this order) whose words are found in the question (case-insensitive) answers it.
+# * "kinds": Kinds of questions it answers, from "select", "radio", "text" and "textarea". All if not given.
+# * "any": At least one of these words must be in the question
+# * "all": All of these must be in the question, a list inside means any one of those words. Eg: ["salary", ["month", "monthly"]]
+# * "none": None of these words can be in the question
+# * "answer": The answer in quotes, or a dict of answers per kind Eg: {"select": "Yes", "text": "5"}
+#   OR "use": Name of a variable from your config to answer with, like "phone_number", "desired_salary_lakhs",
+#      or "previous_answer", "work_location" (of the job), "current_city_or_work_location"
+# * "autocomplete": True to pick the first suggestion after typing the answer (for location inputs)
+# * "priority": Number, higher is tried first. Default is 0
+# Questions that no rule answers are left to AI (if enabled) or answered with "Yes" for select and radio questions
+answer_rules = [
+    # Select questions
+    {"kinds": ["select"], "any": ["email", "phone"], "use": "previous_answer"},
+    {"kinds": ["select"], "any": ["gender", "sex"], "use": "gender"},
+    {"kinds": ["select"], "any": ["disability"], "use": "disability_status"},
+    {"kinds": ["select"], "any": ["proficiency"], "answer": "Professional"},
+    {"kinds": ["select"], "any": ["country"], "use": "country"},
+    {"kinds": ["select"], "any": ["state"], "use": "state"},
+    {"kinds": ["select"], "any": ["city"], "use": "current_city_or_work_location"},
+    {"kinds": ["select"], "any": ["location"], "use": "work_location"},
+
+    # Radio questions
+    {"kinds": ["radio"], "any": ["citizenship", "employment eligibility"], "use": "us_citizenship"},
+    {"kinds": ["radio"], "any": ["veteran", "protected"], "use": "veteran_status"},
+    {"kinds": ["radio"], "any": ["disability", "handicapped"], "use": "disability_status"},
+
+    # Text questions
+    {"kinds": ["text"], "any": ["experience", "years"], "use": "years_of_experience"},
+    {"kinds": ["text"], "any": ["phone", "mobile"], "use": "phone_number"},
+    {"kinds": ["text"], "any": ["street"], "use": "street"},
+    {"kinds": ["text"], "any": ["city", "location", "address"], "use": "current_city_or_work_location", "autocomplete": True},
+    {"kinds": ["text"], "any": ["signature"], "use": "full_name"},
+    {"kinds": ["text"], "all": ["name", "full"], "use": "full_name"},
+    {"kinds": ["text"], "all": ["name", "first"], "none": ["last"], "use": "first_name"},
+    {"kinds": ["text"], "all": ["name", "middle"], "none": ["last"], "use": "middle_name"},
+    {"kinds": ["text"], "all": ["name", "last"], "none": ["first"], "use": "last_name"},
+    {"kinds": ["text"], "all": ["name", "employer"], "use": "recent_employer"},
+    {"kinds": ["text"], "any": ["name"], "use": "full_name"},
+    {"kinds": ["text"], "all": ["notice", "month"], "use": "notice_period_months"},
+    {"kinds": ["text"], "all": ["notice", "week"], "use": "notice_period_weeks"},
+    {"kinds": ["text"], "any": ["notice"], "use": "notice_period"},
+    {"kinds": ["text"], "all": [["salary", "compensation", "ctc", "ctoc", "pay"], ["current", "present"], "month"], "use": "current_ctc_monthly"},
+    {"kinds": ["text"], "all": [["salary", "compensation", "ctc", "ctoc", "pay"], ["current", "present"], "lakh"], "use": "current_ctc_lakhs"},
+    {"kinds": ["text"], "all": [["salary", "compensation", "ctc", "ctoc", "pay"], ["current", "present"]], "use": "current_ctc"},
+    {"kinds": ["text"], "all": [["salary", "compensation", "ctc", "ctoc", "pay"], "month"], "use": "desired_salary_monthly"},
+    {"kinds": ["text"], "all": [["salary", "compensation", "ctc", "ctoc", "pay"], "lakh"], "use": "desired_salary_lakhs"},
+    {"kinds": ["text"], "any": ["salary", "compensation", "ctc", "ctoc", "pay"], "use": "desired_salary"},
+    {"kinds": ["text"], "any": ["linkedin"], "use": "linkedIn"},
+    {"kinds": ["text"], "any": ["website", "blog", "portfolio", "link"], "use": "website"},
+    {"kinds": ["text"], "any": ["scale of 1-10"], "use": "confidence_level"},
+    {"kinds": ["text"], "any": ["headline"], "use": "linkedin_headline"},
+    {"kinds": ["text"], "all": [["hear", "come across"], "this", ["job", "position"]], "answer": "https://github.com/GodsScion/Auto_job_applier_linkedIn"},
+    {"kinds": ["text"], "any": ["state", "province"], "use": "state"},
+    {"kinds": ["text"], "any": ["zip", "postal", "code"], "use": "zipcode"},
+    {"kinds": ["text"], "any": ["country"], "use": "country"},
+
+    # Textarea questions
+    {"kinds": ["textarea"], "any": ["summary"], "use": "linkedin_summary"},
+    {"kinds": ["textarea"], "any": ["cover"], "use": "cover_letter"},
+
+    # Common questions, tried after all others
+    {"kinds": ["select", "radio", "text"], "any": ["sponsorship", "visa"], "use": "require_visa", "priority": -1},
+]
+
+# Answers of questions you know, to answer text questions that mean the same without AI, if `semantic_match = True` in settings.
+# Eg: {"How many years of Java experience do you have?": "5"} also answers "Java - years" and "Years of experience in Java?"
+# Questions no rule answers and that you answered in submitted applications are added automatically.
+question_answers = {}               # {"Question": "Answer", ...} in quotes, or {} for none
+
+
 
 # >>>>>>>>>>> RELATED SETTINGS <<<<<<<<<<<
 
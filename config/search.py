@@ -90,9 +90,21 @@ about_company_bad_words = ["Crossover", "Staffing", "Recruiting", "Contract Staf
 # Skip checking for `about_company_bad_words` for these companies if they have these good words in their 'About Company' section... [Exceptions, For example, I want to apply to "Robert Half" although it's a staffing company]
 about_company_good_words = []      # (dynamic multiple search) or leave empty as []. Ex: ["Robert Half", "Dice"]
 
-# Avoid applying to these companies if they have these bad words in their 'Job Description' section...  (In development)
+# Avoid applying to these companies if they have these bad words in their 'Job Description' section. Matched as whole words, so "QA" doesn't match "aQAb", but plurals and "-ship" endings do, "US Citizen" matches "US Citizens" and "US Citizenship"...  (In development)
 bad_words = ["US Citizen", "USA Citizen", "No C2C", "No Corp2Corp", ".NET", "Embedded Programming", "PHP", "Ruby", "CNC", "SDET", "QA", "Test Engineer", "Quality Assurance"]                     # (dynamic multiple search) or leave empty as []. Case Insensitive. Ex: ["word_1", "phrase 1", "word word", "polygraph", "US Citizenship", "Security Clearance"]
 
+# Only apply to jobs with at least one of these words or phrases in their title, checked on the search results before opening a job...
+title_include_words = []           # (dynamic multiple search) or leave empty as [] to allow all titles. Case Insensitive. Ex: ["Java", "Backend", "Software Engineer"]
+
+# Avoid applying to jobs with these words or phrases in their title, checked on the search results before opening a job. `bad_words` are checked in titles too...
+title_exclude_words = []           # (dynamic multiple search) or leave empty as []. Case Insensitive. Ex: ["Intern", "Principal", "Manager"]
+
+# Avoid applying to jobs of these companies, checked on the search results before opening a job...
+company_blacklist = []             # (dynamic multiple search) or leave empty as []. Case Insensitive, company name as shown on LinkedIn. Ex: ["Company 1", "Company 2"]
+
+# Skip jobs that were already seen for an earlier search term in this run, without opening them again?
+skip_seen_jobs = True              # True or False, Note: True or False are case-sensitive
+
 # Do you have an active Security Clearance? (True for Yes and False for No)
 security_clearance = False         # True or False, Note: True or False are case-sensitive
 
@@ -101,6 +113,12 @@ did_masters = True                 # True or False, Note: True or False are case
 
 # Avoid applying to jobs if their required experience is above your current_experience. (Set value as -1 if you want to apply to all ignoring their required experience...)
 current_experience = 13            # Integers > -2 (Ex: -1, 0, 1, 2, 3, 4...)
+
+# Avoid applying to jobs whose description mentions too few of your `skills` in `config/resume.py`. Relevance is scored from 0 to 1 without AI, skills your work experience and projects mention more count more. Fill in your own `skills` before turning it on, the template ones would skip most jobs! (Set value as 0 if you want to apply to all ignoring their relevance...)
+job_relevance_threshold = 0        # Numbers between 0 and 1 (Ex: 0, 0.2, 0.5)
+
+# How many of your most important skills a job description must mention to be scored 1 (fully relevant)
+job_relevance_expected_skills = 5  # Only numbers greater than 0... Don't put in quotes
 ##
 
 
@@ -54,6 +54,23 @@ disable_extensions = True  # Better performance
 smooth_scroll = False     # Better performance
 keep_screen_awake = True  # Keep system active during long runs
 
+# Keep Chrome open on this DevTools port when the bot exits and attach to it on the next start, so restarts don't launch Chrome and log in again?
+chrome_debugger_port = 0  # Numbers >= 0 like 9222, 0 to launch a new Chrome every time and close it at exit. Don't put in quotes
+
+# Chrome profile used with `chrome_debugger_port`, keeps you logged in between restarts
+chrome_profile_path = "chrome-profile/"
+
+# Don't load LinkedIn's images, fonts and videos, and trackers, after login? The bot only reads text and clicks buttons, so pages load faster. Page load time and bytes per job are saved in the trace
+block_resources = False   # True or False, Note: True or False are case-sensitive
+
+# URLs not loaded when `block_resources = True`, "*" matches anything. Only LinkedIn's own assets (licdn.com) are listed, so images of external apply pages and CAPTCHAs still load
+blocked_url_patterns = [
+    "*media.licdn.com/dms/image/*", "*.licdn.com/*.png", "*.licdn.com/*.jpg", "*.licdn.com/*.jpeg", "*.licdn.com/*.gif", "*.licdn.com/*.webp", "*.licdn.com/*.ico",
+    "*.licdn.com/*.woff", "*.licdn.com/*.woff2", "*.licdn.com/*.ttf", "*.licdn.com/*.otf",
+    "*dms.licdn.com/playlist/*", "*.licdn.com/*.mp4", "*.licdn.com/*.webm", "*.licdn.com/*.m3u8",
+    "*doubleclick.net*", "*google-analytics.com*", "*googletagmanager.com*", "*px.ads.linkedin.com*", "*snap.licdn.com*", "*connect.facebook.net*", "*bat.bing.com*",
+]
+
 # Close external application tabs
 close_tabs = True
 
@@ -68,6 +85,36 @@ stop_date_cycle_at_24hr = True
 # Click timing (increased for stability on Linux)
 click_gap = 2 if is_linux else 1
 
+# Wait for pages and inputs to be ready (page loaded, network idle, DOM stopped changing) instead of sleeping for fixed seconds?
+adaptive_waits = True               # True or False, Note: True or False are case-sensitive
+
+# Max seconds to wait for a page or input to be ready, the bot continues as it is after that
+max_wait_seconds = 10               # Only numbers greater than 0... Don't put in quotes
+
+# For how many milliseconds should the page be unchanged to be considered ready?
+dom_quiet_ms = 400                  # Numbers >= 0. Don't put in quotes
+
+# How many upcoming jobs to check (bad words, clearance, experience, AI skills) in the background while applying to the current one? Their descriptions come from `bulk_job_details`, so it needs `bulk_job_details = True`
+prefetch_jobs = 5                   # Numbers >= 0, 0 to check every job when it's opened. Don't put in quotes
+
+# How many jobs to check at the same time in the background?
+prefetch_workers = 3                # Only numbers greater than 0... Don't put in quotes
+
+# Fetch description, company, hiring team and date posted of all jobs of a search results page at once from LinkedIn's API in the browser, instead of reading each job's page?
+bulk_job_details = True             # True or False, Note: True or False are case-sensitive
+
+# How many job details to fetch from LinkedIn's API at the same time with `bulk_job_details`? Fewer requests at once are less likely to be rate limited
+job_details_batch_size = 4          # Only numbers greater than 0... Don't put in quotes
+
+# How many Chrome windows should apply at the same time? They share your LinkedIn login and take search terms one by one. (Turn off `pause_before_submit` and `pause_at_failed_question` in config/questions.py when using more than 1)
+browser_sessions = 1                # Only numbers greater than 0... Don't put in quotes
+
+# Max applications to submit until the bot is closed, across all browser sessions (also stops `run_non_stop`)
+max_applications_per_run = 0        # Numbers >= 0, 0 for no limit. Don't put in quotes
+
+# Minutes to rest between runs when `run_non_stop = True`
+run_cooldown_minutes = 10           # Numbers >= 0. Don't put in quotes
+
 # >>>>>>>>>>> Directory Settings <<<<<<<<<<<
 
 # File paths
@@ -75,14 +122,134 @@ file_name = "all excels/all_applied_applications_history.csv"
 failed_file_name = "all excels/all_failed_applications_history.csv"
 logs_folder_path = "logs/"
 
+# Where to remember the chromedriver matched to your Chrome on the first start, so later starts don't look it up, check its version or download it again
+chromedriver_cache_file = "logs/chromedriver.json"
+
+# Which messages to print and save in logs? "DEBUG" also logs big dumps like page sources and AI model lists, which slows the bot down
+log_level = "INFO"                  # "DEBUG", "INFO", "WARNING" or "ERROR"
+
+# Format of log.txt lines, "text" is same as printed on console, "json" is one JSON object per line with time and level
+log_format = "text"                 # "text" or "json"
+
+# Start a new log.txt once it's bigger than these many MB, older logs are renamed to log.txt.1, log.txt.2, ...
+log_max_size_mb = 10                # Numbers >= 0, 0 to never rotate by size. Don't put in quotes
+
+# Start a new log.txt once it's older than these many hours
+log_rotate_hours = 24               # Numbers >= 0, 0 to never rotate by time. Don't put in quotes
+
+# How many old log files to keep?
+log_backup_count = 5                # Numbers >= 0. Don't put in quotes
+
+# How many messages can wait to be saved to log files before the bot waits for the disk?
+log_queue_size = 10000              # Only numbers greater than 0... Don't put in quotes
+
+# Save time spent per job and per phase (filters, job details, description, AI, questions, sleeps, ...) to logs/trace.jsonl or logs/trace.csv? A summary is printed at the end of every run
+trace_format = "json"               # "json", "csv" or "" to not save traces
+
+# Where to store applied and failed jobs history? "sqlite" is indexed and stays fast as history grows, "csv" is the old full file scan
+history_backend = "sqlite"          # "sqlite" or "csv"
+
+# SQLite database for history, used only if history_backend = "sqlite". Existing CSVs are imported when it's first created, or run `python -m modules.history migrate`
+history_db_path = "all excels/applications_history.db"
+
+# How many failed or skipped jobs to collect before writing them to history in one go? (Applied jobs are written right away, all are written when the bot exits)
+history_batch_size = 5              # Only numbers greater than 0... Don't put in quotes
+
+# Keep appending history to `file_name` and `failed_file_name` CSVs even when using "sqlite"? (For Excel and older tools)
+history_export_csv = True           # True or False, Note: True or False are case-sensitive
+
 # Resume paths (Experimental & In Development)
 generated_resume_path = "all resumes/"
 
 # AI settings
 showAiErrorAlerts = False if is_linux or running_in_actions else True
 
+# SQLite database to cache AI results in, so the same question isn't sent to AI again
+ai_cache_db_path = "all excels/ai_cache.db"
+
+# Reuse AI answers for questions that were answered before? (Same question text, type, options and your user information)
+ai_answer_cache = True              # True or False, Note: True or False are case-sensitive
+
+# For how many days is a cached AI answer used? And how many answers to keep? (Least recently used are removed first)
+ai_answer_cache_days = 30           # Numbers >= 0, 0 to never expire. Don't put in quotes
+ai_answer_cache_size = 5000         # Only numbers greater than 0... Don't put in quotes
+
+# Question types whose cached answers are only reused for the same job description, like "Why do you want to work here?"
+ai_answer_cache_job_specific = ["textarea"]     # Any of "text", "textarea", "single_select", "multiple_select"
+
+# Save every new AI answer to this CSV so you can review them? Delete a question's row from the cache by running `python -m modules.ai.cache forget "question"`
+ai_answer_review_file = "all excels/ai_answers_review.csv"     # "" to not save
+
+# Reuse skills extracted by AI from a job description seen before? (Same job under other search terms, reposted jobs, next runs)
+ai_skills_cache = True              # True or False, Note: True or False are case-sensitive
+
+# Max size of extracted skills to keep, least recently used are removed first
+ai_skills_cache_size_mb = 50        # Only numbers greater than 0... Don't put in quotes
+
+# Reuse skills extracted by any AI provider and model? If False, skills are reused only from the same provider and model
+ai_skills_cache_shared = False      # True or False, Note: True or False are case-sensitive
+
+# How many AI requests can run at the same time per AI provider? (Skills of a job are extracted while the bot fills the form)
+ai_max_concurrency = 4              # Only numbers greater than 0... Don't put in quotes
+
+# How many HTTP connections to AI APIs to keep open and reuse?
+ai_max_connections = 10             # Only numbers greater than 0... Don't put in quotes
+
+# How many seconds to wait for an AI response before giving up?
+ai_request_timeout = 60             # Only numbers greater than 0... Don't put in quotes
+
+# Answer questions no rule answers like similar ones in `question_answers` of questions.py or your submitted applications, without AI? ("Java - years" is answered like "How many years of Java experience do you have?")
+semantic_match = True               # True or False, Note: True or False are case-sensitive
+
+# How similar must a question be to one answered before, from 0 to 1?
+semantic_match_threshold = 0.5      # Number between 0 and 1. Don't put in quotes
+
+# What share of their words other than "years", "experience" and such must two similar questions have in common? (0.5 lets "Years of Python programming?" match "Years of Python?", 1 needs all the same words)
+semantic_match_overlap = 0.5        # Number above 0 and up to 1. Don't put in quotes
+
+# Which kinds of questions to answer from similar ones? Long "textarea" answers are often written for one job
+semantic_match_kinds = ["text"]     # Any of "text" and "textarea"
+
+# Ask AI all text questions of an Easy Apply page in one request, instead of one request per question? (Questions it doesn't answer are asked one by one)
+ai_batch_questions = True           # True or False, Note: True or False are case-sensitive
+
+# Send AI a compact job description without EEO statements, benefits and similar boilerplate, cut to the token limits below?
+ai_compact_prompts = True           # True or False, Note: True or False are case-sensitive
+
+# Max tokens of the job description sent with each question, and of the one sent to extract skills (lines about requirements are kept first)
+ai_job_digest_tokens = 600          # Only numbers greater than 0... Don't put in quotes
+ai_skills_description_tokens = 1500 # Only numbers greater than 0... Don't put in quotes
+
+# Max tokens of your information (`user_information_all`) sent with each question
+ai_user_information_tokens = 1000   # Only numbers greater than 0... Don't put in quotes
+
+# Max AI requests and tokens per minute for each AI provider and model, the bot waits instead of going over them
+ai_requests_per_minute = 30         # Numbers >= 0, 0 for no limit. Don't put in quotes
+ai_tokens_per_minute = 100000       # Numbers >= 0, 0 for no limit. Don't put in quotes
+
+# How many times to retry an AI request that was rate limited, timed out or failed on the server? Waits up to 2x longer after each try, starting at these many seconds
+ai_max_retries = 4                  # Numbers >= 0. Don't put in quotes
+ai_retry_base_seconds = 2           # Only numbers greater than 0... Don't put in quotes
+
+# Stop calling an AI provider for these many seconds after these many failed requests in a row
+ai_circuit_breaker_failures = 5     # Numbers >= 0, 0 to never stop. Don't put in quotes
+ai_circuit_breaker_seconds = 120    # Numbers >= 0. Don't put in quotes
+
+# Max AI tokens to use in a run, questions are answered without AI after that
+ai_run_token_budget = 0             # Numbers >= 0, 0 for no limit. Don't put in quotes
+
+# Prices of AI models in USD per million input and output tokens, to show what each run cost. Models not listed are free (local)
+ai_token_prices = {
+    "gpt-4o": [2.5, 10],
+    "gpt-4o-mini": [0.15, 0.6],
+    "deepseek-chat": [0.27, 1.1],
+    "deepseek-reasoner": [0.55, 2.19],
+    "gemini-1.5-flash": [0.075, 0.3],
+    "gemini-1.5-pro": [1.25, 5],
+}
+
 # Create required directories
-for path in [file_name, failed_file_name, logs_folder_path, downloads_path]:
+for path in [file_name, failed_file_name, history_db_path, ai_cache_db_path, logs_folder_path, downloads_path]:
     dir_path = Path(path).parent if '.' in Path(path).name else Path(path)
     dir_path.mkdir(parents=True, exist_ok=True)
     
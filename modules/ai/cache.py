@@ -0,0 +1,342 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+import json
+import sqlite3
+import hashlib
+import inspect
+import atexit
+import argparse
+
+from time import time
+from threading import RLock
+from functools import wraps
+from datetime import datetime
+from typing import Any, Callable
+
+import config.secrets as secrets
+from config.settings import (
+    ai_cache_db_path, ai_answer_cache, ai_answer_cache_days, ai_answer_cache_size,
+    ai_answer_cache_job_specific, ai_answer_review_file,
+    ai_skills_cache, ai_skills_cache_size_mb, ai_skills_cache_shared
+)
+from modules.helpers import print_lg
+from modules.history import append_csv_rows
+from modules.rules import normalize_label
+
+
+
+review_fieldnames = ["Date", "Question", "Type", "Options", "Answer", "Key"]
+'''
+Columns of `ai_answer_review_file`
+'''
+
+
+
+class AICache:
+    '''
+    A table of AI results in a SQLite database, keyed by a hash of everything the result depends on.
+    * Entries older than `ttl_days` are not used and removed (`0` to never expire)
+    * When there are more than `max_entries` or values take more than `max_bytes`, least recently used entries are removed
+    * Counts `hits` and `misses` of the current run
+    '''
+    def __init__(self, table: str, db_path: str = ai_cache_db_path, max_entries: int = 0, ttl_days: float = 0, max_bytes: int = 0) -> None:
+        self.table = table
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_days * 24 * 3600
+        self.hits = 0
+        self.misses = 0
+        self.lock = RLock()
+        self.connection = sqlite3.connect(db_path, timeout=10, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.lock, self.connection:
+            self.connection.execute(f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, value TEXT, label TEXT, created REAL, last_used REAL, uses INTEGER DEFAULT 0)")
+            self.connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_last_used ON {table} (last_used)")
+            self.connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_label ON {table} (label)")
+
+
+    def get(self, key: str) -> Any | None:
+        '''
+        Returns the cached value of `key`, `None` if it's missing or expired
+        '''
+        now = time()
+        with self.lock:
+            row = self.connection.execute(f"SELECT value, created FROM {self.table} WHERE key = ?", (key,)).fetchone()
+            if row and self.ttl_seconds and now - row[1] > self.ttl_seconds:
+                with self.connection:
+                    self.connection.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            with self.connection:
+                self.connection.execute(f"UPDATE {self.table} SET last_used = ?, uses = uses + 1 WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+
+    def put(self, key: str, value: Any, label: str = "") -> None:
+        '''
+        Saves `value` for `key`, `label` is a readable description of the key. Evicts least recently used entries if the cache is full.
+        '''
+        now = time()
+        with self.lock, self.connection:
+            self.connection.execute(f"INSERT OR REPLACE INTO {self.table} (key, value, label, created, last_used) VALUES (?, ?, ?, ?, ?)", (key, json.dumps(value), label, now, now))
+            if self.ttl_seconds:
+                self.connection.execute(f"DELETE FROM {self.table} WHERE created < ?", (now - self.ttl_seconds,))
+            if self.max_entries:
+                self.connection.execute(f"DELETE FROM {self.table} WHERE key IN (SELECT key FROM {self.table} ORDER BY last_used DESC LIMIT -1 OFFSET ?)", (self.max_entries,))
+            if self.max_bytes:
+                self.connection.execute(f"""DELETE FROM {self.table} WHERE key IN (
+                    SELECT key FROM (SELECT key, SUM(LENGTH(value)) OVER (ORDER BY last_used DESC, created DESC) AS total FROM {self.table}) WHERE total > ?
+                )""", (self.max_bytes,))
+
+
+    def forget(self, label: str) -> int:
+        '''
+        Removes all entries with `label`, returns how many were removed
+        '''
+        with self.lock, self.connection:
+            return self.connection.execute(f"DELETE FROM {self.table} WHERE label = ?", (label,)).rowcount
+
+
+    def stats(self) -> str:
+        total = self.hits + self.misses
+        return f"{self.hits} hits, {self.misses} misses" + (f" ({self.hits / total:.0%} hit rate)" if total else "")
+
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+
+
+def fingerprint(*parts: Any) -> str:
+    '''
+    Returns a SHA-256 hex digest of `parts`
+    '''
+    return hashlib.sha256(json.dumps(parts, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()
+
+
+def answer_key(question: str, question_type: str, options: list[str] | None, job_description: str | None, user_information_all: str | None) -> str:
+    '''
+    Returns the cache key of an AI answer. The job description is part of it only for `ai_answer_cache_job_specific` question types.
+    '''
+    job = normalize_label(job_description or "") if question_type in ai_answer_cache_job_specific else ""
+    return fingerprint(normalize_label(question), question_type, sorted(normalize_label(option) for option in options or []),
+                       fingerprint(normalize_label(user_information_all or ""), job))
+
+
+def skills_key(job_description: str, provider: str, model: str) -> str:
+    '''
+    Returns the cache key of skills extracted from `job_description`, same for all providers and models if `ai_skills_cache_shared`
+    '''
+    return fingerprint(normalize_label(job_description), *(() if ai_skills_cache_shared else (provider, model)))
+
+
+def is_valid_answer(answer: Any) -> bool:
+    '''
+    Returns `True` if `answer` is worth caching, providers return empty strings, dicts or "Error: ..." when they fail
+    '''
+    return isinstance(answer, str) and bool(answer.strip()) and not answer.startswith("Error: ")
+
+
+def is_valid_skills(skills: Any) -> bool:
+    '''
+    Returns `True` if extracted `skills` are worth caching, failed extractions return `None` or a dict with "error"
+    '''
+    if isinstance(skills, dict): return bool(skills) and "error" not in skills
+    return isinstance(skills, (list, str)) and bool(skills)
+
+
+
+__caches: dict[str, AICache | None] = {}
+__caches_lock = RLock()
+
+def open_cache(table: str, **limits) -> AICache | None:
+    '''
+    Returns the shared cache for `table`, opens it on first use. `None` if it can't be opened.
+    '''
+    with __caches_lock:
+        if table not in __caches:
+            try:
+                __caches[table] = AICache(table, **limits)
+                atexit.register(__caches[table].close)
+            except Exception as e:
+                print_lg(f'Failed to open AI cache "{ai_cache_db_path}", continuing without caching {table}!', e)
+                __caches[table] = None
+        return __caches[table]
+
+
+def get_answer_cache() -> AICache | None:
+    '''
+    Returns the shared AI answers cache, `None` if `ai_answer_cache` is disabled or it can't be opened
+    '''
+    if not ai_answer_cache: return None
+    return open_cache("answers", max_entries=ai_answer_cache_size, ttl_days=ai_answer_cache_days)
+
+
+def get_skills_cache() -> AICache | None:
+    '''
+    Returns the shared extracted skills cache, `None` if `ai_skills_cache` is disabled or it can't be opened
+    '''
+    if not ai_skills_cache: return None
+    return open_cache("skills", max_bytes=int(ai_skills_cache_size_mb * 1024 * 1024))
+
+
+def find_answer(question: str, question_type: str, options: list[str] | None = None, job_description: str | None = None, user_information_all: str | None = None) -> tuple[AICache | None, str, str | None]:
+    '''
+    Returns `(cache, key, answer)`, `answer` is `None` if the question wasn't answered before. `cache` is `None` if caching is disabled.
+    '''
+    cache = get_answer_cache()
+    if cache is None: return None, "", None
+    key = answer_key(question, question_type, options, job_description, user_information_all)
+    answer = cache.get(key)
+    if answer is not None: print_lg(f'Found answer for question "{question}" in AI answers cache')
+    return cache, key, answer
+
+
+def save_answer(cache: AICache | None, key: str, answer: Any, question: str, question_type: str, options: list[str] | None = None) -> None:
+    '''
+    Saves a new AI `answer` found with `find_answer()` to the cache and `ai_answer_review_file`, if it's valid
+    '''
+    if cache is None or not is_valid_answer(answer): return
+    cache.put(key, answer, normalize_label(question))
+    if ai_answer_review_file:
+        try:
+            append_csv_rows(ai_answer_review_file, review_fieldnames, [{
+                "Date": datetime.now(), "Question": question, "Type": question_type,
+                "Options": "; ".join(options) if options else "", "Answer": answer, "Key": key
+            }])
+        except Exception as e:
+            print_lg(f'Failed to save AI answer to review file "{ai_answer_review_file}"!', e)
+
+
+def cache_answer(function: Callable) -> Callable:
+    '''
+    Decorator for `answer_question()` functions and methods of AI providers, returns a cached answer instead of calling AI when there is one.
+    * Works on both normal functions and coroutines
+    '''
+    signature = inspect.signature(function)
+
+    def lookup(args: tuple, kwargs: dict) -> tuple[AICache | None, str, Any, dict]:
+        arguments = signature.bind(*args, **kwargs)
+        arguments.apply_defaults()
+        arguments = arguments.arguments
+        return *find_answer(arguments["question"], arguments["question_type"], arguments.get("options"), arguments.get("job_description"), arguments.get("user_information_all")), arguments
+
+    def save(cache: AICache | None, key: str, answer: Any, arguments: dict) -> None:
+        save_answer(cache, key, answer, arguments["question"], arguments["question_type"], arguments.get("options"))
+
+    if inspect.iscoroutinefunction(function):
+        @wraps(function)
+        async def async_wrapper(*args, **kwargs):
+            cache, key, answer, arguments = lookup(args, kwargs)
+            if answer is not None: return answer
+            answer = await function(*args, **kwargs)
+            save(cache, key, answer, arguments)
+            return answer
+        return async_wrapper
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        cache, key, answer, arguments = lookup(args, kwargs)
+        if answer is not None: return answer
+        answer = function(*args, **kwargs)
+        save(cache, key, answer, arguments)
+        return answer
+    return wrapper
+
+
+
+def cache_skills(provider: str | None = None, model_setting: str | None = None) -> Callable:
+    '''
+    Decorator for `extract_skills()` functions and methods of AI providers, reuses skills extracted before from the same job description by `provider`.
+    * `model_setting` is the name of the model variable of the provider in `config/secrets.py`, like "llm_model"
+    * Leave both `None` for methods of an `AIProvider`, its `name` and `model` are used
+    * Works on both normal functions and coroutines
+    '''
+    def decorator(function: Callable) -> Callable:
+        signature = inspect.signature(function)
+
+        def lookup(args: tuple, kwargs: dict) -> tuple[AICache | None, str, str, Any]:
+            cache = get_skills_cache()
+            if cache is None: return None, "", "", None
+            arguments = signature.bind(*args, **kwargs).arguments
+            if provider is None:
+                name, model = arguments["self"].name, arguments["self"].model
+            else:
+                name, model = provider, getattr(secrets, model_setting, "")
+            key = skills_key(arguments["job_description"], name, model)
+            skills = cache.get(key)
+            if skills is not None: print_lg("Found skills of this job description in AI skills cache")
+            return cache, key, f"{name}:{model}", skills
+
+        def save(cache: AICache | None, key: str, label: str, skills: Any) -> None:
+            if cache is not None and is_valid_skills(skills): cache.put(key, skills, label)
+
+        if inspect.iscoroutinefunction(function):
+            @wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                cache, key, label, skills = lookup(args, kwargs)
+                if skills is not None: return skills
+                skills = await function(*args, **kwargs)
+                save(cache, key, label, skills)
+                return skills
+            return async_wrapper
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            cache, key, label, skills = lookup(args, kwargs)
+            if skills is not None: return skills
+            skills = function(*args, **kwargs)
+            save(cache, key, label, skills)
+            return skills
+        return wrapper
+    return decorator
+
+
+
+#< Command line
+def main() -> None:
+    '''
+    Command line to remove cached AI answers, so they are asked to AI again.
+    * `python -m modules.ai.cache forget "question"`
+    * `python -m modules.ai.cache clear`
+    '''
+    parser = argparse.ArgumentParser(prog="python -m modules.ai.cache", description="Manage cached AI answers.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    forget = commands.add_parser("forget", help="Remove cached answers of a question")
+    forget.add_argument("question", help="Question text, case and extra spaces don't matter")
+    commands.add_parser("clear", help="Remove all cached answers")
+    args = parser.parse_args()
+
+    cache = AICache("answers")
+    if args.command == "forget":
+        print(f'Removed {cache.forget(normalize_label(args.question))} cached answers for "{args.question}"')
+    else:
+        with cache.lock, cache.connection:
+            print(f"Removed {cache.connection.execute('DELETE FROM answers').rowcount} cached answers")
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
+#>
@@ -0,0 +1,183 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+from functools import lru_cache
+
+from config.settings import ai_compact_prompts, ai_job_digest_tokens, ai_skills_description_tokens, ai_user_information_tokens
+from modules.keywords import KeywordMatcher
+from modules.ai.limits import estimate_tokens
+
+try:
+    import tiktoken
+    __encoding = tiktoken.get_encoding("cl100k_base")
+except Exception:
+    __encoding = None
+
+
+
+legal_phrases = [
+    "equal opportunity", "equal employment opportunity", "affirmative action", "without regard to", "regardless of race",
+    "sexual orientation", "gender identity", "national origin", "protected veteran", "protected characteristic",
+    "reasonable accommodation", "e-verify", "drug-free workplace", "privacy notice", "privacy policy",
+    "pay transparency", "recruitment agencies", "unsolicited resumes",
+]
+'''
+Phrases of EEO and legal statements, lines with them are dropped wherever they are. Case doesn't matter.
+'''
+
+benefit_phrases = [
+    "401(k)", "401k", "paid time off", "pto", "health insurance", "medical insurance", "dental", "vision insurance",
+    "life insurance", "parental leave", "tuition reimbursement", "wellness program", "employee assistance",
+    "commuter benefits", "gym membership", "free snacks", "stock options",
+]
+'''
+Phrases of benefits, lines with them are dropped only in a list of benefits, they are often the job's own domain too
+(like "health insurance claims"). Case doesn't matter.
+'''
+
+min_benefit_lines = 2
+'''
+Lines in a row that mention benefits and not requirements, for them to be taken as a list of benefits without a heading
+'''
+
+boilerplate_headings = [
+    "benefits", "perks", "what we offer", "what's in it for you", "equal opportunity", "eeo", "diversity", "inclusion",
+    "accommodation", "privacy", "disclaimer", "legal", "why join us", "life at",
+]
+'''
+Headings of sections that are dropped whole, up to the next heading ending with ":" or about requirements. Case doesn't matter.
+'''
+
+requirement_phrases = [
+    "require", "qualification", "must", "experience", "years", "degree", "skill", "proficien", "knowledge of",
+    "responsib", "you will", "you'll", "familiar", "expert", "strong", "hands-on", "certif", "clearance", "visa", "sponsor",
+    "location", "remote", "hybrid", "on-site", "onsite", "salary", "compensation", "pay range",
+]
+'''
+Phrases of lines kept first when a description is cut to fit its token budget. Case doesn't matter.
+'''
+
+__legal = KeywordMatcher(legal_phrases)
+__benefits = KeywordMatcher(benefit_phrases, whole_words=True)
+__headings = KeywordMatcher(boilerplate_headings, whole_words=True)
+__requirements = KeywordMatcher(requirement_phrases)
+
+
+
+def count_tokens(text: str) -> int:
+    '''
+    Returns the number of tokens in `text`, exact if `tiktoken` is installed, estimated otherwise
+    '''
+    if __encoding is not None: return len(__encoding.encode(text))
+    return estimate_tokens(text)
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    '''
+    Cuts `text` to at most `max_tokens` tokens
+    '''
+    if count_tokens(text) <= max_tokens: return text
+    if __encoding is not None: return __encoding.decode(__encoding.encode(text)[:max_tokens])
+    return text[:max_tokens * 4]
+
+
+def is_heading(line: str) -> bool:
+    return len(line) <= 60 and len(line.split()) <= 6 and not line.endswith((".", "!", "?", ";", ","))
+
+
+def strip_boilerplate(text: str) -> list[str]:
+    '''
+    Returns the non-empty lines of a job description, without EEO, benefits, privacy and similar sections, EEO and legal lines
+    and lists of benefits
+    '''
+    lines = []
+    in_boilerplate_section = False
+    for line in text.splitlines():
+        line = line.strip()
+        if not line: continue
+        if is_heading(line):
+            if __headings.first_match(line) is not None:
+                in_boilerplate_section = True
+                continue
+            if line.endswith(":") or __requirements.first_match(line) is not None:
+                in_boilerplate_section = False
+        if in_boilerplate_section or __legal.first_match(line) is not None: continue
+        lines.append(line)
+    return strip_benefit_lists(lines)
+
+
+def is_benefit_line(line: str) -> bool:
+    return __benefits.first_match(line) is not None and __requirements.first_match(line) is None
+
+
+def strip_benefit_lists(lines: list[str]) -> list[str]:
+    '''
+    Returns `lines` without lists of benefits that have no heading, `min_benefit_lines` or more benefit lines in a row
+    '''
+    kept, benefits = [], []
+    for line in lines + [None]:
+        if line is not None and is_benefit_line(line):
+            benefits.append(line)
+            continue
+        if len(benefits) < min_benefit_lines: kept.extend(benefits)
+        benefits = []
+        if line is not None: kept.append(line)
+    return kept
+
+
+def compact_description(description: str, max_tokens: int) -> str:
+    '''
+    Returns `description` without boilerplate, in at most `max_tokens` tokens.
+    If it's still too long, lines about requirements are kept first, then the rest in order. Kept lines stay in their original order.
+    '''
+    lines = strip_boilerplate(description)
+    counts = [count_tokens(line) + 1 for line in lines]
+    if sum(counts) <= max_tokens: return "\n".join(lines)
+    order = sorted(range(len(lines)), key=lambda index: (__requirements.first_match(lines[index]) is None, index))
+    kept, used = set(), 0
+    for index in order:
+        if used + counts[index] > max_tokens: continue
+        kept.add(index)
+        used += counts[index]
+    return "\n".join(lines[index] for index in sorted(kept))
+
+
+@lru_cache(maxsize=32)
+def job_digest(job_description: str) -> str:
+    '''
+    Returns the compact job description sent with every question of a job, computed once per job
+    '''
+    if not ai_compact_prompts: return job_description
+    return compact_description(job_description, ai_job_digest_tokens)
+
+
+@lru_cache(maxsize=32)
+def skills_description(job_description: str) -> str:
+    '''
+    Returns the job description sent to extract skills from, without boilerplate and in at most `ai_skills_description_tokens`
+    '''
+    if not ai_compact_prompts: return job_description
+    return compact_description(job_description, ai_skills_description_tokens)
+
+
+@lru_cache(maxsize=4)
+def user_information(user_information_all: str) -> str:
+    '''
+    Returns your information cut to `ai_user_information_tokens`
+    '''
+    if not ai_compact_prompts: return user_information_all
+    return truncate_tokens(user_information_all, ai_user_information_tokens)
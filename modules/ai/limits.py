@@ -0,0 +1,270 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+import asyncio
+
+from time import monotonic
+from random import uniform
+from threading import RLock
+
+from config.settings import (
+    ai_requests_per_minute, ai_tokens_per_minute, ai_max_retries, ai_retry_base_seconds,
+    ai_circuit_breaker_failures, ai_circuit_breaker_seconds, ai_run_token_budget, ai_token_prices
+)
+from modules.helpers import print_lg
+
+
+
+class CircuitOpenError(RuntimeError):
+    '''
+    Raised instead of calling an AI endpoint that failed too many times in a row, until it cools down
+    '''
+
+
+class BudgetExceededError(RuntimeError):
+    '''
+    Raised instead of calling AI once `ai_run_token_budget` tokens were used in this run
+    '''
+
+
+
+class TokenBucket:
+    '''
+    Allows `per_minute` units a minute, refilled continuously. `0` is unlimited.
+    * `acquire()` waits until there are enough units
+    * `charge()` takes units without waiting, the bucket can go below zero so later requests wait for it
+    '''
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = per_minute
+        self.rate = per_minute / 60
+        self.tokens = float(per_minute)
+        self.updated = monotonic()
+        self.lock = asyncio.Lock()
+
+
+    def refill(self) -> None:
+        now = monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+    async def acquire(self, amount: float = 1) -> float:
+        '''
+        Takes `amount` units, waiting for them if needed. Returns seconds waited.
+        '''
+        if not self.capacity: return 0
+        amount = min(amount, self.capacity)
+        waited = 0
+        async with self.lock:
+            self.refill()
+            while self.tokens < amount:
+                delay = (amount - self.tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self.refill()
+            self.tokens -= amount
+        return waited
+
+
+    def charge(self, amount: float) -> None:
+        if not self.capacity: return
+        self.refill()
+        self.tokens -= amount
+
+
+
+class CircuitBreaker:
+    '''
+    Stops calling an endpoint for `cooldown` seconds after `threshold` failures in a row, then lets one request try it again.
+    `threshold = 0` never opens.
+    '''
+    def __init__(self, threshold: int, cooldown: float) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.trying = False
+
+
+    def check(self, name: str) -> None:
+        '''
+        Raises `CircuitOpenError` if requests to `name` shouldn't be made now
+        '''
+        if self.opened_at is None: return
+        remaining = self.opened_at + self.cooldown - monotonic()
+        if remaining > 0 or self.trying:
+            raise CircuitOpenError(f"{name} failed {self.failures} times in a row, not calling it for {max(remaining, 0):.0f} more seconds")
+        self.trying = True
+
+
+    def success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self.trying = False
+
+
+    def failure(self) -> None:
+        self.failures += 1
+        self.trying = False
+        if self.threshold and self.failures >= self.threshold:
+            self.opened_at = monotonic()
+
+
+    def release(self) -> None:
+        '''
+        Lets another request try the endpoint, if the one trying it ended without a success or failure
+        '''
+        self.trying = False
+
+
+
+class Usage:
+    '''
+    Requests, tokens and cost of one provider and model in this run
+    '''
+    def __init__(self) -> None:
+        self.requests = 0
+        self.failures = 0
+        self.retries = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cost = 0.0
+        self.throttled_seconds = 0.0
+
+
+    def __repr__(self) -> str:
+        return (f"{self.requests} requests, {self.failures} failed, {self.retries} retries, "
+                f"{self.prompt_tokens} + {self.completion_tokens} tokens, ${self.cost:.4f}, throttled {self.throttled_seconds:.1f}s")
+
+
+
+class RateLimiter:
+    '''
+    Rate limits, retries and circuit breaker of one AI provider and model.
+    '''
+    def __init__(self, name: str, model: str) -> None:
+        self.name = name
+        self.model = model
+        self.requests = TokenBucket(ai_requests_per_minute)
+        self.tokens = TokenBucket(ai_tokens_per_minute)
+        self.breaker = CircuitBreaker(ai_circuit_breaker_failures, ai_circuit_breaker_seconds)
+        self.usage = Usage()
+
+
+    async def call(self, request, prompt_tokens: int):
+        '''
+        Awaits `request()` within the rate limits, retrying rate limited, timed out and server errors with exponential backoff and jitter.
+        * `request()` returns `(result, usage)`, `usage` has "prompt_tokens" and "completion_tokens" if the API reported them
+        * `prompt_tokens` is an estimate used until the API reports the real count
+        '''
+        check_budget()
+        self.breaker.check(f"{self.name} ({self.model})")
+        try:
+            self.usage.throttled_seconds += await self.requests.acquire(1)
+            self.usage.throttled_seconds += await self.tokens.acquire(prompt_tokens)
+            for attempt in range(ai_max_retries + 1):
+                try:
+                    self.usage.requests += 1
+                    result, usage = await request()
+                    break
+                except Exception as e:
+                    self.usage.failures += 1
+                    retry_after = retry_delay(e)
+                    if retry_after is None or attempt == ai_max_retries:
+                        self.breaker.failure()
+                        raise
+                    delay = max(retry_after, uniform(0, ai_retry_base_seconds * 2 ** attempt))
+                    print_lg(f"{self.name} request failed ({e.__class__.__name__}), retrying in {delay:.1f} seconds...")
+                    self.usage.retries += 1
+                    self.usage.throttled_seconds += delay
+                    await asyncio.sleep(delay)
+        except BaseException:
+            # Cancelled, like by a timeout, before it succeeded or failed
+            self.breaker.release()
+            raise
+        self.breaker.success()
+        used_prompt = (usage or {}).get("prompt_tokens") or prompt_tokens
+        used_completion = (usage or {}).get("completion_tokens") or estimate_tokens(result if isinstance(result, str) else str(result))
+        self.tokens.charge(used_prompt - prompt_tokens + used_completion)
+        record_usage(self, used_prompt, used_completion)
+        return result
+
+
+
+def estimate_tokens(text: str) -> int:
+    '''
+    Rough token count of `text`, about 4 characters a token for English
+    '''
+    return len(text) // 4 + 1
+
+
+def retry_delay(error: Exception) -> float | None:
+    '''
+    Returns seconds the API asked to wait before retrying (`0` if it didn't say), `None` if `error` isn't worth retrying
+    '''
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if not isinstance(status, int):
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    name = error.__class__.__name__
+    retryable = status in (408, 409, 429) or (isinstance(status, int) and status >= 500) or isinstance(error, asyncio.TimeoutError) \
+        or any(word in name for word in ("Timeout", "Connection", "RateLimit", "ResourceExhausted", "ServiceUnavailable", "InternalServerError"))
+    if not retryable: return None
+    try:
+        return float(error.response.headers.get("retry-after", 0))
+    except Exception:
+        return 0
+
+
+
+__lock = RLock()
+__limiters: dict[tuple[str, str], RateLimiter] = {}
+__used_tokens = 0
+
+def get_limiter(name: str, model: str) -> RateLimiter:
+    '''
+    Returns the shared rate limiter of provider `name` and `model`
+    '''
+    with __lock:
+        if (name, model) not in __limiters:
+            __limiters[(name, model)] = RateLimiter(name, model)
+        return __limiters[(name, model)]
+
+
+def check_budget() -> None:
+    if ai_run_token_budget and __used_tokens >= ai_run_token_budget:
+        raise BudgetExceededError(f"Used {__used_tokens} AI tokens, the budget of this run is {ai_run_token_budget} (ai_run_token_budget)")
+
+
+def record_usage(limiter: RateLimiter, prompt_tokens: int, completion_tokens: int) -> None:
+    global __used_tokens
+    with __lock:
+        limiter.usage.prompt_tokens += prompt_tokens
+        limiter.usage.completion_tokens += completion_tokens
+        input_price, output_price = ai_token_prices.get(limiter.model, (0, 0))
+        limiter.usage.cost += (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+        __used_tokens += prompt_tokens + completion_tokens
+
+
+def usage_summary() -> str:
+    '''
+    Returns AI requests, tokens and cost of this run per provider and model
+    '''
+    with __lock:
+        if not __limiters: return "No AI requests"
+        lines = [f"{name} ({model}): {limiter.usage}" for (name, model), limiter in __limiters.items()]
+        total = sum(limiter.usage.cost for limiter in __limiters.values())
+        return "\n".join(lines + [f"Total: {__used_tokens} tokens, ${total:.4f}"])
@@ -13,310 +13,84 @@ version:    24.12.29.12.30
 '''
 
 
-from config.secrets import *
-from config.settings import showAiErrorAlerts
-from config.personals import ethnicity, gender, disability_status, veteran_status
-from config.questions import *
-from config.search import security_clearance, did_masters
+# OpenAI used to have its own client here, the bot now uses the "openai" provider of `modules/ai/providers.py`.
+# These functions are kept for scripts written against the old client, they only call the provider.
+# Note: `ai_create_openai_client()` now returns an `AIProvider` instead of the old `openai.OpenAI` client, it only works with these functions.
 
-from modules.helpers import print_lg, critical_error_log, convert_to_json
-from modules.ai.prompts import *
+import warnings
 
-from pyautogui import confirm
-from openai import OpenAI
-from openai.types.model import Model
-from openai.types.chat import ChatCompletion, ChatCompletionChunk
-from typing import Iterator, Literal
+from typing import Literal
 
+from config.secrets import stream_output
+from config.search import job_relevance_threshold
+from modules.ai.providers import AIProvider, get_provider, run_ai_task
+from modules.relevance import get_relevance_scorer
 
-apiCheckInstructions = """
 
-1. Make sure your AI API connection details like url, key, model names, etc are correct.
-2. If you're using an local LLM, please check if the server is running.
-3. Check if appropriate LLM and Embedding models are loaded and running.
-
-Open `secret.py` in `/config` folder to configure your AI API connections.
-
-ERROR:
-"""
-
-# Function to show an AI error alert
-def ai_error_alert(message: str, stackTrace: str, title: str = "AI Connection Error") -> None:
-    """
-    Function to show an AI error alert and log it.
-    """
-    global showAiErrorAlerts
-    if showAiErrorAlerts:
-        if "Pause AI error alerts" == confirm(f"{message}{stackTrace}\n", title, ["Pause AI error alerts", "Okay Continue"]):
-            showAiErrorAlerts = False
-    critical_error_log(message, stackTrace)
-
-
-# Function to check if an error occurred
-def ai_check_error(response: ChatCompletion | ChatCompletionChunk) -> None:
-    """
-    Function to check if an error occurred.
-    * Takes in `response` of type `ChatCompletion` or `ChatCompletionChunk`
-    * Raises a `ValueError` if an error is found
-    """
-    if response.model_extra.get("error"):
-        raise ValueError(
-            f'Error occurred with API: "{response.model_extra.get("error")}"'
-        )
-
-
-# Function to create an OpenAI client
-def ai_create_openai_client() -> OpenAI:
-    """
-    Function to create an OpenAI client.
-    * Takes no arguments
-    * Returns an `OpenAI` object
-    """
-    try:
-        print_lg("Creating OpenAI client...")
-        if not use_AI:
-            raise ValueError("AI is not enabled! Please enable it by setting `use_AI = True` in `secrets.py` in `config` folder.")
-        
-        if ai_provider.lower() != "openai":
-            print_lg(f"OpenAI is not the configured AI provider. Current provider: {ai_provider}")
-            return None
-            
-        client = OpenAI(base_url=llm_api_url, api_key=llm_api_key)
-
-        models = ai_get_models_list(client)
-        if "error" in models:
-            raise ValueError(models[1])
-        if len(models) == 0:
-            raise ValueError("No models are available!")
-        if llm_model not in [model.id for model in models]:
-            raise ValueError(f"Model `{llm_model}` is not found!")
-        
-        print_lg("---- SUCCESSFULLY CREATED OPENAI CLIENT! ----")
-        print_lg(f"Using API URL: {llm_api_url}")
-        print_lg(f"Using Model: {llm_model}")
-        print_lg("Check './config/secrets.py' for more details.\n")
-        print_lg("---------------------------------------------")
-
-        return client
-    except Exception as e:
-        ai_error_alert(f"Error occurred while creating OpenAI client. {apiCheckInstructions}", e)
-
-
-# Function to close an OpenAI client
-def ai_close_openai_client(client: OpenAI) -> None:
-    """
-    Function to close an OpenAI client.
-    * Takes in `client` of type `OpenAI`
-    * Returns no value
-    """
-    try:
-        if client:
-            print_lg("Closing OpenAI client...")
-            client.close()
-    except Exception as e:
-        ai_error_alert("Error occurred while closing OpenAI client.", e)
 
+def ai_create_openai_client() -> AIProvider | None:
+    '''
+    Returns the shared OpenAI provider, `None` if it can't be created.
+    * Returns an `AIProvider`, not the `openai.OpenAI` client it used to return
+    '''
+    return get_provider("openai")
 
 
-# Function to get list of models available in OpenAI API
-def ai_get_models_list(client: OpenAI) -> list[ Model | str]:
-    """
-    Function to get list of models available in OpenAI API.
-    * Takes in `client` of type `OpenAI`
-    * Returns a `list` object
-    """
-    try:
-        print_lg("Getting AI models list...")
-        if not client: raise ValueError("Client is not available!")
-        models = client.models.list()
-        ai_check_error(models)
-        print_lg("Available models:")
-        print_lg(models.data, pretty=True)
-        return models.data
-    except Exception as e:
-        critical_error_log("Error occurred while getting models list!", e)
-        return ["error", e]
+def ai_close_openai_client(client: AIProvider | None) -> None:
+    '''
+    Does nothing, providers are shared and closed by `close_providers()` when the bot exits
+    '''
 
-def model_supports_temperature(model_name: str) -> bool:
-    """
-    Checks if the specified model supports the temperature parameter.
-    
-    Args:
-        model_name (str): The name of the AI model.
-    
-    Returns:
-        bool: True if the model supports temperature adjustments, otherwise False.
-    """
-    return model_name in ["gpt-3.5-turbo", "gpt-4", "gpt-4-turbo", "gpt-4o", "gpt-4o-mini"]
 
-# Function to get chat completion from OpenAI API
-def ai_completion(client: OpenAI, messages: list[dict], response_format: dict = None, temperature: float = 0, stream: bool = stream_output) -> dict | ValueError:
-    """
-    Function that completes a chat and prints and formats the results of the OpenAI API calls.
-    * Takes in `client` of type `OpenAI`
-    * Takes in `messages` of type `list[dict]`. Example: `[{"role": "user", "content": "Hello"}]`
-    * Takes in `response_format` of type `dict` for JSON representation, default is `None`
-    * Takes in `temperature` of type `float` for temperature, default is `0`
-    * Takes in `stream` of type `bool` to indicate if it's a streaming call or not
-    * Returns a `dict` object representing JSON response, will try to convert to JSON if `response_format` is given
-    """
+def ai_completion(client: AIProvider, messages: list[dict], response_format: dict = None, temperature: float = 0, stream: bool = stream_output) -> str | dict:
+    '''
+    Completes a chat with `client`, returns a `dict` if `response_format` is given
+    '''
     if not client: raise ValueError("Client is not available!")
+    return run_ai_task(client.complete(messages, response_format, temperature, stream))
 
-    params = {"model": llm_model, "messages": messages, "stream": stream}
-
-    if model_supports_temperature(llm_model):
-        params["temperature"] = temperature
-    if response_format and llm_spec in ["openai", "openai-like"]:
-        params["response_format"] = response_format
-
-    completion = client.chat.completions.create(params)
 
-    result = ""
-    
-    # Log response
-    if stream:
-        print_lg("--STREAMING STARTED")
-        for chunk in completion:
-            ai_check_error(chunk)
-            chunkMessage = chunk.choices[0].delta.content
-            if chunkMessage != None:
-                result += chunkMessage
-            print_lg(chunkMessage, end="", flush=True)
-        print_lg("\n--STREAMING COMPLETE")
-    else:
-        ai_check_error(completion)
-        result = completion.choices[0].message.content
-    
-    if response_format:
-        result = convert_to_json(result)
-    
-    print_lg("\nAI Answer to Question:\n")
-    print_lg(result, pretty=response_format)
-    return result
-
-
-def ai_extract_skills(client: OpenAI, job_description: str, stream: bool = stream_output) -> dict | ValueError:
-    """
-    Function to extract skills from job description using OpenAI API.
-    * Takes in `client` of type `OpenAI`
-    * Takes in `job_description` of type `str`
-    * Takes in `stream` of type `bool` to indicate if it's a streaming call
-    * Returns a `dict` object representing JSON response
-    """
-    print_lg("-- EXTRACTING SKILLS FROM JOB DESCRIPTION")
-    try:        
-        prompt = extract_skills_prompt.format(job_description)
-
-        messages = [{"role": "user", "content": prompt}]
-        ##> ------ Dheeraj Deshwal : dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Bug fix ------
-        return ai_completion(client, messages, response_format=extract_skills_response_format, stream=stream)
-    ##<
-    except Exception as e:
-        ai_error_alert(f"Error occurred while extracting skills from job description. {apiCheckInstructions}", e)
+def ai_extract_skills(client: AIProvider, job_description: str, stream: bool = stream_output) -> dict:
+    '''
+    Returns skills required by `job_description`, see `AIProvider.extract_skills()`
+    '''
+    if not client: raise ValueError("Client is not available!")
+    return run_ai_task(client.extract_skills(job_description, stream))
 
 
-##> ------ Dheeraj Deshwal : dheeraj9811 Email:dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Feature ------
 def ai_answer_question(
-    client: OpenAI, 
-    question: str, options: list[str] | None = None, question_type: Literal['text', 'textarea', 'single_select', 'multiple_select'] = 'text', 
+    client: AIProvider,
+    question: str, options: list[str] | None = None, question_type: Literal['text', 'textarea', 'single_select', 'multiple_select'] = 'text',
     job_description: str = None, about_company: str = None, user_information_all: str = None,
     stream: bool = stream_output
-) -> dict | ValueError:
-    """
-    Function to generate AI-based answers for questions in a form.
-    
-    Parameters:
-    - `client`: OpenAI client instance.
-    - `question`: The question being answered.
-    - `options`: List of options (for `single_select` or `multiple_select` questions).
-    - `question_type`: Type of question (text, textarea, single_select, multiple_select) It is restricted to one of four possible values.
-    - `job_description`: Optional job description for context.
-    - `about_company`: Optional company details for context.
-    - `user_information_all`: information about you, AI cna use to answer question eg: Resume-like user information.
-    - `stream`: Whether to use streaming AI completion.
-    
-    Returns:
-    - `str`: The AI-generated answer.
-    """
-
-    print_lg("-- ANSWERING QUESTION using AI")
-    try:
-        prompt = ai_answer_prompt.format(user_information_all or "N/A", question)
-         # Append optional details if provided
-        if job_description and job_description != "Unknown":
-            prompt += f"\nJob Description:\n{job_description}"
-        if about_company and about_company != "Unknown":
-            prompt += f"\nAbout the Company:\n{about_company}"
-
-        messages = [{"role": "user", "content": prompt}]
-        print_lg("Prompt we are passing to AI: ", prompt)
-        response =  ai_completion(client, messages, stream=stream)
-        # print_lg("Response from AI: ", response)
-        return response
-    except Exception as e:
-        ai_error_alert(f"Error occurred while answering question. {apiCheckInstructions}", e)
-##<
-
-
-def ai_gen_experience(
-    client: OpenAI, 
-    job_description: str, about_company: str, 
-    required_skills: dict, user_experience: dict,
-    stream: bool = stream_output
-) -> dict | ValueError:
-    pass
-
-
-
-def ai_generate_resume(
-    client: OpenAI, 
-    job_description: str, about_company: str, required_skills: dict,
-    stream: bool = stream_output
-) -> dict | ValueError:
+) -> str:
     '''
-    Function to generate resume. Takes in user experience and template info from config.
+    Returns an answer to a form `question`, see `AIProvider.answer_question()`
     '''
-    pass
-
+    if not client: raise ValueError("Client is not available!")
+    return run_ai_task(client.answer_question(question, options, question_type, job_description, about_company, user_information_all, stream))
 
 
-def ai_generate_coverletter(
-    client: OpenAI, 
-    job_description: str, about_company: str, required_skills: dict,
-    stream: bool = stream_output
-) -> dict | ValueError:
+def ai_check_job_relevance(
+    client: AIProvider,
+    job_description: str | list[str], about_company: str,
+    stream: bool | None = None
+) -> dict | list[dict]:
     '''
-    Function to generate resume. Takes in user experience and template info from config.
+    Function to check how relevant a job is to your resume skills. Scored locally, `client` isn't called.
+    * Takes a `job_description` or a list of them, like a page of prefetched descriptions, scored together
+    * Returns `{"score", "relevant", "matched_skills", "missing_skills", "reasons"}` for each
+    * `stream` is deprecated and ignored, there is no AI response to stream
     '''
-    pass
+    if stream is not None:
+        warnings.warn("ai_check_job_relevance() no longer calls AI, its stream argument is ignored", DeprecationWarning, stacklevel=2)
+    descriptions = [job_description] if isinstance(job_description, str) else job_description
+    results = [{
+        "score": relevance.score,
+        "relevant": relevance.score >= job_relevance_threshold,
+        "matched_skills": relevance.matched,
+        "missing_skills": relevance.missing,
+        "reasons": relevance.reasons,
+    } for relevance in get_relevance_scorer().score_batch(descriptions)]
+    return results[0] if isinstance(job_description, str) else results
 
-
-
-##< Evaluation Agents
-def ai_evaluate_resume(
-    client: OpenAI, 
-    job_description: str, about_company: str, required_skills: dict,
-    resume: str,
-    stream: bool = stream_output
-) -> dict | ValueError:
-    pass
-
-
-
-def ai_evaluate_resume(
-    client: OpenAI, 
-    job_description: str, about_company: str, required_skills: dict,
-    resume: str,
-    stream: bool = stream_output
-) -> dict | ValueError:
-    pass
-
-
-
-def ai_check_job_relevance(
-    client: OpenAI, 
-    job_description: str, about_company: str,
-    stream: bool = stream_output
-) -> dict:
-    pass
-#>
\ No newline at end of file
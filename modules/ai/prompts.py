@@ -126,4 +126,66 @@ Respond concisely based on the type of question:
 **QUESTION Strat from here:**  
 {}
 """
-#<
\ No newline at end of file
+#<
+
+##> Answer Questions in a batch
+# Structure of messages = `[{"role": "user", "content": ai_answer_questions_prompt}]`
+
+ai_answer_questions_prompt = """
+You are an intelligent AI assistant filling out a job application form and answer like human.
+Answer EVERY question in the list below, each one concisely based on its type:
+
+1. If the question asks for **years of experience, duration, or numeric value**, answer **only a number** (e.g., "2", "5", "10").
+2. If the question is **a Yes/No question**, answer **only "Yes" or "No"**.
+3. If the question has OPTIONS, answer with exactly one of the options as written.
+4. If the question is of type "text", give a **single-sentence answer**.
+5. If the question is of type "textarea", provide a **well-structured and human-like answer and keep no of character <350**.
+6. Do **not** repeat the question in your answer.
+7. here is user information to answer the questions if needed:
+**User Information:**
+{}
+
+Return ONLY a valid JSON object with no additional commentary, with one entry per question id:
+{{
+    "answers": [{{"id": 1, "answer": "..."}}]
+}}
+
+**QUESTIONS (JSON list):**
+{}
+"""
+"""
+Use `ai_answer_questions_prompt.format(user_information_all, questions_json)` to insert your information and the questions,
+`questions_json` is a JSON list of `{"id": 1, "question": "...", "type": "text", "options": [...]}`
+"""
+
+
+answer_questions_response_format = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "Answer_Questions_Response",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "answers": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "answer": {"type": "string"},
+                        },
+                        "required": ["id", "answer"],
+                        "additionalProperties": False
+                    }
+                },
+            },
+            "required": ["answers"],
+            "additionalProperties": False
+        },
+    },
+}
+"""
+Response schema for `answer_questions` function
+"""
+#<
@@ -0,0 +1,475 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+import json
+import asyncio
+import atexit
+
+from threading import Thread, RLock
+from concurrent.futures import Future
+from typing import Any, AsyncIterator, Coroutine, Literal
+
+import config.secrets as secrets
+from config.settings import ai_max_concurrency, ai_max_connections, ai_request_timeout
+from modules.helpers import print_lg, critical_error_log, convert_to_json
+from modules.ai.prompts import (
+    ai_answer_prompt, ai_answer_questions_prompt, answer_questions_response_format,
+    extract_skills_prompt, deepseek_extract_skills_prompt, extract_skills_response_format
+)
+from modules.ai.cache import cache_answer, cache_skills, find_answer, save_answer, is_valid_answer
+from modules.ai.limits import get_limiter, estimate_tokens
+from modules.ai.context import job_digest, skills_description, user_information
+
+
+
+class AIProvider:
+    '''
+    An AI backend. Backends implement `_complete()` and `_stream()`, everything else is built on them.
+    * All methods are coroutines, run them on the shared AI event loop with `submit_ai_task()` or `run_ai_task()`
+    * At most `ai_max_concurrency` requests of a provider run at once, others wait for a free slot
+    * Requests go through the provider and model's `RateLimiter`, see `modules/ai/limits.py`
+    * Errors are raised, callers decide what to fall back to
+    '''
+    name = ""
+    skills_prompt = extract_skills_prompt
+    skills_response_format: dict = extract_skills_response_format
+    questions_response_format: dict = answer_questions_response_format
+    in_flight = 0
+    '''
+    Requests of all providers running on the AI event loop. Streamed chunks are logged only while one runs, or they'd interleave.
+    '''
+
+    def __init__(self, model: str) -> None:
+        self.model = model
+        self.semaphore = asyncio.Semaphore(ai_max_concurrency)
+        self.limiter = get_limiter(self.name, model)
+
+
+    async def _complete(self, messages: list[dict], response_format: dict | None, temperature: float) -> tuple[str, dict]:
+        '''
+        Returns the response and its usage, a `dict` with "prompt_tokens" and "completion_tokens" if the API reported them
+        '''
+        raise NotImplementedError
+
+
+    async def _stream(self, messages: list[dict], response_format: dict | None, temperature: float) -> AsyncIterator[str]:
+        '''
+        Yields the response in chunks as they arrive, backends that can't stream yield it whole
+        '''
+        yield (await self._complete(messages, response_format, temperature))[0]
+
+
+    async def complete(self, messages: list[dict], response_format: dict | None = None, temperature: float = 0, stream: bool = secrets.stream_output) -> str | dict:
+        '''
+        Completes a chat. Example `messages` = `[{"role": "user", "content": "Hello"}]`
+        * Returns a `dict` if `response_format` is given, `{"error": ..., "data": ...}` if the response isn't valid JSON
+        '''
+        async def request() -> tuple[str, dict]:
+            if not stream: return await self._complete(messages, response_format, temperature)
+            # Once another request starts, chunks are only collected, the whole response is logged below
+            log_chunks = AIProvider.in_flight == 1
+            if log_chunks: print_lg("--STREAMING STARTED")
+            chunks = []
+            async for chunk in self._stream(messages, response_format, temperature):
+                chunks.append(chunk)
+                if log_chunks and AIProvider.in_flight > 1:
+                    log_chunks = False
+                    print_lg("\n--STREAMING HIDDEN, another AI request started")
+                if log_chunks: print_lg(chunk, end="", flush=True)
+            if log_chunks: print_lg("\n--STREAMING COMPLETE")
+            return "".join(chunks), {}
+
+        async with self.semaphore:
+            print_lg(f"Calling {self.name} API with model {self.model}...")
+            AIProvider.in_flight += 1
+            try:
+                result = await self.limiter.call(request, estimate_tokens("".join(message["content"] for message in messages)))
+            finally:
+                AIProvider.in_flight -= 1
+        if response_format:
+            result = convert_to_json(result)
+        print_lg(f"\n{self.name} AI response:\n")
+        print_lg(result, pretty=bool(response_format))
+        return result
+
+
+    @cache_skills()
+    async def extract_skills(self, job_description: str, stream: bool = secrets.stream_output) -> dict:
+        '''
+        Returns skills required by `job_description`, see `extract_skills_response_format` in `modules/ai/prompts.py`
+        '''
+        print_lg("-- EXTRACTING SKILLS FROM JOB DESCRIPTION")
+        messages = [{"role": "user", "content": self.skills_prompt.format(skills_description(job_description))}]
+        return await self.complete(messages, response_format=self.skills_response_format, stream=stream)
+
+
+    @cache_answer
+    async def answer_question(
+        self,
+        question: str, options: list[str] | None = None, question_type: Literal['text', 'textarea', 'single_select', 'multiple_select'] = 'text',
+        job_description: str | None = None, about_company: str | None = None, user_information_all: str | None = None,
+        stream: bool = secrets.stream_output
+    ) -> str:
+        '''
+        Returns an answer to a form `question`, using `user_information_all`, `job_description` and `about_company` as context if given
+        '''
+        print_lg("-- ANSWERING QUESTION using AI")
+        prompt = answer_prompt(question, options, question_type, job_description, about_company, user_information_all)
+        answer = await self.complete([{"role": "user", "content": prompt}], stream=stream)
+        return answer.strip()
+
+
+    async def answer_questions(
+        self,
+        questions: list[tuple[str, str, list[str] | None]],
+        job_description: str | None = None, about_company: str | None = None, user_information_all: str | None = None
+    ) -> list[str | None]:
+        '''
+        Answers all `questions` of a form page in one request, each question is `(question, question_type, options)`.
+        * Returns the answers in the order of `questions`, `None` for questions that couldn't be answered
+        * Cached answers are reused, questions missing from the response are asked one by one
+        '''
+        found = [find_answer(question, question_type, options, job_description, user_information_all) for question, question_type, options in questions]
+        answers = [answer for _, _, answer in found]
+        pending = [index for index, answer in enumerate(answers) if answer is None]
+        if len(pending) > 1:
+            print_lg(f"-- ANSWERING {len(pending)} QUESTIONS using AI in one request")
+            prompt = answers_prompt([questions[index] for index in pending], job_description, about_company, user_information_all)
+            try:
+                response = await self.complete([{"role": "user", "content": prompt}], response_format=self.questions_response_format)
+                for item in response.get("answers", []) if isinstance(response, dict) else []:
+                    try: index = pending[int(item["id"]) - 1]
+                    except (KeyError, TypeError, ValueError, IndexError): continue
+                    answer = str(item.get("answer", "")).strip()
+                    if not is_valid_answer(answer): continue
+                    answers[index] = answer
+                    cache, key, _ = found[index]
+                    question, question_type, options = questions[index]
+                    save_answer(cache, key, answer, question, question_type, options)
+            except Exception as e:
+                print_lg("Failed to answer questions in one request, asking them one by one.", e)
+
+        missing = [index for index in pending if answers[index] is None]
+        answer_question = self.answer_question.__wrapped__
+        results = await asyncio.gather(*(
+            answer_question(self, questions[index][0], questions[index][2], questions[index][1], job_description, about_company, user_information_all)
+            for index in missing
+        ), return_exceptions=True)
+        for index, result in zip(missing, results):
+            if isinstance(result, Exception):
+                print_lg(f'Failed to get AI answer for "{questions[index][0]}"!', result)
+                continue
+            answers[index] = result
+            cache, key, _ = found[index]
+            question, question_type, options = questions[index]
+            save_answer(cache, key, result, question, question_type, options)
+        return answers
+
+
+    async def aclose(self) -> None:
+        pass
+
+
+
+class OpenAIProvider(AIProvider):
+    '''
+    OpenAI and OpenAI-like APIs (LM Studio, llama.cpp, Jan, ...). All OpenAI-like providers share one pool of HTTP connections.
+    '''
+    name = "openai"
+    temperature_models = ["gpt-3.5-turbo", "gpt-4", "gpt-4-turbo", "gpt-4o", "gpt-4o-mini"]
+
+    def __init__(self, model: str = secrets.llm_model, api_url: str = secrets.llm_api_url, api_key: str = secrets.llm_api_key) -> None:
+        from openai import AsyncOpenAI
+        super().__init__(model)
+        self.supports_response_format = secrets.llm_spec in ["openai", "openai-like"]
+        self.client = AsyncOpenAI(base_url=api_url.rstrip("/"), api_key=api_key, http_client=get_http_client(), timeout=ai_request_timeout, max_retries=0)
+        print_lg(f"Using {self.name} API URL: {api_url}")
+
+
+    def params(self, messages: list[dict], response_format: dict | None, temperature: float) -> dict:
+        params = {"model": self.model, "messages": messages}
+        if self.model in self.temperature_models:
+            params["temperature"] = temperature
+        if response_format and self.supports_response_format:
+            params["response_format"] = response_format
+        return params
+
+
+    async def _complete(self, messages: list[dict], response_format: dict | None, temperature: float) -> tuple[str, dict]:
+        completion = await self.client.chat.completions.create(**self.params(messages, response_format, temperature))
+        check_error(completion)
+        usage = {"prompt_tokens": completion.usage.prompt_tokens, "completion_tokens": completion.usage.completion_tokens} if completion.usage else {}
+        return completion.choices[0].message.content or "", usage
+
+
+    async def _stream(self, messages: list[dict], response_format: dict | None, temperature: float) -> AsyncIterator[str]:
+        async for chunk in await self.client.chat.completions.create(**self.params(messages, response_format, temperature), stream=True):
+            check_error(chunk)
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+
+    async def aclose(self) -> None:
+        # The HTTP connections are shared, they are closed by `close_providers()`
+        pass
+
+
+
+class DeepSeekProvider(OpenAIProvider):
+    '''
+    DeepSeek's OpenAI compatible API, asked for a JSON object instead of a JSON schema
+    '''
+    name = "deepseek"
+    temperature_models = ["deepseek-chat", "deepseek-reasoner"]
+    skills_prompt = deepseek_extract_skills_prompt
+    skills_response_format = {"type": "json_object"}
+    questions_response_format = {"type": "json_object"}
+
+    def __init__(self) -> None:
+        super().__init__(
+            getattr(secrets, "deepseek_model", "deepseek-chat"),
+            getattr(secrets, "deepseek_api_url", "https://api.deepseek.com"),
+            getattr(secrets, "deepseek_api_key", "")
+        )
+        self.supports_response_format = True
+
+
+
+class OllamaProvider(AIProvider):
+    '''
+    Local Ollama server through LangChain
+    '''
+    name = "ollama"
+
+    def __init__(self) -> None:
+        from langchain_ollama import ChatOllama
+        super().__init__(secrets.llm_model)
+        # Remove /v1 if present (different format between OpenAI and LangChain)
+        base_url = secrets.llm_api_url.rstrip("/").split("/v1")[0]
+        self.client = ChatOllama(base_url=base_url, model=self.model, temperature=0)
+        self.json_client = ChatOllama(base_url=base_url, model=self.model, temperature=0, format="json")
+        print_lg(f"Using {self.name} API URL: {base_url}")
+
+
+    async def _complete(self, messages: list[dict], response_format: dict | None, temperature: float) -> tuple[str, dict]:
+        response = await (self.json_client if response_format else self.client).ainvoke([(message["role"], message["content"]) for message in messages])
+        usage = response.usage_metadata or {}
+        return response.content, {"prompt_tokens": usage.get("input_tokens"), "completion_tokens": usage.get("output_tokens")}
+
+
+    async def _stream(self, messages: list[dict], response_format: dict | None, temperature: float) -> AsyncIterator[str]:
+        async for chunk in (self.json_client if response_format else self.client).astream([(message["role"], message["content"]) for message in messages]):
+            if chunk.content: yield chunk.content
+
+
+
+class GeminiProvider(AIProvider):
+    '''
+    Google Gemini API
+    '''
+    name = "gemini"
+
+    def __init__(self) -> None:
+        import google.generativeai as genai
+        from google.generativeai.types import HarmCategory, HarmBlockThreshold
+        if not secrets.gemini_api_key: raise ValueError("Gemini API key not found in config/secrets.py")
+        super().__init__(secrets.gemini_model)
+        genai.configure(api_key=secrets.gemini_api_key)
+        self.client = genai.GenerativeModel(
+            model_name=self.model,
+            safety_settings={
+                HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
+                HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
+                HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
+                HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
+            },
+            generation_config={"top_p": 0.95, "top_k": 40}
+        )
+
+
+    def generation_config(self, response_format: dict | None, temperature: float) -> dict:
+        config = {"temperature": temperature}
+        if response_format: config["response_mime_type"] = "application/json"
+        return config
+
+
+    async def _complete(self, messages: list[dict], response_format: dict | None, temperature: float) -> tuple[str, dict]:
+        prompt = "\n\n".join(message["content"] for message in messages)
+        response = await self.client.generate_content_async(prompt, generation_config=self.generation_config(response_format, temperature),
+                                                            request_options={"timeout": ai_request_timeout})
+        usage = response.usage_metadata
+        return response.text, {"prompt_tokens": usage.prompt_token_count, "completion_tokens": usage.candidates_token_count} if usage else {}
+
+
+    async def _stream(self, messages: list[dict], response_format: dict | None, temperature: float) -> AsyncIterator[str]:
+        prompt = "\n\n".join(message["content"] for message in messages)
+        response = await self.client.generate_content_async(prompt, generation_config=self.generation_config(response_format, temperature),
+                                                            request_options={"timeout": ai_request_timeout}, stream=True)
+        async for chunk in response:
+            if chunk.text: yield chunk.text
+
+
+
+providers: dict[str, type[AIProvider]] = {
+    "openai": OpenAIProvider,
+    "deepseek": DeepSeekProvider,
+    "ollama": OllamaProvider,
+    "gemini": GeminiProvider,
+}
+'''
+AI providers by their `ai_provider` name in `config/secrets.py`
+'''
+
+
+
+def answer_prompt(
+    question: str, options: list[str] | None, question_type: str,
+    job_description: str | None, about_company: str | None, user_information_all: str | None
+) -> str:
+    '''
+    Returns the prompt to answer a form `question` with
+    '''
+    prompt = ai_answer_prompt.format(user_information(user_information_all) if user_information_all else "N/A", question)
+    if options and question_type in ['single_select', 'multiple_select']:
+        prompt += "\n\nOPTIONS:\n" + "\n".join(f"- {option}" for option in options)
+        prompt += "\n\nPlease select exactly ONE option from the list above." if question_type == 'single_select' else "\n\nYou may select MULTIPLE options from the list above if appropriate."
+    return prompt + context_prompt(job_description, about_company)
+
+
+def answers_prompt(
+    questions: list[tuple[str, str, list[str] | None]],
+    job_description: str | None, about_company: str | None, user_information_all: str | None
+) -> str:
+    '''
+    Returns the prompt to answer all `questions` of a form page with, questions are numbered from 1
+    '''
+    questions_json = json.dumps([
+        {"id": id, "question": question, "type": question_type, **({"options": options} if options else {})}
+        for id, (question, question_type, options) in enumerate(questions, 1)
+    ], ensure_ascii=False, indent=1)
+    prompt = ai_answer_questions_prompt.format(user_information(user_information_all) if user_information_all else "N/A", questions_json)
+    return prompt + context_prompt(job_description, about_company)
+
+
+def context_prompt(job_description: str | None, about_company: str | None) -> str:
+    '''
+    Returns the job and company details to add to question prompts, the job description is sent as its compact digest
+    '''
+    prompt = ""
+    if job_description and job_description != "Unknown":
+        prompt += f"\n\nJOB DESCRIPTION:\n{job_digest(job_description)}"
+    if about_company and about_company != "Unknown":
+        prompt += f"\n\nABOUT COMPANY:\n{about_company}"
+    return prompt
+
+
+def check_error(response: Any) -> None:
+    '''
+    Raises a `ValueError` if an OpenAI-like API returned an error in `response`
+    '''
+    error = (response.model_extra or {}).get("error")
+    if error: raise ValueError(f'Error occurred with API: "{error}"')
+
+
+
+__lock = RLock()
+__loop: asyncio.AbstractEventLoop | None = None
+__http_client = None
+__providers: dict[str, AIProvider | None] = {}
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    '''
+    Returns the event loop all AI requests run on, it's started in a background thread on first use
+    '''
+    global __loop
+    with __lock:
+        if __loop is None:
+            __loop = asyncio.new_event_loop()
+            Thread(target=__loop.run_forever, name="ai-requests", daemon=True).start()
+            atexit.register(close_providers)
+        return __loop
+
+
+def get_http_client():
+    '''
+    Returns the HTTP connection pool shared by OpenAI-like providers
+    '''
+    global __http_client
+    with __lock:
+        if __http_client is None:
+            import httpx
+            __http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=ai_max_connections, max_keepalive_connections=ai_max_connections),
+                timeout=ai_request_timeout
+            )
+        return __http_client
+
+
+def submit_ai_task(coroutine: Coroutine) -> Future:
+    '''
+    Starts `coroutine` on the AI event loop and returns right away, call `.result()` on the returned `Future` when the result is needed
+    '''
+    return asyncio.run_coroutine_threadsafe(coroutine, get_loop())
+
+
+def run_ai_task(coroutine: Coroutine, timeout: float | None = None) -> Any:
+    '''
+    Runs `coroutine` on the AI event loop and waits for its result
+    '''
+    return submit_ai_task(coroutine).result(timeout)
+
+
+def get_provider(name: str = secrets.ai_provider) -> AIProvider | None:
+    '''
+    Returns the shared AI provider called `name`, created on first use. `None` if it's unknown or can't be created.
+    '''
+    name = name.lower()
+    with __lock:
+        if name not in __providers:
+            if name not in providers:
+                print_lg(f"Unknown AI provider: {name}. Supported providers are: {', '.join(providers)}")
+                return None
+            print_lg(f"Creating {name} AI client...")
+            try:
+                __providers[name] = providers[name]()
+                print_lg(f"---- SUCCESSFULLY CREATED {name.upper()} AI CLIENT! ----")
+                print_lg(f"Using Model: {__providers[name].model}")
+                print_lg("Check './config/secrets.py' for more details.\n")
+            except Exception as e:
+                critical_error_log(f"Error occurred while creating {name} AI client. Make sure your AI API connection details in './config/secrets.py' are correct.", e)
+                __providers[name] = None
+        return __providers[name]
+
+
+def close_providers() -> None:
+    '''
+    Closes all AI providers and their connections, and stops the AI event loop
+    '''
+    global __loop, __http_client
+    with __lock:
+        if __loop is None: return
+        async def close() -> None:
+            for provider in __providers.values():
+                if provider: await provider.aclose()
+            if __http_client is not None: await __http_client.aclose()
+        try:
+            run_ai_task(close(), timeout=10)
+        except Exception as e:
+            print_lg("Failed to close AI clients!", e)
+        __loop.call_soon_threadsafe(__loop.stop)
+        __loop, __http_client = None, None
+        __providers.clear()
@@ -0,0 +1,248 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+import re
+import zlib
+import sqlite3
+import atexit
+import numpy as np
+
+from time import time
+from threading import RLock
+
+from config.settings import ai_cache_db_path, semantic_match, semantic_match_threshold, semantic_match_overlap, semantic_match_kinds
+from config.questions import question_answers
+from modules.helpers import print_lg
+from modules.rules import normalize_label
+
+
+
+vector_size = 2048
+'''
+Number of hashed features of a question vector
+'''
+
+generic_words = {
+    "a", "an", "the", "of", "in", "on", "at", "to", "for", "with", "and", "or", "is", "are", "be", "been", "do", "does", "did",
+    "you", "your", "yours", "have", "has", "had", "how", "many", "much", "what", "which", "who", "when", "where", "why", "please",
+    "years", "year", "yrs", "yr", "experience", "experienced", "work", "working", "professional", "total", "level", "rate",
+    "yourself", "scale", "from", "enter", "provide", "number", "any", "if", "so", "this", "that", "we", "us", "our", "can", "will",
+    "would", "currently", "current", "proficiency", "proficient", "skill", "skills", "using", "use", "used", "hands",
+}
+'''
+Words that don't tell what a question is about, like "years" and "experience". The other words of two matching questions must mostly be the same.
+'''
+
+__word = re.compile(r"[a-z0-9+#.]+")
+
+
+
+def content_words(label: str) -> frozenset[str]:
+    '''
+    Returns the words of `label` that tell what it's about, in singular
+    '''
+    words = (word.strip(".") for word in __word.findall(normalize_label(label)))
+    return frozenset(word[:-1] if len(word) > 3 and word.endswith("s") else word for word in words if word and word not in generic_words)
+
+
+def overlap(words: frozenset[str], other: frozenset[str]) -> float:
+    '''
+    Returns the share of content words two questions have in common (Jaccard index), 0 if either has none
+    '''
+    return len(words & other) / len(words | other) if words and other else 0.0
+
+
+def features(label: str) -> list[str]:
+    '''
+    Returns content words of `label` and their character 3-grams, and its other words.
+    Content words count 3 times, so filler like "How many years of ... do you have?" barely changes the similarity.
+    '''
+    words = sorted(content_words(label))
+    text = f" {' '.join(words)} " if words else ""
+    fillers = sorted({word.strip(".") for word in __word.findall(normalize_label(label))} & generic_words)
+    return [f"w:{word}" for word in words] * 3 + [f"c:{text[index:index + 3]}" for index in range(len(text) - 2)] + [f"g:{word}" for word in fillers]
+
+
+def vectorize(label: str) -> np.ndarray:
+    '''
+    Returns the hashed term counts of `label`, signed to cancel out collisions
+    '''
+    vector = np.zeros(vector_size, dtype=np.float32)
+    for feature in features(label):
+        digest = zlib.crc32(feature.encode("utf-8"))
+        vector[digest % vector_size] += 1 if digest & 0x80000000 else -1
+    return vector
+
+
+
+class SemanticIndex:
+    '''
+    Questions answered before and their answers, to answer paraphrased questions without AI.
+    * Questions are compared by cosine similarity of their hashed content word, character 3-gram and filler word vectors,
+      weighted by how rare each feature is in the index
+    * A match also needs at least `min_overlap` of their content words in common, so "Years of Java?" never matches "Years of Python?",
+      but "Years of Python programming?" matches "Years of Python?". Questions without any content words never match
+    * Saved in the `semantic` table of `ai_cache_db_path`, new answers are added with `add()` and known ones with `seed()`
+    '''
+    def __init__(self, db_path: str = ai_cache_db_path, threshold: float = semantic_match_threshold, min_overlap: float = semantic_match_overlap) -> None:
+        self.threshold = threshold
+        self.min_overlap = min_overlap
+        self.lock = RLock()
+        self.connection = sqlite3.connect(db_path, timeout=10, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        with self.lock, self.connection:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS semantic (label TEXT, kind TEXT, question TEXT, answer TEXT, vector BLOB, created REAL, PRIMARY KEY (label, kind))")
+        rows = self.connection.execute("SELECT label, kind, question, answer FROM semantic").fetchall()
+        self.entries = [(label, kind, question, answer, content_words(question)) for label, kind, question, answer in rows]
+        self.positions = {(label, kind): index for index, (label, kind, *_) in enumerate(self.entries)}
+        # Vectors are made again from the questions, so saved questions follow changes to `features()`
+        self.counts = np.array([vectorize(question) for _, _, question, _ in rows], dtype=np.float32).reshape(len(rows), vector_size)
+        self.weighted: np.ndarray | None = None
+        self.idf: np.ndarray | None = None
+        self.hits = 0
+        self.misses = 0
+
+
+    def build(self) -> None:
+        '''
+        Weights all vectors by inverse document frequency and normalizes them, done again after questions are added
+        '''
+        frequency = np.count_nonzero(self.counts, axis=0)
+        self.idf = np.log((len(self.counts) + 1) / (frequency + 1)).astype(np.float32) + 1
+        weighted = self.counts * self.idf
+        norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        self.weighted = weighted / norms
+
+
+    def match(self, question: str, kind: str) -> tuple[str, str, float] | None:
+        '''
+        Returns `(answer, matched_question, similarity)` of the most similar question of `kind` answered before, `None` if none is similar enough
+        '''
+        with self.lock:
+            if not self.entries:
+                self.misses += 1
+                return None
+            if self.weighted is None: self.build()
+            vector = vectorize(question) * self.idf
+            norm = np.linalg.norm(vector)
+            similarities = self.weighted @ (vector / norm) if norm else np.zeros(len(self.entries))
+            words = content_words(question)
+            if not words:
+                # Generic questions like "Years of experience?" mean different things on different forms
+                self.misses += 1
+                return None
+            for index in np.argsort(-similarities):
+                similarity = float(similarities[index])
+                if similarity < self.threshold: break
+                _, entry_kind, matched, answer, entry_words = self.entries[index]
+                if entry_kind == kind and overlap(entry_words, words) >= self.min_overlap:
+                    self.hits += 1
+                    return answer, matched, similarity
+            self.misses += 1
+            return None
+
+
+    def add(self, question: str, kind: str, answer: str) -> None:
+        '''
+        Adds or updates the confirmed `answer` of `question`
+        '''
+        label = normalize_label(question)
+        if not label or not answer or label == "unknown": return
+        vector = vectorize(question)
+        with self.lock:
+            with self.connection:
+                self.connection.execute("INSERT OR REPLACE INTO semantic (label, kind, question, answer, vector, created) VALUES (?, ?, ?, ?, ?, ?)",
+                                        (label, kind, question, answer, vector.tobytes(), time()))
+            entry = (label, kind, question, answer, content_words(question))
+            if (label, kind) in self.positions:
+                index = self.positions[(label, kind)]
+                self.entries[index] = entry
+                self.counts[index] = vector
+            else:
+                self.positions[(label, kind)] = len(self.entries)
+                self.entries.append(entry)
+                self.counts = np.vstack([self.counts, vector])
+            self.weighted = None
+
+
+    def seed(self, answers: dict[str, str], kind: str = "text") -> None:
+        '''
+        Adds known `answers` of questions, like `question_answers` in `config/questions.py`, that aren't in the index with the same answer
+        '''
+        for question, answer in answers.items():
+            position = self.positions.get((normalize_label(question), kind))
+            if position is None or self.entries[position][3] != answer:
+                self.add(question, kind, answer)
+
+
+    def stats(self) -> str:
+        return f"{len(self.entries)} questions, {self.hits} hits, {self.misses} misses"
+
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+
+
+__index: SemanticIndex | None = None
+__opened = False
+__lock = RLock()
+
+def get_semantic_index() -> SemanticIndex | None:
+    '''
+    Returns the shared semantic index with `question_answers` of `config/questions.py` in it, `None` if `semantic_match` is disabled or it can't be opened
+    '''
+    global __index, __opened
+    if not semantic_match: return None
+    with __lock:
+        if not __opened:
+            __opened = True
+            try:
+                __index = SemanticIndex()
+                atexit.register(__index.close)
+                __index.seed(question_answers)
+            except Exception as e:
+                print_lg(f'Failed to open semantic index in "{ai_cache_db_path}", continuing without it!', e)
+        return __index
+
+
+def match_answer(question: str, kind: str) -> str | None:
+    '''
+    Returns the answer of a question of `kind` similar to `question` that was answered before, `None` if there is none
+    '''
+    index = get_semantic_index()
+    if index is None or kind not in semantic_match_kinds: return None
+    match = index.match(question, kind)
+    if match is None: return None
+    answer, matched, similarity = match
+    print_lg(f'Answered "{question}" like the similar question "{matched}" ({similarity:.0%} similar)')
+    return answer
+
+
+def learn_answers(questions: set | None, skip: set) -> None:
+    '''
+    Adds answers of a submitted application's `questions` (`(label, answer, kind, previous_answer)`) to the semantic index.
+    Questions in `skip` (`(label, kind)`, like randomly answered ones) are not added.
+    '''
+    index = get_semantic_index()
+    if index is None or not questions: return
+    skip = {(normalize_label(label), kind) for label, kind in skip}
+    for label, answer, kind, _ in questions:
+        if kind in semantic_match_kinds and isinstance(answer, str) and answer.strip() and (normalize_label(label), kind) not in skip:
+            index.add(label, kind, answer)
@@ -0,0 +1,208 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+from queue import Queue, Empty
+from threading import Thread, RLock, local
+from typing import Any, Callable, Iterable
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.common.action_chains import ActionChains
+
+from modules.helpers import print_lg, critical_error_log, serve_main_thread_calls
+
+
+
+login_url = "https://www.linkedin.com"
+'''
+Page opened in new sessions before the login cookies are copied to them
+'''
+
+
+
+class BrowserSession:
+    '''
+    One Chrome window of the pool with its own `wait` and `actions`.
+    `main_tab` is the window handle jobs are searched in, external applications open in other tabs.
+    '''
+    def __init__(self, driver: WebDriver, index: int) -> None:
+        self.driver = driver
+        self.index = index
+        self.wait = WebDriverWait(driver, 5)
+        self.actions = ActionChains(driver)
+        self.main_tab = driver.current_window_handle
+
+
+    def __repr__(self) -> str:
+        return f"BrowserSession({self.index})"
+
+
+
+class SubmissionBudget:
+    '''
+    Number of applications all sessions may submit in this run, `0` is unlimited.
+    * `reserve()` takes one before applying, so sessions applying at the same time never go over the limit
+    * `release()` gives it back if the application wasn't submitted
+    '''
+    def __init__(self, limit: int = 0) -> None:
+        self.limit = limit
+        self.used = 0
+        self.lock = RLock()
+
+
+    def reserve(self) -> bool:
+        with self.lock:
+            if self.exhausted: return False
+            self.used += 1
+            return True
+
+
+    def release(self) -> None:
+        with self.lock:
+            self.used = max(self.used - 1, 0)
+
+
+    @property
+    def exhausted(self) -> bool:
+        return bool(self.limit) and self.used >= self.limit
+
+
+    def __repr__(self) -> str:
+        return f"{self.used} of {self.limit or 'unlimited'} applications"
+
+
+
+__state = local()
+
+def use_session(session: BrowserSession | None) -> None:
+    '''
+    Makes `session` the browser of the calling thread
+    '''
+    __state.session = session
+
+
+def current_session() -> BrowserSession | None:
+    '''
+    Returns the browser session of the calling thread, `None` if it has none
+    '''
+    return getattr(__state, "session", None)
+
+
+
+class SessionProxy:
+    '''
+    Stands in for the `driver`, `wait` or `actions` global, so code written for one browser uses the session of the thread it runs on.
+    Threads without a session use `default`.
+    '''
+    def __init__(self, attribute: str, default: Any) -> None:
+        object.__setattr__(self, "_attribute", attribute)
+        object.__setattr__(self, "_default", default)
+
+
+    def _target(self) -> Any:
+        session = current_session()
+        return getattr(session, self._attribute) if session else self._default
+
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target(), name)
+
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._target(), name, value)
+
+
+    def __repr__(self) -> str:
+        return f"SessionProxy({self._target()!r})"
+
+
+
+class BrowserPool:
+    '''
+    Browser sessions of one LinkedIn account.
+    * The first session is `main_driver`, the one logged in. `start_driver()` opens the others.
+    * Chrome can't open one profile in several windows at once, so the others share the login through its cookies.
+    '''
+    def __init__(self, main_driver: WebDriver, start_driver: Callable[[], WebDriver], size: int = 1) -> None:
+        self.sessions = [BrowserSession(main_driver, 0)]
+        for index in range(1, size):
+            try:
+                driver = start_driver()
+                if driver is None: raise RuntimeError("Chrome didn't start")
+                self.sessions.append(BrowserSession(driver, index))
+            except Exception as e:
+                print_lg(f"Failed to start browser session {index}, continuing with {len(self.sessions)}!", e)
+                break
+        self.share_login()
+
+
+    def share_login(self) -> None:
+        '''
+        Copies the LinkedIn cookies of the main session to the other sessions
+        '''
+        cookies = [cookie for cookie in self.sessions[0].driver.get_cookies() if "linkedin" in cookie.get("domain", "")]
+        for session in self.sessions[1:]:
+            session.driver.get(login_url)
+            for cookie in cookies:
+                try:
+                    session.driver.add_cookie({key: cookie[key] for key in ("name", "value", "domain", "path", "secure", "httpOnly", "expiry") if key in cookie})
+                except Exception as e:
+                    print_lg(f'Failed to copy cookie "{cookie.get("name")}" to browser session {session.index}!', e)
+            session.driver.refresh()
+            session.main_tab = session.driver.current_window_handle
+
+
+    def close(self) -> None:
+        '''
+        Quits all sessions but the main one
+        '''
+        for session in self.sessions[1:]:
+            try: session.driver.quit()
+            except Exception as e: critical_error_log(f"When quitting browser session {session.index}...", e)
+        del self.sessions[1:]
+
+
+
+class Scheduler:
+    '''
+    Hands out work items, like search terms, to the sessions of a `pool`, each session works on its own thread.
+    Sessions stop taking items once the `budget` is exhausted. The main thread shows their dialogs meanwhile, see `on_main_thread()` in `modules/helpers.py`.
+    '''
+    def __init__(self, pool: BrowserPool, budget: SubmissionBudget) -> None:
+        self.pool = pool
+        self.budget = budget
+
+
+    def run(self, items: Iterable[Any], work: Callable[[Any], Any]) -> None:
+        '''
+        Calls `work(item)` for every item on the thread of a free session, returns when all are done
+        '''
+        queue = Queue()
+        for item in items: queue.put(item)
+
+        def worker(session: BrowserSession) -> None:
+            use_session(session)
+            while not self.budget.exhausted:
+                try: item = queue.get_nowait()
+                except Empty: break
+                try:
+                    work(item)
+                except Exception as e:
+                    critical_error_log(f"In browser session {session.index}", e)
+
+        threads = [Thread(target=worker, args=(session,), name=f"browser-{session.index}", daemon=True) for session in self.pool.sessions]
+        serve_main_thread_calls(threads)
@@ -0,0 +1,171 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+import os
+import re
+import json
+import shutil
+import platform
+import plistlib
+import subprocess
+
+from threading import RLock
+
+from config.settings import chromedriver_cache_file
+from modules.helpers import print_lg
+
+
+
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+bundled_chromedrivers = {
+    ("linux", "x86_64"): os.path.join(project_dir, "chromedriver-linux64", "chromedriver"),
+    ("linux", "amd64"): os.path.join(project_dir, "chromedriver-linux64", "chromedriver"),
+    ("darwin", "arm64"): os.path.join(project_dir, "chromedriver-mac-arm64", "chromedriver"),
+}
+'''
+Chromedrivers shipped with the project, by `(platform.system(), platform.machine())` in lower case
+'''
+
+chrome_paths = {
+    "linux": ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser"],
+    "darwin": ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "/Applications/Chromium.app/Contents/MacOS/Chromium"],
+    "windows": [os.path.expandvars(r"%ProgramFiles%\Google\Chrome\Application\chrome.exe"),
+                os.path.expandvars(r"%ProgramFiles(x86)%\Google\Chrome\Application\chrome.exe"),
+                os.path.expandvars(r"%LocalAppData%\Google\Chrome\Application\chrome.exe")],
+}
+'''
+Where Chrome is looked for on each platform, names are looked up in `PATH`
+'''
+
+__version = re.compile(r"(\d+)\.\d+\.\d+")
+
+
+
+def find_chrome() -> str | None:
+    '''
+    Returns the path of the installed Chrome, `None` if it isn't found
+    '''
+    for candidate in chrome_paths.get(platform.system().lower(), []):
+        path = candidate if os.path.isabs(candidate) else shutil.which(candidate)
+        if path and os.path.exists(path): return os.path.realpath(path)
+    return None
+
+
+def major_version(text: str) -> int | None:
+    match = __version.search(text or "")
+    return int(match.group(1)) if match else None
+
+
+def chrome_major_version(chrome: str) -> int | None:
+    '''
+    Returns the major version of `chrome`, read from its files on macOS and Windows, asked from it on Linux
+    '''
+    try:
+        if platform.system().lower() == "darwin":
+            with open(os.path.join(chrome.split(".app/")[0] + ".app", "Contents", "Info.plist"), "rb") as file:
+                return major_version(plistlib.load(file).get("CFBundleShortVersionString"))
+        if platform.system().lower() == "windows":
+            # Chrome keeps its files in a folder named as its version, next to chrome.exe
+            versions = [major_version(name) for name in os.listdir(os.path.dirname(chrome)) if re.fullmatch(r"[\d.]+", name)]
+            versions = [version for version in versions if version]
+            return max(versions) if versions else None
+        return major_version(subprocess.run([chrome, "--version"], capture_output=True, text=True, timeout=10).stdout)
+    except Exception as e:
+        print_lg(f'Failed to find version of Chrome "{chrome}"!', e)
+        return None
+
+
+def chromedriver_major_version(chromedriver: str) -> int | None:
+    try:
+        return major_version(subprocess.run([chromedriver, "--version"], capture_output=True, text=True, timeout=10).stdout)
+    except Exception:
+        return None
+
+
+def chromedriver_candidates() -> list[str]:
+    '''
+    Returns chromedrivers to try, the bundled one first and then the one in `PATH`
+    '''
+    candidates = [bundled_chromedrivers.get((platform.system().lower(), platform.machine().lower()))]
+    candidates.append(shutil.which("chromedriver"))
+    return [path for path in dict.fromkeys(candidates) if path and os.path.isfile(path) and os.access(path, os.X_OK)]
+
+
+def modified_time(path: str | None) -> float | None:
+    try: return os.path.getmtime(path) if path else None
+    except OSError: return None
+
+
+
+def read_cache() -> dict:
+    try:
+        with open(chromedriver_cache_file, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_cache(chromedriver: str, chrome: str | None, chrome_major: int | None) -> None:
+    try:
+        with open(chromedriver_cache_file, "w", encoding="utf-8") as file:
+            json.dump({"chromedriver": chromedriver, "chromedriver_mtime": modified_time(chromedriver),
+                       "chrome": chrome, "chrome_mtime": modified_time(chrome), "chrome_major": chrome_major}, file, indent=2)
+    except OSError as e:
+        print_lg(f'Failed to save chromedriver path to "{chromedriver_cache_file}"!', e)
+
+
+def is_cache_valid(cache: dict, chrome: str | None) -> bool:
+    '''
+    Returns `True` if neither Chrome nor the cached chromedriver changed since they were matched
+    '''
+    chromedriver = cache.get("chromedriver")
+    return bool(chromedriver) and os.access(chromedriver, os.X_OK) and cache.get("chromedriver_mtime") == modified_time(chromedriver) \
+        and cache.get("chrome") == chrome and cache.get("chrome_mtime") == modified_time(chrome)
+
+
+
+__lock = RLock()
+__resolved: str | None = None
+
+def resolve_chromedriver(download: bool = True) -> str | None:
+    '''
+    Returns the path of a chromedriver for the installed Chrome.
+    * Reuses the one saved in `chromedriver_cache_file` if Chrome and it didn't change, without running anything
+    * Otherwise picks the bundled chromedriver or the one in `PATH` whose major version matches Chrome, and saves it
+    * Downloads one with webdriver_manager only if none matches and `download`, returns `None` if it can't
+    '''
+    global __resolved
+    with __lock:
+        if __resolved: return __resolved
+        chrome = find_chrome()
+        cache = read_cache()
+        if is_cache_valid(cache, chrome):
+            __resolved = cache["chromedriver"]
+            return __resolved
+        chrome_major = chrome_major_version(chrome) if chrome else None
+        for candidate in chromedriver_candidates():
+            if chrome_major is None or chromedriver_major_version(candidate) == chrome_major:
+                print_lg(f'Using chromedriver "{candidate}"' + (f" for Chrome {chrome_major}" if chrome_major else ""))
+                __resolved = candidate
+                break
+        else:
+            if not download: return None
+            from webdriver_manager.chrome import ChromeDriverManager
+            __resolved = ChromeDriverManager().install()
+        write_cache(__resolved, chrome, chrome_major)
+        return __resolved
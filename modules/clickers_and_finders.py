@@ -14,6 +14,7 @@ version:    24.12.29.12.30
 
 from config.settings import click_gap, smooth_scroll
 from modules.helpers import buffer, print_lg, sleep
+from modules.waits import wait_for, wait_until_idle, wait_until_stable
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -157,11 +158,12 @@ def company_search_click(driver: WebDriver, actions: ActionChains, companyName:
 
 def text_input(actions: ActionChains, textInputEle: WebElement | bool, value: str, textFieldName: str = "Text") -> None | Exception:
     if textInputEle:
-        sleep(1)
+        wait_until_stable(textInputEle, "text_input", fallback=1)
         # actions.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).perform()
         textInputEle.clear()
         textInputEle.send_keys(value.strip())
-        sleep(2)
+        # Let the suggestions load before choosing
+        wait_for(textInputEle.parent, EC.visibility_of_element_located((By.CSS_SELECTOR, "[role='listbox'] [role='option']")), "suggestions", fallback=2)
         actions.send_keys(Keys.ENTER).perform()
     else:
         print_lg(f'{textFieldName} input was not given!')
@@ -172,7 +174,7 @@ def do_login(driver, username, password):
         # Start fresh
         driver.delete_all_cookies()
         driver.get("https://www.linkedin.com/login")
-        sleep(3)
+        wait_until_idle(driver, "login_page", fallback=3)
         
         # Handle login form with explicit waits
         username_field = WebDriverWait(driver, 10).until(
@@ -193,7 +195,8 @@ def do_login(driver, username, password):
             EC.element_to_be_clickable((By.XPATH, '//button[@type="submit"]'))
         )
         submit.click()
-        sleep(5)
+        if wait_for(driver, lambda driver: "/login" not in driver.current_url, "login", fallback=5):
+            wait_until_idle(driver, "feed", timeout=3)
         
         return True
     except Exception as e:
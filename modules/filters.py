@@ -0,0 +1,133 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+from threading import RLock, Thread, current_thread
+
+from config.search import bad_words, about_company_bad_words, about_company_good_words, title_include_words, title_exclude_words, skip_seen_jobs
+from modules.keywords import KeywordMatcher, noun_suffixes
+
+
+
+clearance_words = ["polygraph", "polygraphs", "clearance", "clearances", "secret"]
+'''
+Words of jobs asking for a security clearance, checked unless `security_clearance = True`
+'''
+
+# Compiled once, shared by the description, company and title checks. Words match whole, or as plurals and "-ship" nouns
+bad_words_filter = KeywordMatcher(bad_words, whole_words=True, suffixes=noun_suffixes)
+clearance_filter = KeywordMatcher(clearance_words, whole_words=True)
+company_bad_words_filter = KeywordMatcher(about_company_bad_words, whole_words=True, suffixes=noun_suffixes)
+company_good_words_filter = KeywordMatcher(about_company_good_words, whole_words=True, suffixes=noun_suffixes)
+
+
+
+def first_hit(matcher: KeywordMatcher, text: str) -> tuple[int, int, str] | None:
+    '''
+    Returns `(start, end, keyword)` of the first keyword of `matcher` in `text`, `None` if there is none
+    '''
+    hits = matcher.find_hits(text)
+    return hits[0] if hits else None
+
+
+def describe_hits(text: str, hits: list[tuple[int, int, str]], margin: int = 40) -> str:
+    '''
+    Returns every hit with the text around it, like `"QA" at 120: "...looking for a QA engineer to..."`
+    '''
+    lines = []
+    for start, end, keyword in hits:
+        around = " ".join(text[max(start - margin, 0):end + margin].split())
+        lines.append(f'"{keyword}" at {start}: "...{around}..."')
+    return "\n".join(lines)
+
+
+
+class CardFilter:
+    '''
+    Skips job cards of a search results page on their title and company alone, before any of them is clicked.
+    * A title must have one of `title_include_words` (if any) and none of `title_exclude_words` or `bad_words`
+    * A company must not be in `companies` or have `about_company_bad_words` in its name, unless it has `about_company_good_words`
+    * With `skip_seen_jobs`, jobs already seen for an earlier search term are skipped, call `mark_seen()` for every job handled
+    * `companies` is kept by reference, companies added to it later are skipped too
+    * Browser sessions share one filter, `claim()` a job before opening it so no other session opens it too
+    '''
+    def __init__(self, companies: set[str], include_titles: list[str] = title_include_words, exclude_titles: list[str] = title_exclude_words,
+                 skip_seen: bool = skip_seen_jobs) -> None:
+        self.companies = companies
+        self.include = KeywordMatcher(include_titles, whole_words=True, suffixes=noun_suffixes) if include_titles else None
+        self.exclude = KeywordMatcher(list(exclude_titles) + list(bad_words), whole_words=True, suffixes=noun_suffixes)
+        self.skip_seen = skip_seen
+        self.seen: set[str] = set()
+        self.claims: dict[str, Thread] = {}
+        self.lock = RLock()
+
+
+    def mark_seen(self, job_id: str) -> None:
+        with self.lock:
+            self.seen.add(job_id)
+
+
+    def claim(self, job_id: str) -> bool:
+        '''
+        Claims `job_id` for the calling thread, returns `False` if another thread claimed it already
+        '''
+        with self.lock:
+            return self.claims.setdefault(job_id, current_thread()) is current_thread()
+
+
+    def release(self, job_id: str) -> None:
+        '''
+        Releases the calling thread's claim of `job_id`, for jobs that failed so another session can try them
+        '''
+        with self.lock:
+            if self.claims.get(job_id) is current_thread(): del self.claims[job_id]
+
+
+    def check(self, card: dict) -> str | None:
+        '''
+        Returns why `card` should be skipped, `None` if it should be opened
+        '''
+        if self.skip_seen and card["job_id"] in self.seen: return "Seen for an earlier search term"
+        return self.check_card(card)
+
+
+    def check_card(self, card: dict) -> str | None:
+        '''
+        Returns why `card` should be skipped on its title and company, `None` if it should be opened.
+        Cards not rendered yet pass, check them again once they are read with `read_job_card()`
+        '''
+        title, company = card["title"] or "", card["company"] or ""
+        companies = set(self.companies)     # Copied at once, other sessions add to it while this one checks
+        if company in companies or company.lower() in {name.lower() for name in companies}: return "Blacklisted company"
+        hit = first_hit(company_bad_words_filter, company)
+        if hit and not first_hit(company_good_words_filter, company): return f'Bad word "{hit[2]}" in company name'
+        if not title: return None
+        hit = first_hit(self.exclude, title)
+        if hit: return f'Excluded word "{hit[2]}" in title'
+        if self.include and not first_hit(self.include, title): return "Title has none of the included words"
+        return None
+
+
+    def filter(self, cards: list[dict]) -> tuple[list[dict], list[tuple[dict, str]]]:
+        '''
+        Returns `(kept, skipped)` of `cards`, `skipped` as `(card, reason)`
+        '''
+        kept, skipped = [], []
+        for card in cards:
+            reason = self.check(card)
+            if reason is None: kept.append(card)
+            else: skipped.append((card, reason))
+        return kept, skipped
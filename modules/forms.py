@@ -0,0 +1,134 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+from selenium.webdriver.remote.webelement import WebElement
+
+
+
+question_kinds = ["select", "radio", "text", "textarea", "checkbox", "unknown"]
+'''
+Kinds of Easy Apply questions, in the order they are checked for in a form element
+'''
+
+__form_script = '''
+const text = (element) => element ? (element.innerText || element.textContent || "").trim() : "";
+const labelFor = (root, id) => id ? root.querySelector(`label[for="${CSS.escape(id)}"]`) : null;
+const option = (label, value, selected, element, labelElement) => ({ label: label, value: value, selected: selected, element: element, labelElement: labelElement });
+return Array.from(arguments[0].querySelectorAll("div[data-test-form-element]"), (question) => {
+    const select = question.querySelector("select");
+    if (select) {
+        const label = question.querySelector("label");
+        const selected = select.options[select.selectedIndex];
+        return { kind: "select", label: text(label && label.querySelector("span")), value: selected ? selected.text.trim() : "", element: select,
+                 options: Array.from(select.options, (item) => option(item.text.trim(), item.value, item.selected, null, null)) };
+    }
+    const radio = question.querySelector('fieldset[data-test-form-builder-radio-button-form-component="true"]');
+    if (radio) {
+        const title = radio.querySelector("span[data-test-form-builder-radio-button-form-component__title]");
+        return { kind: "radio", label: text(title && (title.querySelector(".visually-hidden") || title)), value: null, element: radio,
+                 options: Array.from(radio.querySelectorAll("input"), (input) => { const label = labelFor(radio, input.id); return option(text(label), input.value, input.checked, input, label); }) };
+    }
+    const input = question.querySelector("input[type='text']");
+    if (input) {
+        const label = question.querySelector("label[for]");
+        return { kind: "text", label: text(label && (label.querySelector(".visually-hidden") || label)), value: input.value, element: input, options: [] };
+    }
+    const textarea = question.querySelector("textarea");
+    if (textarea) {
+        return { kind: "textarea", label: text(question.querySelector("label[for]")), value: textarea.value, element: textarea, options: [] };
+    }
+    const checkbox = question.querySelector("input[type='checkbox']");
+    if (checkbox) {
+        const label = question.querySelector("label[for]");
+        return { kind: "checkbox", label: text(question.querySelector("span[class='visually-hidden']")), value: checkbox.checked, element: checkbox,
+                 options: [option(text(label), checkbox.value, checkbox.checked, checkbox, label)] };
+    }
+    return { kind: "unknown", label: text(question.querySelector("label")), value: null, element: question, options: [] };
+});
+'''
+'''
+Serializes every form element of the given Easy Apply modal page
+'''
+
+
+
+class FormOption:
+    '''
+    An option of a select, radio or checkbox question.
+    * `element` is the input to click, `label_element` is its label. Both are `None` for select options.
+    '''
+    def __init__(self, label: str, value: str, selected: bool, element: WebElement | None = None, label_element: WebElement | None = None) -> None:
+        self.label = label
+        self.value = value
+        self.selected = selected
+        self.element = element
+        self.label_element = label_element
+
+
+    def __repr__(self) -> str:
+        return f"FormOption({self.label!r}, {self.value!r}, selected={self.selected})"
+
+
+
+class FormQuestion:
+    '''
+    A question in the Easy Apply modal as it was when the snapshot was taken.
+    * `kind` is one of `question_kinds`
+    * `label` is the question text, empty if it has none
+    * `value` is the selected option text for "select", the text for "text" and "textarea", checked state for "checkbox" and `None` for "radio"
+    * `element` is the select, input or textarea to write to (the fieldset for "radio")
+    '''
+    def __init__(self, kind: str, label: str, value: str | bool | None, element: WebElement, options: list[FormOption]) -> None:
+        self.kind = kind
+        self.label = label
+        self.value = value
+        self.element = element
+        self.options = options
+
+
+    def option_labels(self) -> list[str]:
+        return [option.label for option in self.options]
+
+
+    def selected_option(self) -> FormOption | None:
+        for option in self.options:
+            if option.selected: return option
+        return None
+
+
+    def __repr__(self) -> str:
+        return f"FormQuestion({self.kind!r}, {self.label!r}, value={self.value!r}, options={self.options})"
+
+
+
+def snapshot_form(modal: WebElement) -> list[FormQuestion]:
+    '''
+    Returns all questions of the current Easy Apply `modal` page, read in one call to the browser
+    '''
+    questions = modal.parent.execute_script(__form_script, modal) or []
+    return [
+        FormQuestion(question["kind"], question["label"], question["value"], question["element"], [
+            FormOption(option["label"], option["value"], option["selected"], option["element"], option["labelElement"]) for option in question["options"]
+        ]) for question in questions
+    ]
+
+
+def normalize_space(text: str) -> str:
+    '''
+    Collapses whitespace like XPath's `normalize-space()`
+    '''
+    return " ".join(text.split())
@@ -18,13 +18,18 @@ version:    24.12.29.12.30
 import os
 import json
 
-from time import sleep
+from time import sleep as time_sleep
 from random import randint
 from datetime import datetime, timedelta
-from pyautogui import alert
 from pprint import pprint
+from queue import Queue, Empty
+from threading import RLock, Thread, current_thread, main_thread
+from concurrent.futures import Future
+from typing import Any, Callable
 
-from config.settings import logs_folder_path
+from config.settings import logs_folder_path, log_level
+from modules.logger import get_log_writer, log_levels
+from modules.tracing import tracer
 
 
 
@@ -92,12 +97,56 @@ def find_default_profile_directory() -> str | None:
 #>
 
 
+#< Threads related
+__main_thread_calls: Queue = Queue()
+__main_thread_lock = RLock()
+__main_thread_serving = False
+
+def on_main_thread(function: Callable[..., Any], *args, **kwargs) -> Any:
+    '''
+    Calls `function` on the main thread and returns its result, for pyautogui dialogs that browser sessions can't show from their own threads.
+    It's called right away unless the main thread is in `serve_main_thread_calls()`, like while `Scheduler.run()` of `modules/browser_pool.py` waits for the sessions.
+    '''
+    result = None
+    with __main_thread_lock:
+        if __main_thread_serving and current_thread() is not main_thread():
+            result = Future()
+            __main_thread_calls.put((result, function, args, kwargs))
+    if result is None: return function(*args, **kwargs)
+    return result.result()
+
+
+def make_main_thread_call(result: Future, function: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+    try: result.set_result(function(*args, **kwargs))
+    except Exception as e: result.set_exception(e)
+
+
+def serve_main_thread_calls(threads: list[Thread], interval: float = 0.2) -> None:
+    '''
+    Starts `threads` and makes their calls of `on_main_thread()` until they all end, checking every `interval` seconds. Call it on the main thread.
+    '''
+    global __main_thread_serving
+    with __main_thread_lock:
+        __main_thread_serving = True
+    try:
+        for thread in threads: thread.start()
+        while any(thread.is_alive() for thread in threads):
+            try: make_main_thread_call(*__main_thread_calls.get(timeout=interval))
+            except Empty: pass
+    finally:
+        with __main_thread_lock:
+            __main_thread_serving = False
+        while not __main_thread_calls.empty():
+            make_main_thread_call(*__main_thread_calls.get_nowait())
+#>
+
+
 #< Logging related
 def critical_error_log(possible_reason: str, stack_trace: Exception) -> None:
     '''
     Function to log and print critical errors along with datetime stamp
     '''
-    print_lg(possible_reason, stack_trace, datetime.now(), from_critical=True)
+    print_lg(possible_reason, stack_trace, datetime.now(), level="ERROR", from_critical=True)
 
 
 def get_log_path():
@@ -113,22 +162,34 @@ def get_log_path():
 
 
 __logs_file_path = get_log_path()
+__min_log_level = log_levels.get(log_level.upper(), log_levels["INFO"])
+
+
+def is_log_enabled(level: str) -> bool:
+    '''
+    Function to check if messages of `level` ("DEBUG", "INFO", "WARNING", "ERROR") will be logged as per `log_level` in settings
+    '''
+    return log_levels.get(level.upper(), log_levels["INFO"]) >= __min_log_level
 
 
-def print_lg(*msgs: str | dict, end: str = "\n", pretty: bool = False, flush: bool = False, from_critical: bool = False) -> None:
+def print_lg(*msgs: str | dict, end: str = "\n", pretty: bool = False, flush: bool = False, level: str = "INFO", from_critical: bool = False) -> None:
     '''
     Function to log and print. **Note that, `end` and `flush` parameters are ignored if `pretty = True`**
+    * Messages are written to log.txt by a background writer, so this doesn't wait for the disk
+    * Returns right away without formatting anything if `level` is below `log_level` in settings. Use `level="DEBUG"` for big dumps.
     '''
+    if not is_log_enabled(level): return
     try:
+        writer = get_log_writer()
         for message in msgs:
             pprint(message) if pretty else print(message, end=end, flush=flush)
-            with open(__logs_file_path, 'a+', encoding="utf-8") as file:
-                file.write(str(message) + end)
+            writer.write(__logs_file_path, level.upper(), str(message), end)
     except Exception as e:
+        from pyautogui import alert
         trail = f'Skipped saving this message: "{message}" to log.txt!' if from_critical else "We'll try one more time to log..."
-        alert(f"log.txt in {logs_folder_path} is open or is occupied by another program! Please close it! {trail}", "Failed Logging")
+        on_main_thread(alert, f"Failed to log to log.txt in {logs_folder_path}! {trail}", "Failed Logging")
         if not from_critical:
-            critical_error_log("Log.txt is open or is occupied by another program!", e)
+            critical_error_log("Failed to log to log.txt!", e)
 
 def log_to_file_only(*msgs: str | dict, end: str = "\n", file_name: str = None) -> None:
     '''
@@ -143,18 +204,22 @@ def log_to_file_only(*msgs: str | dict, end: str = "\n", file_name: str = None)
             log_path = logs_folder_path + "/" + file_name
             log_path = log_path.replace("//", "/")
             
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(log_path, 'a+', encoding="utf-8") as file:
-            file.write(f"[{timestamp}] ")
-            for message in msgs:
-                file.write(str(message) + " ")
-            file.write(end)
+        get_log_writer().write(log_path, "INFO", "".join(str(message) + " " for message in msgs), end, timestamp=True)
     except Exception as e:
         # Silent exception - don't show alerts for file-only logs
         pass
 #>
 
 
+def sleep(seconds: float) -> None:
+    '''
+    Function to sleep for `seconds`, the time is accounted to the open trace spans as sleep time
+    '''
+    if seconds <= 0: return
+    time_sleep(seconds)
+    tracer.record_sleep(seconds)
+
+
 def buffer(speed: int=0) -> None:
     '''
     Function to wait within a period of selected random range.
@@ -0,0 +1,573 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+import os
+import csv
+import sqlite3
+import json
+import base64
+import atexit
+import argparse
+
+from abc import ABC, abstractmethod
+from threading import RLock
+from typing import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:     # Windows
+    fcntl = None
+    import msvcrt
+
+from config.settings import (
+    file_name, failed_file_name, history_backend, history_db_path,
+    history_batch_size, history_export_csv
+)
+
+
+
+#< Column layouts
+applied_fieldnames = ['Job ID', 'Title', 'Company', 'Work Location', 'Work Style', 'About Job', 'Experience required', 'Skills required', 'HR Name', 'HR Link', 'Resume', 'Re-posted', 'Date Posted', 'Date Applied', 'Job Link', 'External Job link', 'Questions Found', 'Connect Request']
+'''
+Column headers of the applied jobs history CSV, in order
+'''
+
+failed_fieldnames = ['Job ID', 'Job Link', 'Resume Tried', 'Date listed', 'Date Tried', 'Assumed Reason', 'Stack Trace', 'External Job link', 'Screenshot Name']
+'''
+Column headers of the failed jobs history CSV, in order
+'''
+
+listing_fieldnames = ['Job ID', 'Title', 'Company', 'HR Name', 'HR Link', 'Job Link', 'External Job link', 'Date Applied']
+'''
+Columns returned when listing applied jobs, large columns like "About Job" are left out
+'''
+
+sortable_fieldnames = ['Company', 'Title', 'Date Applied']
+'''
+Columns applied jobs can be sorted on while listing
+'''
+
+
+def to_column(field_name: str) -> str:
+    '''
+    Converts a CSV header like `"External Job link"` to its SQLite column name `"external_job_link"`
+    '''
+    return field_name.lower().replace('-', '').replace(' ', '_')
+
+
+applied_columns = [to_column(field) for field in applied_fieldnames]
+failed_columns = [to_column(field) for field in failed_fieldnames]
+#>
+
+
+
+#< History stores
+class HistoryStore(ABC):
+    '''
+    Base class for the applied and failed jobs history backends.
+    * Keeps an in-memory `set` of applied Job IDs for O(1) membership checks
+    * Writes applied jobs right away, buffers failed jobs and writes them in batches of `batch_size`
+    * Write errors are raised to the caller that added or flushed the rows, so it can alert the user
+    * Sub classes only implement `_load_applied_ids()`, `_write_applied()` and `_write_failed()`
+    '''
+    def __init__(self, batch_size: int = history_batch_size, export_csv: bool = history_export_csv) -> None:
+        self.batch_size = max(1, batch_size)
+        self.export_csv = export_csv
+        self.lock = RLock()
+        self.pending_applied: list[dict] = []
+        self.pending_failed: list[dict] = []
+        self._applied_ids: set[str] | None = None
+        atexit.register(self.close)
+
+
+    def applied_job_ids(self) -> set[str]:
+        '''
+        Returns the `set` of applied Job IDs. It's loaded only once per store, later additions are tracked in memory.
+        '''
+        with self.lock:
+            if self._applied_ids is None:
+                self._applied_ids = self._load_applied_ids()
+            return self._applied_ids
+
+
+    def has_applied(self, job_id: str) -> bool:
+        '''
+        Returns `True` if the job with `job_id` is already in the applied history
+        '''
+        return job_id in self.applied_job_ids()
+
+
+    def add_applied(self, row: dict) -> None:
+        '''
+        Writes an applied job `row` (keys as in `applied_fieldnames`) right away, a submitted application must not be lost.
+        If writing fails the row stays queued for the next flush and the error is raised.
+        '''
+        with self.lock:
+            self.applied_job_ids().add(str(row['Job ID']))
+            self.pending_applied.append(row)
+            self.flush_applied()
+
+
+    def add_failed(self, row: dict) -> None:
+        '''
+        Queues a failed job `row` (keys as in `failed_fieldnames`), writes the queue once it reaches `batch_size`
+        '''
+        with self.lock:
+            self.pending_failed.append(row)
+            if len(self.pending_failed) >= self.batch_size: self.flush_failed()
+
+
+    def flush(self) -> None:
+        '''
+        Writes all queued rows. Rows stay queued if writing fails, so they can be retried on next flush.
+        '''
+        with self.lock:
+            self.flush_applied()
+            self.flush_failed()
+
+
+    def flush_applied(self) -> None:
+        with self.lock:
+            if not self.pending_applied: return
+            self._write_applied(self.pending_applied)
+            if self.export_csv: append_csv_rows(file_name, applied_fieldnames, self.pending_applied)
+            self.pending_applied = []
+
+
+    def flush_failed(self) -> None:
+        with self.lock:
+            if not self.pending_failed: return
+            self._write_failed(self.pending_failed)
+            if self.export_csv: append_csv_rows(failed_file_name, failed_fieldnames, self.pending_failed)
+            self.pending_failed = []
+
+
+    def close(self) -> None:
+        '''
+        Flushes queued rows and releases resources, call `flush()` first to handle write errors
+        '''
+        try:
+            self.flush()
+        except Exception as e:
+            print(f'Failed to save {len(self.pending_applied)} applied and {len(self.pending_failed)} failed jobs to history! {e}')
+
+
+    @abstractmethod
+    def iter_applied_jobs(self, sort_by: str | None = None, descending: bool = False, filters: dict | None = None, cursor: str | None = None, limit: int = 100) -> Iterator[tuple[str, dict]]:
+        '''
+        Lazily yields up to `limit` applied jobs as `(cursor, job)` tuples, `job` has keys from `listing_fieldnames`.
+        * `sort_by` is one of `sortable_fieldnames` or `None` for the order jobs were saved in
+        * `filters` may have `"company"` and `"title"` (case insensitive contains), `"date_from"` and `"date_to"` (`YYYY-MM-DD`, inclusive)
+        * Pass the `cursor` of the last yielded job to continue with the next page
+        '''
+
+
+    @abstractmethod
+    def update_date_applied(self, job_ids: list[str], date_applied: str | None = None) -> list[str]:
+        '''
+        Sets "Date Applied" of all jobs in `job_ids` to `date_applied` (defaults to now) in one transaction.
+        * Returns the list of Job IDs that were found and updated
+        * With `export_csv`, their rows in the exported CSV are updated too
+        '''
+
+
+    @abstractmethod
+    def _load_applied_ids(self) -> set[str]: ...
+
+    @abstractmethod
+    def _write_applied(self, rows: list[dict]) -> None: ...
+
+    @abstractmethod
+    def _write_failed(self, rows: list[dict]) -> None: ...
+
+
+
+class CSVHistory(HistoryStore):
+    '''
+    Legacy history backend, the CSV files `file_name` and `failed_file_name` are the only storage.
+    '''
+    def __init__(self, batch_size: int = history_batch_size) -> None:
+        super().__init__(batch_size, export_csv=False)
+
+
+    def _load_applied_ids(self) -> set[str]:
+        job_ids = set()
+        try:
+            with open(file_name, 'r', encoding='utf-8') as file:
+                for row in csv.reader(file):
+                    if row: job_ids.add(row[0])
+        except FileNotFoundError:
+            pass
+        return job_ids
+
+    def iter_applied_jobs(self, sort_by: str | None = None, descending: bool = False, filters: dict | None = None, cursor: str | None = None, limit: int = 100) -> Iterator[tuple[str, dict]]:
+        self.flush()
+        position = decode_cursor(cursor) if cursor else None
+        with open(file_name, 'r', encoding='utf-8') as file:
+            # Rows are streamed, only sorting needs the (small) listing columns of matching rows in memory
+            jobs = ((index, {field: row.get(field) or "" for field in listing_fieldnames}) for index, row in enumerate(csv.DictReader(file)))
+            jobs = ((index, job) for index, job in jobs if matches_filters(job, filters))
+            if sort_by:
+                jobs = sorted(jobs, key=lambda item: (item[1][sort_by].casefold(), item[0]), reverse=descending)
+            elif descending:
+                jobs = reversed(list(jobs))
+            count = 0
+            for index, job in jobs:
+                key = [job[sort_by].casefold(), index] if sort_by else [index]
+                if position is not None and (key <= position if not descending else key >= position): continue
+                yield encode_cursor(key), job
+                count += 1
+                if count >= limit: break
+
+
+    def update_date_applied(self, job_ids: list[str], date_applied: str | None = None) -> list[str]:
+        self.flush()
+        return update_csv_date_applied(file_name, job_ids, date_applied or now_text())
+
+
+    def _write_applied(self, rows: list[dict]) -> None:
+        append_csv_rows(file_name, applied_fieldnames, rows)
+
+    def _write_failed(self, rows: list[dict]) -> None:
+        append_csv_rows(failed_file_name, failed_fieldnames, rows)
+
+
+
+class SQLiteHistory(HistoryStore):
+    '''
+    Default history backend, stores history in a SQLite database at `db_path`.
+    * `applied_jobs` table has Job ID as primary key, `failed_jobs` table is indexed on (Job ID, Date Tried)
+    * If the database is newly created, existing history CSVs are imported once
+    '''
+    def __init__(self, db_path: str = history_db_path, batch_size: int = history_batch_size, export_csv: bool = history_export_csv) -> None:
+        super().__init__(batch_size, export_csv)
+        self.db_path = db_path
+        is_new = not os.path.exists(db_path)
+        self.connection = sqlite3.connect(db_path, timeout=10, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.create_tables()
+        if is_new: self.import_csv(file_name, failed_file_name)
+
+
+    def create_tables(self) -> None:
+        '''
+        Creates `applied_jobs` and `failed_jobs` tables and their indexes if missing
+        '''
+        applied_definition = ", ".join(f"{column} TEXT" for column in applied_columns[1:])
+        failed_definition = ", ".join(f"{column} TEXT" for column in failed_columns[1:])
+        with self.lock, self.connection:
+            self.connection.execute(f"CREATE TABLE IF NOT EXISTS applied_jobs (job_id TEXT PRIMARY KEY, {applied_definition})")
+            self.connection.execute(f"CREATE TABLE IF NOT EXISTS failed_jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, job_id TEXT, {failed_definition})")
+            self.connection.execute("CREATE UNIQUE INDEX IF NOT EXISTS failed_jobs_attempt ON failed_jobs (job_id, date_tried)")
+            for field in sortable_fieldnames:
+                column = to_column(field)
+                self.connection.execute(f"CREATE INDEX IF NOT EXISTS applied_jobs_{column} ON applied_jobs ({column} COLLATE NOCASE)")
+
+
+    def import_csv(self, applied_path: str | None = file_name, failed_path: str | None = failed_file_name) -> tuple[int, int]:
+        '''
+        Imports rows from existing applied and failed history CSVs, skips files that don't exist.
+        * Already imported rows are not duplicated, so it's safe to run again
+        * Returns a tuple of (applied rows imported, failed rows imported)
+        '''
+        applied = read_csv_rows(applied_path, applied_fieldnames) if applied_path else []
+        failed = read_csv_rows(failed_path, failed_fieldnames) if failed_path else []
+        with self.lock:
+            if applied: self._write_applied(applied, "INSERT OR IGNORE")
+            if failed: self._write_failed(failed)
+            if self._applied_ids is not None:
+                self._applied_ids.update(str(row['Job ID']) for row in applied)
+        return len(applied), len(failed)
+
+
+    def export_csv_file(self, path: str = file_name) -> int:
+        '''
+        Writes the complete applied history to a CSV at `path`, returns the number of rows written
+        '''
+        self.flush()
+        count = 0
+        with self.lock, open(path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(applied_fieldnames)
+            for row in self.connection.execute(f"SELECT {', '.join(applied_columns)} FROM applied_jobs ORDER BY rowid"):
+                writer.writerow(row)
+                count += 1
+        return count
+
+
+    def iter_applied_jobs(self, sort_by: str | None = None, descending: bool = False, filters: dict | None = None, cursor: str | None = None, limit: int = 100) -> Iterator[tuple[str, dict]]:
+        self.flush()
+        conditions, params = sql_filters(filters)
+        direction, comparison = ("DESC", "<") if descending else ("ASC", ">")
+        sort_column = f"{to_column(sort_by)} COLLATE NOCASE" if sort_by else None
+        if cursor:
+            position = decode_cursor(cursor)
+            if sort_column:
+                conditions.append(f"({sort_column} {comparison} ? OR ({sort_column} = ? AND rowid {comparison} ?))")
+                params += [position[0], position[0], position[1]]
+            else:
+                conditions.append(f"rowid {comparison} ?")
+                params.append(position[0])
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        order = f"{sort_column} {direction}, rowid {direction}" if sort_column else f"rowid {direction}"
+        query = f"SELECT rowid, {', '.join(to_column(field) for field in listing_fieldnames)} FROM applied_jobs {where} ORDER BY {order} LIMIT ?"
+        # Own connection, so a slow reader (like a streamed HTTP response) never holds up the bot's writes
+        connection = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            for row in connection.execute(query, params + [limit]):
+                job = dict(zip(listing_fieldnames, row[1:]))
+                key = [job[sort_by], row[0]] if sort_by else [row[0]]
+                yield encode_cursor(key), job
+        finally:
+            connection.close()
+
+
+    def update_date_applied(self, job_ids: list[str], date_applied: str | None = None) -> list[str]:
+        # Primary key lookups, only the affected rows are touched. SQLite locking keeps it safe while the bot writes.
+        self.flush()
+        date_applied = date_applied or now_text()
+        updated = []
+        with self.lock, self.connection:
+            for job_id in dict.fromkeys(job_ids):
+                if self.connection.execute("UPDATE applied_jobs SET date_applied = ? WHERE job_id = ?", (date_applied, job_id)).rowcount:
+                    updated.append(job_id)
+        # The exported CSV is patched too, so it doesn't go stale
+        if updated and self.export_csv and os.path.exists(file_name):
+            update_csv_date_applied(file_name, updated, date_applied)
+        return updated
+
+
+    def close(self) -> None:
+        super().close()
+        try:
+            self.connection.close()
+        except Exception:
+            pass
+
+
+    def _load_applied_ids(self) -> set[str]:
+        # Served from the primary key index, "About Job" and other large columns are never read
+        return {row[0] for row in self.connection.execute("SELECT job_id FROM applied_jobs")}
+
+    def _write_applied(self, rows: list[dict], verb: str = "INSERT OR REPLACE") -> None:
+        placeholders = ", ".join("?" for _ in applied_columns)
+        values = [tuple(to_text(row.get(field)) for field in applied_fieldnames) for row in rows]
+        with self.connection:
+            self.connection.executemany(f"{verb} INTO applied_jobs ({', '.join(applied_columns)}) VALUES ({placeholders})", values)
+
+    def _write_failed(self, rows: list[dict]) -> None:
+        placeholders = ", ".join("?" for _ in failed_columns)
+        values = [tuple(to_text(row.get(field)) for field in failed_fieldnames) for row in rows]
+        with self.connection:
+            self.connection.executemany(f"INSERT OR IGNORE INTO failed_jobs ({', '.join(failed_columns)}) VALUES ({placeholders})", values)
+
+
+
+def open_history(backend: str = history_backend) -> HistoryStore:
+    '''
+    Returns a history store for the given `backend`, either `"sqlite"` or `"csv"`
+    '''
+    if backend.lower() == "csv":
+        return CSVHistory()
+    if backend.lower() == "sqlite":
+        return SQLiteHistory()
+    raise ValueError(f'Unknown history backend "{backend}"! Valid options are "sqlite" or "csv".')
+#>
+
+
+
+#< CSV utilities
+def to_text(value) -> str:
+    '''
+    Converts `value` to text the same way `csv.writer` does, `None` becomes `""`
+    '''
+    return "" if value is None else str(value)
+
+
+def now_text() -> str:
+    '''
+    Returns current date and time as `YYYY-MM-DD HH:MM:SS`
+    '''
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+@contextmanager
+def locked(path: str) -> Iterator[None]:
+    '''
+    Holds an exclusive lock on `path` (using a `.lock` file next to it) across processes, for the duration of the `with` block
+    '''
+    with open(path + ".lock", 'a+') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def append_csv_rows(path: str, fieldnames: list[str], rows: list[dict]) -> None:
+    '''
+    Appends `rows` to the CSV at `path` with a single open, writes header if the file is new or empty
+    '''
+    with locked(path), open(path, 'a', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=fieldnames, extrasaction='ignore')
+        if file.tell() == 0: writer.writeheader()
+        writer.writerows(rows)
+
+
+def update_csv_date_applied(path: str, job_ids: list[str], date_applied: str) -> list[str]:
+    '''
+    Sets "Date Applied" of the rows of `job_ids` in the applied history CSV at `path`, returns the Job IDs that were found.
+    * CSV can't be updated in place, so the file is rewritten. It's locked to not lose rows the bot appends meanwhile.
+    '''
+    job_ids = set(job_ids)
+    updated = []
+    with locked(path):
+        with open(path, 'r', newline='', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            fieldnames = reader.fieldnames
+            rows = list(reader)
+        for row in rows:
+            if row['Job ID'] in job_ids:
+                row['Date Applied'] = date_applied
+                updated.append(row['Job ID'])
+        if updated:
+            temp_path = path + ".tmp"
+            with open(temp_path, 'w', newline='', encoding='utf-8') as file:
+                writer = csv.DictWriter(file, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(rows)
+            os.replace(temp_path, path)
+    return updated
+
+
+def encode_cursor(key: list) -> str:
+    '''
+    Encodes a listing position `key` to an opaque URL safe cursor string
+    '''
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> list:
+    '''
+    Decodes a cursor from `encode_cursor()`, raises `ValueError` if it's invalid
+    '''
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception:
+        raise ValueError(f'Invalid cursor "{cursor}"')
+    if not isinstance(key, list) or not key: raise ValueError(f'Invalid cursor "{cursor}"')
+    return key
+
+
+def is_date(value: str) -> bool:
+    '''
+    Returns `True` if `value` starts like a `YYYY-MM-DD` date, "Pending" and other placeholders return `False`
+    '''
+    return len(value) >= 10 and value[:4].isdigit()
+
+
+def matches_filters(job: dict, filters: dict | None) -> bool:
+    '''
+    Python version of `sql_filters()`, returns `True` if listing `job` matches all `filters`
+    '''
+    if not filters: return True
+    for key, field in (("company", "Company"), ("title", "Title")):
+        if filters.get(key) and filters[key].casefold() not in job[field].casefold(): return False
+    date_applied = job["Date Applied"]
+    if filters.get("date_from") and not (is_date(date_applied) and date_applied[:10] >= filters["date_from"]): return False
+    if filters.get("date_to") and not (is_date(date_applied) and date_applied[:10] <= filters["date_to"]): return False
+    return True
+
+
+def sql_filters(filters: dict | None) -> tuple[list[str], list]:
+    '''
+    Converts listing `filters` to a tuple of (SQL conditions, parameters) for `applied_jobs` table
+    '''
+    conditions, params = [], []
+    if not filters: return conditions, params
+    for key in ("company", "title"):
+        if filters.get(key):
+            escaped = filters[key].replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            conditions.append(f"{key} LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+    if filters.get("date_from") or filters.get("date_to"):
+        conditions.append("date_applied GLOB '[0-9][0-9][0-9][0-9]-*'")
+    if filters.get("date_from"):
+        conditions.append("substr(date_applied, 1, 10) >= ?")
+        params.append(filters["date_from"])
+    if filters.get("date_to"):
+        conditions.append("substr(date_applied, 1, 10) <= ?")
+        params.append(filters["date_to"])
+    return conditions, params
+
+
+def read_csv_rows(path: str, fieldnames: list[str]) -> list[dict]:
+    '''
+    Reads all rows of CSV at `path` as `dict`s, returns `[]` if the file doesn't exist.
+    * Header row is used if present, else `fieldnames` are assumed
+    '''
+    if not os.path.exists(path): return []
+    with open(path, 'r', newline='', encoding='utf-8') as file:
+        first_line = file.readline()
+        file.seek(0)
+        has_header = first_line.startswith(fieldnames[0])
+        reader = csv.DictReader(file) if has_header else csv.DictReader(file, fieldnames=fieldnames)
+        return [row for row in reader if row.get('Job ID')]
+#>
+
+
+
+#< Command line
+def main() -> None:
+    '''
+    Command line to migrate history CSVs to SQLite or export SQLite history back to CSV.
+    * `python -m modules.history migrate [--applied PATH] [--failed PATH]`
+    * `python -m modules.history export [--output PATH]`
+    '''
+    parser = argparse.ArgumentParser(prog="python -m modules.history", description="Manage applied and failed jobs history.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    migrate = commands.add_parser("migrate", help=f'Import history CSVs into "{history_db_path}"')
+    migrate.add_argument("--applied", default=file_name, help="Applied jobs history CSV")
+    migrate.add_argument("--failed", default=failed_file_name, help="Failed jobs history CSV")
+    export = commands.add_parser("export", help="Export applied jobs history to a CSV")
+    export.add_argument("--output", default=file_name, help="CSV file to write")
+    args = parser.parse_args()
+
+    store = SQLiteHistory(export_csv=False)
+    if args.command == "migrate":
+        applied, failed = store.import_csv(args.applied, args.failed)
+        print(f'Imported {applied} applied and {failed} failed job rows into "{history_db_path}"')
+    else:
+        count = store.export_csv_file(args.output)
+        print(f'Exported {count} applied job rows to "{args.output}"')
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
+#>
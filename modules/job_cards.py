@@ -0,0 +1,116 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import WebDriverException
+
+
+
+job_card_xpath = "//li[@data-occludable-job-id]"
+'''
+XPath of the job cards in the search results list
+'''
+
+__job_cards_script = '''
+const done = arguments[arguments.length - 1];
+const deadline = performance.now() + arguments[0];
+const nextFrame = () => new Promise(resolve => requestAnimationFrame(() => setTimeout(resolve, 0)));
+const text = (element) => element ? element.innerText.trim() : "";
+(async () => {
+    const cards = [];
+    for (const item of document.querySelectorAll("li[data-occludable-job-id]")) {
+        let link = item.querySelector("a");
+        if (!link) {
+            // Occluded cards are rendered only once they are scrolled into view
+            item.scrollIntoView({ block: "center" });
+            while (!(link = item.querySelector("a")) && performance.now() < deadline) await nextFrame();
+        }
+        cards.push({
+            element: item,
+            link: link,
+            jobId: item.getAttribute("data-occludable-job-id"),
+            title: text(link).split("\\n")[0].trim(),
+            subtitle: text(item.querySelector(".artdeco-entity-lockup__subtitle")),
+            state: text(item.querySelector(".job-card-container__footer-job-state"))
+        });
+    }
+    done(cards);
+})().catch(error => done({ error: String(error) }));
+'''
+'''
+Returns the details of all job cards of the page, waits up to `arguments[0]` milliseconds in all for occluded cards to render
+'''
+
+
+
+def parse_subtitle(subtitle: str) -> tuple[str, str, str]:
+    '''
+    Splits a job card subtitle like `"Company · City, State (Hybrid)"` into `(company, work_location, work_style)`
+    '''
+    index = subtitle.find(' · ')
+    company = subtitle[:index]
+    work_location = subtitle[index+3:]
+    work_style = work_location[work_location.rfind('(')+1:work_location.rfind(')')]
+    work_location = work_location[:work_location.rfind('(')].strip()
+    return company, work_location, work_style
+
+
+def make_job_card(element: WebElement, link: WebElement | None, job_id: str, title: str, subtitle: str, state: str) -> dict:
+    company, work_location, work_style = parse_subtitle(subtitle)
+    return {
+        "element": element, "link": link, "job_id": job_id, "title": title, "company": company,
+        "work_location": work_location, "work_style": work_style, "applied": state == "Applied"
+    }
+
+
+def get_job_cards(driver: WebDriver, render_timeout_ms: int = 5000) -> list[dict]:
+    '''
+    Returns all job cards of the current search results page, read in one call to the browser.
+    * Each card is a `dict` of `element`, `link` (the `WebElement` to click), `job_id`, `title`, `company`,
+      `work_location`, `work_style` and `applied` (`True` if LinkedIn shows it as applied)
+    * Occluded cards are waited on for `render_timeout_ms` in all, well under the driver's 30 seconds script timeout.
+      `link` is `None` for cards that didn't render in time, use `read_job_card()` for them
+    * LinkedIn empties cards again once they are scrolled out of view, so `link` may go stale, use `find_job_card()` then
+    '''
+    cards = driver.execute_async_script(__job_cards_script, render_timeout_ms)
+    if isinstance(cards, dict): raise WebDriverException(f"Failed to read job cards! {cards.get('error')}")
+    return [make_job_card(card["element"], card["link"], card["jobId"], card["title"], card["subtitle"], card["state"]) for card in cards]
+
+
+def read_job_card(element: WebElement) -> dict:
+    '''
+    Reads a single job card `element` element by element, used for cards that weren't rendered during `get_job_cards()`
+    '''
+    link = element.find_element(By.TAG_NAME, 'a')  # job.find_element(By.CLASS_NAME, "job-card-list__title")  # Problem in India
+    title = link.text.split("\n")[0].strip()
+    subtitle = element.find_element(By.CLASS_NAME, 'artdeco-entity-lockup__subtitle').text
+    try:    state = element.find_element(By.CLASS_NAME, "job-card-container__footer-job-state").text
+    except: state = ""
+    return make_job_card(element, link, element.get_dom_attribute('data-occludable-job-id'), title, subtitle, state)
+
+
+def find_job_card(driver: WebDriver, job_id: str, timeout: float = 2) -> WebElement:
+    '''
+    Finds the card of `job_id` again, scrolled into view and rendered, for when the elements read before went stale
+    '''
+    element = driver.find_element(By.XPATH, f"//li[@data-occludable-job-id='{job_id}']")
+    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+    WebDriverWait(driver, timeout).until(lambda driver: element.find_element(By.TAG_NAME, 'a'))
+    return element
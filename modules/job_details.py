@@ -0,0 +1,133 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+from datetime import datetime
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from config.settings import job_details_batch_size
+from modules.helpers import print_lg
+
+
+
+job_details_script = '''
+const done = arguments[arguments.length - 1];
+const [jobIds, timeoutMs, batchSize, budgetMs] = [arguments[0], arguments[1], arguments[2], arguments[3]];
+const deadline = performance.now() + budgetMs;
+const csrf = ((document.cookie.match(/JSESSIONID="?([^";]+)/) || [])[1]) || "";
+const profiles = (value, found = new Map()) => {
+    // Hiring team members are mini profiles somewhere in the posting's hiring team, wherever LinkedIn puts them
+    if (!value || typeof value !== "object") return found;
+    if (value.publicIdentifier && value.firstName !== undefined) found.set(value.publicIdentifier, value);
+    for (const child of Object.values(value)) profiles(child, found);
+    return found;
+};
+const fetchJob = async (jobId) => {
+    const controller = new AbortController();
+    const timer = setTimeout(() => controller.abort(), timeoutMs);
+    try {
+        const response = await fetch(`/voyager/api/jobs/jobPostings/${jobId}?decorationId=com.linkedin.voyager.deco.jobs.web.shared.WebFullJobPosting-65`, {
+            headers: { "csrf-token": csrf, "accept": "application/json", "x-restli-protocol-version": "2.0.0" },
+            credentials: "include", signal: controller.signal
+        });
+        if (!response.ok) return { jobId: jobId, error: `HTTP ${response.status}` };
+        const posting = await response.json();
+        const details = Object.values(posting.companyDetails || {})[0] || {};
+        const company = details.companyResolutionResult || details.company || {};
+        return {
+            jobId: jobId,
+            title: posting.title || null,
+            description: (posting.description || {}).text || null,
+            company: company.name || details.companyName || null,
+            aboutCompany: company.description || null,
+            listedAt: posting.listedAt || null,
+            reposted: Boolean(posting.repostedJob),
+            hirers: [...(posting.hiringTeam ? profiles(posting.hiringTeam) : new Map()).values()].map(profile => ({
+                name: `${profile.firstName || ""} ${profile.lastName || ""}`.trim(),
+                link: `https://www.linkedin.com/in/${profile.publicIdentifier}`
+            }))
+        };
+    } catch (error) {
+        return { jobId: jobId, error: String(error) };
+    } finally {
+        clearTimeout(timer);
+    }
+};
+const fetchAll = async () => {
+    // A few at a time, a burst of requests for a whole page looks like scraping
+    const results = [];
+    for (let start = 0; start < jobIds.length; start += batchSize) {
+        const batch = jobIds.slice(start, start + batchSize);
+        if (performance.now() + timeoutMs > deadline) results.push(...batch.map(jobId => ({ jobId: jobId, error: "Out of time" })));
+        else results.push(...await Promise.all(batch.map(fetchJob)));
+    }
+    return results;
+};
+fetchAll().then(done, error => done({ error: String(error) }));
+'''
+'''
+Fetches the postings of `arguments[0]` job IDs from the logged in page, `arguments[2]` at a time, waits up to `arguments[1]` milliseconds for each.
+Batches that can't finish in `arguments[3]` milliseconds aren't fetched.
+'''
+
+
+
+class JobDetails:
+    '''
+    Details of a job from LinkedIn's API, so they aren't read from the page.
+    Fields LinkedIn didn't send are `None` (`hirers` empty), then they are read from the page as before.
+    '''
+    def __init__(self, job_id: str, title: str | None = None, description: str | None = None, company: str | None = None,
+                 about_company: str | None = None, listed_at: datetime | None = None, reposted: bool = False,
+                 hirers: list[tuple[str, str]] | None = None, error: str | None = None) -> None:
+        self.job_id = job_id
+        self.title = title
+        self.description = description
+        self.company = company
+        self.about_company = about_company
+        self.listed_at = listed_at
+        self.reposted = reposted
+        self.hirers = hirers or []
+        self.error = error
+
+
+    def __repr__(self) -> str:
+        return f"JobDetails({self.job_id!r}, description={self.description is not None}, hirers={len(self.hirers)}, error={self.error!r})"
+
+
+
+def fetch_job_details(driver: WebDriver, job_ids: list[str], timeout_ms: int = 10000, batch_size: int = job_details_batch_size, budget_ms: int = 25000) -> dict[str, JobDetails]:
+    '''
+    Returns details of `job_ids` by Job ID, fetched `batch_size` at a time in one call to the browser.
+    Jobs that failed or didn't fit in `budget_ms` are left out, they are read from the page. Keep `budget_ms` under the driver's script timeout (30 seconds by default).
+    '''
+    if not job_ids: return {}
+    results = driver.execute_async_script(job_details_script, list(job_ids), timeout_ms, max(batch_size, 1), budget_ms)
+    if isinstance(results, dict):
+        print_lg("Failed to fetch job details!", results.get("error"))
+        return {}
+    details = {}
+    for result in results:
+        if result.get("error"):
+            print_lg(f"Couldn't fetch details of job {result['jobId']}, reading it from the page.", result["error"])
+            continue
+        details[result["jobId"]] = JobDetails(
+            result["jobId"], result["title"], result["description"], result["company"], result["aboutCompany"],
+            datetime.fromtimestamp(result["listedAt"] / 1000) if result["listedAt"] else None, result["reposted"],
+            [(hirer["name"], hirer["link"]) for hirer in result["hirers"]]
+        )
+    return details
@@ -0,0 +1,132 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+from collections import deque
+from typing import Iterable, Iterator
+
+
+
+class KeywordMatcher:
+    '''
+    Aho-Corasick automaton that finds all of its keywords in a text in a single pass, however many keywords there are.
+    * Matches are substrings like `keyword in text`, overlapping keywords are all found
+    * With `whole_words = True` keywords only match as whole words and phrases, "QA" isn't found in "aQAb".
+      Only ends of a keyword that are letters or digits need a boundary, so ".NET" is found in "ASP.NET" but not in "dotnet".
+      A keyword may still end in one of `suffixes`, with `suffixes = noun_suffixes` "US Citizen" is found in "US Citizenship" and "US Citizens"
+    * Case-insensitive unless `ignore_case = False`
+    '''
+    def __init__(self, keywords: Iterable[str], ignore_case: bool = True, whole_words: bool = False, suffixes: Iterable[str] = ()) -> None:
+        self.ignore_case = ignore_case
+        self.whole_words = whole_words
+        self.suffixes = tuple(suffixes)
+        self.keywords: list[str] = []
+        self.transitions: list[dict[str, int]] = [{}]
+        self.fail: list[int] = [0]
+        self.outputs: list[list[int]] = [[]]
+        for keyword in dict.fromkeys(keywords):
+            if keyword: self.add(keyword)
+        self.build()
+
+
+    def add(self, keyword: str) -> None:
+        state = 0
+        for char in (keyword.lower() if self.ignore_case else keyword):
+            next_state = self.transitions[state].get(char)
+            if next_state is None:
+                next_state = len(self.transitions)
+                self.transitions[state][char] = next_state
+                self.transitions.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+            state = next_state
+        self.outputs[state].append(len(self.keywords))
+        self.keywords.append(keyword)
+
+
+    def build(self) -> None:
+        '''
+        Links every state to the longest proper suffix that's also a prefix of a keyword
+        '''
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.transitions[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.transitions[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.transitions[fallback].get(char, 0)
+                self.outputs[next_state] = self.outputs[next_state] + self.outputs[self.fail[next_state]]
+
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, str]]:
+        '''
+        Yields `(end, keyword)` for every keyword found in `text`, `end` is the index after the match
+        '''
+        state = 0
+        transitions, fail, outputs, keywords = self.transitions, self.fail, self.outputs, self.keywords
+        text = text.lower() if self.ignore_case else text
+        for index, char in enumerate(text):
+            while state and char not in transitions[state]:
+                state = fail[state]
+            state = transitions[state].get(char, 0)
+            for keyword_index in outputs[state]:
+                keyword = keywords[keyword_index]
+                if self.whole_words and not is_whole_word(text, index + 1 - len(keyword), index + 1, self.suffixes): continue
+                yield index + 1, keyword
+
+
+    def find_hits(self, text: str) -> list[tuple[int, int, str]]:
+        '''
+        Returns `(start, end, keyword)` of every keyword found in `text`, in order of `start`
+        '''
+        return sorted((end - len(keyword), end, keyword) for end, keyword in self.iter_matches(text))
+
+
+    def find_all(self, text: str) -> set[str]:
+        '''
+        Returns the set of keywords found in `text`
+        '''
+        return {keyword for _, keyword in self.iter_matches(text)}
+
+
+    def first_match(self, text: str) -> str | None:
+        '''
+        Returns the keyword that ends first in `text`, `None` if there is none
+        '''
+        for _, keyword in self.iter_matches(text):
+            return keyword
+        return None
+
+
+
+noun_suffixes = ("s", "es", "ship", "ships")
+
+
+
+def is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def is_whole_word(text: str, start: int, end: int, suffixes: tuple[str, ...] = ()) -> bool:
+    '''
+    Returns `True` if `text[start:end]` isn't part of a longer word, other than the word followed by one of `suffixes`
+    '''
+    if is_word_char(text[start]) and start > 0 and is_word_char(text[start - 1]): return False
+    if is_word_char(text[end - 1]) and end < len(text) and is_word_char(text[end]):
+        return any(text.startswith(suffix, end) and not (end + len(suffix) < len(text) and is_word_char(text[end + len(suffix)])) for suffix in suffixes)
+    return True
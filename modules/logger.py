@@ -0,0 +1,207 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+import os
+import sys
+import json
+import atexit
+
+from time import time
+from queue import Queue, Empty
+from threading import Thread, Lock
+from datetime import datetime
+
+from config.settings import log_format, log_max_size_mb, log_rotate_hours, log_backup_count, log_queue_size
+
+
+
+log_levels = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+'''
+Log level names and their severity, a message is logged only if its level is at least `log_level` from settings
+'''
+
+
+
+class LogFile:
+    '''
+    An open log file that rotates by size and age.
+    * `max_bytes = 0` and `rotate_seconds = 0` disable size and time based rotation respectively
+    * Rotated files are renamed to `path.1`, `path.2`, ... up to `backup_count`
+    '''
+    def __init__(self, path: str, max_bytes: int, rotate_seconds: float, backup_count: int) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.rotate_seconds = rotate_seconds
+        self.backup_count = backup_count
+        # Logs left over from an older run are rotated right away once they are older than `rotate_seconds`
+        if rotate_seconds and os.path.exists(path) and time() - os.path.getmtime(path) >= rotate_seconds:
+            self.rotate_files()
+        self.open()
+
+
+    def open(self) -> None:
+        '''
+        Opens the log file for appending with a large write buffer
+        '''
+        self.file = open(self.path, 'a', encoding="utf-8", buffering=64 * 1024)
+        self.size = self.file.tell()
+        self.rotate_at = time() + self.rotate_seconds if self.rotate_seconds else None
+
+
+    def write(self, text: str) -> None:
+        '''
+        Writes `text`, rotates the file first if it's too big or too old
+        '''
+        if (self.max_bytes and self.size + len(text) > self.max_bytes and self.size > 0) or (self.rotate_at and time() >= self.rotate_at):
+            self.file.close()
+            self.rotate_files()
+            self.open()
+        self.file.write(text)
+        self.size += len(text)
+
+
+    def rotate_files(self) -> None:
+        '''
+        Shifts `path.N` to `path.N+1` and `path` to `path.1`, the oldest file beyond `backup_count` is deleted
+        '''
+        if self.backup_count <= 0:
+            os.remove(self.path)
+            return
+        for number in range(self.backup_count - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{number}"):
+                os.replace(f"{self.path}.{number}", f"{self.path}.{number + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+
+class LogWriter(Thread):
+    '''
+    Background thread that writes log messages to files.
+    * Each log file is opened once and kept open, writes are buffered and flushed when the queue goes idle
+    * The queue is bounded by `queue_size`, callers wait when it's full instead of using unlimited memory
+    * Writes plain text lines or JSON lines (`{"time", "level", "message"}`) as per `json_lines`
+    '''
+    def __init__(self, queue_size: int = log_queue_size, json_lines: bool = log_format == "json", max_bytes: int = int(log_max_size_mb * 1024 * 1024),
+                 rotate_seconds: float = log_rotate_hours * 3600, backup_count: int = log_backup_count, flush_interval: float = 1.0) -> None:
+        super().__init__(name="LogWriter", daemon=True)
+        self.queue: Queue = Queue(maxsize=max(1, queue_size))
+        self.json_lines = json_lines
+        self.max_bytes = max_bytes
+        self.rotate_seconds = rotate_seconds
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+        self.files: dict[str, LogFile] = {}
+        self.failed_paths: set[str] = set()
+        self.closed = False
+
+
+    def write(self, path: str, level: str, message: str, end: str = "\n", timestamp: bool = False) -> None:
+        '''
+        Queues `message` to be written to the log file at `path`.
+        * `timestamp = True` prefixes text lines with `[YYYY-MM-DD HH:MM:SS]`
+        '''
+        if self.closed: return
+        self.queue.put((path, datetime.now(), level, message, end, timestamp))
+
+
+    def format(self, created: datetime, level: str, message: str, end: str, timestamp: bool) -> str:
+        '''
+        Formats a queued message to the text written in the log file
+        '''
+        if self.json_lines:
+            return json.dumps({"time": created.isoformat(timespec="milliseconds"), "level": level, "message": message}, ensure_ascii=False) + "\n"
+        if timestamp:
+            return f"[{created.strftime('%Y-%m-%d %H:%M:%S')}] {message}{end}"
+        return message + end
+
+
+    def get_file(self, path: str) -> LogFile | None:
+        '''
+        Returns the open `LogFile` for `path`, opens it if needed. Returns `None` if it can't be opened.
+        '''
+        log_file = self.files.get(path)
+        if log_file is None and path not in self.failed_paths:
+            try:
+                log_file = self.files[path] = LogFile(path, self.max_bytes, self.rotate_seconds, self.backup_count)
+            except Exception as e:
+                self.failed_paths.add(path)
+                print(f'Failed to open log file "{path}", messages for it will only be printed! {e}', file=sys.stderr)
+        return log_file
+
+
+    def run(self) -> None:
+        while True:
+            try:
+                item = self.queue.get(timeout=self.flush_interval)
+            except Empty:
+                self.flush()
+                continue
+            if item is None:
+                break
+            path, created, level, message, end, timestamp = item
+            log_file = self.get_file(path)
+            if log_file is None: continue
+            try:
+                log_file.write(self.format(created, level, message, end, timestamp))
+            except Exception as e:
+                print(f'Failed to write to log file "{path}"! {e}', file=sys.stderr)
+        self.flush()
+        for log_file in self.files.values():
+            log_file.close()
+
+
+    def flush(self) -> None:
+        for log_file in self.files.values():
+            try:
+                log_file.flush()
+            except Exception as e:
+                print(f'Failed to flush log file "{log_file.path}"! {e}', file=sys.stderr)
+
+
+    def close(self) -> None:
+        '''
+        Writes all queued messages, closes log files and stops the thread
+        '''
+        if self.closed: return
+        self.closed = True
+        self.queue.put(None)
+        self.join(timeout=10)
+
+
+
+__writer: LogWriter | None = None
+__writer_lock = Lock()
+
+def get_log_writer() -> LogWriter:
+    '''
+    Returns the shared `LogWriter`, starts it on first use
+    '''
+    global __writer
+    if __writer is None:
+        with __writer_lock:
+            if __writer is None:
+                __writer = LogWriter()
+                __writer.start()
+                atexit.register(__writer.close)
+    return __writer
@@ -6,39 +6,69 @@ Copyright (C) 2024 Sai Vignesh Golla
 '''
 
 import os
+from threading import RLock
+from urllib.request import urlopen
+from typing import Any, Callable
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.action_chains import ActionChains
-from webdriver_manager.chrome import ChromeDriverManager
 from config.settings import (
-    run_in_background, disable_extensions, safe_mode, 
-    downloads_path
+    run_in_background, disable_extensions, safe_mode,
+    downloads_path, chrome_debugger_port, chrome_profile_path
 )
 from modules.helpers import print_lg
+from modules.chromedriver import resolve_chromedriver
+from modules.resources import prepare_page_metrics
 
-def open_chrome():
-    """Initialize Chrome browser using webdriver_manager"""
+def attach_chrome(port: int) -> WebDriver | None:
+    """Attaches to a Chrome already running with `--remote-debugging-port={port}`, returns None if there is none"""
+    try:
+        # Chromedriver waits a long time for a Chrome that isn't there, so check it's listening first
+        with urlopen(f"http://127.0.0.1:{port}/json/version", timeout=1) as response: response.read()
+    except Exception:
+        print_lg(f"No Chrome to attach to on port {port}, starting a new one...")
+        return None
+    options = webdriver.ChromeOptions()
+    options.debugger_address = f"127.0.0.1:{port}"
+    try:
+        driver = webdriver.Chrome(service=Service(resolve_chromedriver()), options=options)
+        driver.current_window_handle  # Fails if Chrome isn't running
+        prepare_page_metrics(driver)
+        print_lg(f"Attached to Chrome running on port {port}")
+        return driver
+    except Exception as e:
+        print_lg(f"No Chrome to attach to on port {port}, starting a new one...")
+        return None
+
+def open_chrome(debugger_port: int = 0):
+    """Initialize Chrome browser, kept running on `debugger_port` after the bot exits if it's not 0"""
     try:
         # Set up Chrome options
         options = webdriver.ChromeOptions()
-        
+
         # Basic options for stability
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
-        
+
         if run_in_background:
             options.add_argument("--headless=new")
             options.add_argument("--window-size=1920,1080")
-        
+
         if disable_extensions:
             options.add_argument('--disable-extensions')
-            
-        if safe_mode:
+
+        if debugger_port:
+            # A profile of its own keeps the login for the next start, guest mode would forget it
+            options.add_argument(f"--remote-debugging-port={debugger_port}")
+            options.add_argument(f"--user-data-dir={os.path.abspath(chrome_profile_path)}")
+            options.add_experimental_option("detach", True)
+        elif safe_mode:
             options.add_argument('--guest')
-        
+
         # Set up downloads directory and other preferences
         prefs = {
             "download.default_directory": downloads_path,
@@ -51,30 +81,64 @@ def open_chrome():
         options.add_experimental_option("prefs", prefs)
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
-        
-        # Use webdriver_manager to handle chromedriver
-        service = Service(ChromeDriverManager().install())
+
+        service = Service(resolve_chromedriver())
         driver = webdriver.Chrome(service=service, options=options)
-        
-        # Set up common driver utilities
+
         driver.maximize_window()
-        wait = WebDriverWait(driver, 5)
-        actions = ActionChains(driver)
-        
+        prepare_page_metrics(driver)
+
         print_lg("Chrome started successfully")
         return driver
     except Exception as e:
         print_lg(f"Error starting Chrome: {str(e)}")
         return None
 
-# Initialize the WebDriver instance
-try:
-    driver = open_chrome()
+def start_chrome() -> WebDriver:
+    """Attaches to the Chrome kept running on `chrome_debugger_port`, or starts a new one"""
+    driver = attach_chrome(chrome_debugger_port) if chrome_debugger_port else None
+    if driver is None: driver = open_chrome(chrome_debugger_port)
     if driver is None:
         raise Exception("Failed to initialize Chrome")
-    wait = WebDriverWait(driver, 5)
-    actions = ActionChains(driver)
-except Exception as e:
-    print_lg(f"Failed to initialize Chrome: {str(e)}")
-    raise
+    return driver
+
+
+class Lazy:
+    """
+    Stands in for an object that's created by `create()` the first time it's used, like the `driver` that starts Chrome.
+    `created` tells if it was created, `instance()` returns it. (Not `get()`, that's `driver.get(url)`)
+    """
+    def __init__(self, create: Callable[[], Any]) -> None:
+        object.__setattr__(self, "_create", create)
+        object.__setattr__(self, "_value", None)
+        object.__setattr__(self, "_lock", RLock())
+
+    @property
+    def created(self) -> bool:
+        return self._value is not None
+
+    def instance(self) -> Any:
+        with self._lock:
+            if self._value is None:
+                object.__setattr__(self, "_value", self._create())
+            return self._value
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.instance(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.instance(), name, value)
+
+# Chrome is started the first time `driver`, `wait` or `actions` is used, not when this module is imported
+driver = Lazy(start_chrome)
+wait = Lazy(lambda: WebDriverWait(driver.instance(), 5))
+actions = Lazy(lambda: ActionChains(driver.instance()))
 
+def close_chrome() -> None:
+    """Quits Chrome if it was started, only stops chromedriver if Chrome is kept running on `chrome_debugger_port`"""
+    if not driver.created: return
+    if chrome_debugger_port:
+        driver.instance().service.stop()
+        print_lg(f"Chrome is kept running on port {chrome_debugger_port} for the next start")
+    else:
+        driver.instance().quit()
@@ -0,0 +1,100 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+from threading import RLock
+from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError
+from typing import Any, Callable, Iterable
+
+from modules.helpers import print_lg
+
+
+
+class PrefetchedJob:
+    '''
+    A job whose description was analyzed in the background.
+    * `analysis` is what the prefetcher's `analyze` function returned for `description`
+    * `error` is why it couldn't be analyzed
+    '''
+    def __init__(self, job_id: str, description: str | None = None, analysis: Any = None, error: Exception | None = None) -> None:
+        self.job_id = job_id
+        self.description = description
+        self.analysis = analysis
+        self.error = error
+
+
+    def __repr__(self) -> str:
+        return f"PrefetchedJob({self.job_id!r}, analyzed={self.error is None}, error={self.error!r})"
+
+
+
+class JobPrefetcher:
+    '''
+    Analyzes descriptions of upcoming jobs on a pool of `workers` threads,
+    so the bot can skip irrelevant jobs without opening them and doesn't wait for the analysis of the rest.
+    * Descriptions come from `fetch_job_details()` of `modules/job_details.py`, the prefetcher doesn't download anything
+    * `analyze(description)` runs on the worker threads, it must not use the browser
+    * `get()` waits only `ready_wait` seconds for a job that isn't ready
+    '''
+    def __init__(self, analyze: Callable[[str], Any], workers: int = 3, ready_wait: float = 0.3) -> None:
+        self.analyze = analyze
+        self.ready_wait = ready_wait
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+        self.jobs: dict[str, Future] = {}
+        self.lock = RLock()
+
+
+    def prefetch(self, descriptions: Iterable[tuple[str, str]]) -> None:
+        '''
+        Starts analyzing `(job_id, description)` of `descriptions` that aren't already started
+        '''
+        with self.lock:
+            for job_id, description in descriptions:
+                if job_id and description and job_id not in self.jobs:
+                    self.jobs[job_id] = self.executor.submit(self.run, job_id, description)
+
+
+    def run(self, job_id: str, description: str) -> PrefetchedJob:
+        try:
+            return PrefetchedJob(job_id, description, self.analyze(description))
+        except Exception as e:
+            print_lg(f"Failed to analyze prefetched job {job_id}!", e)
+            return PrefetchedJob(job_id, description, error=e)
+
+
+    def get(self, job_id: str, wait: float | None = None) -> PrefetchedJob | None:
+        '''
+        Returns the prefetched job, waits up to `wait` seconds (`ready_wait` by default) if it's still being analyzed.
+        `None` if it wasn't prefetched, isn't ready or failed, then its description has to be analyzed on the apply loop.
+        That's about as fast as waiting for a busy worker, so the apply loop is never held up.
+        '''
+        with self.lock:
+            future = self.jobs.pop(job_id, None)
+        if future is None: return None
+        try:
+            job = future.result(self.ready_wait if wait is None else wait)
+        except TimeoutError:
+            print_lg(f"Job {job_id} isn't analyzed yet, analyzing it now.", level="DEBUG")
+            future.cancel()
+            return None
+        return job if job.error is None else None
+
+
+    def close(self) -> None:
+        with self.lock:
+            for future in self.jobs.values(): future.cancel()
+            self.jobs.clear()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,162 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+import numpy as np
+
+from threading import RLock
+
+from config.resume import skills, work_experience, projects, resume_headline
+from config.search import job_relevance_threshold, job_relevance_expected_skills
+from modules.keywords import KeywordMatcher
+
+
+
+def skill_variants(skill: str) -> list[str]:
+    '''
+    Returns the ways `skill` can be written in a job description, like "REST API" and "rest-apis" for "REST APIs".
+    "Agile/Scrum" is two alternatives, short ones like "CI/CD" are kept whole.
+    '''
+    skill = " ".join(skill.lower().split())
+    parts = skill.split("/")
+    alternatives = parts if len(parts) > 1 and all(len(part.strip()) > 2 for part in parts) else [skill]
+    variants = []
+    for alternative in alternatives:
+        alternative = alternative.strip()
+        for spelling in dict.fromkeys([alternative, alternative.replace(" ", "-"), alternative.replace(" ", "")]):
+            variants.append(spelling)
+            last_word = spelling.rsplit(" ", 1)[-1].rsplit("-", 1)[-1]
+            if not last_word.isalpha(): continue    # "Node.js", "C++" and "Python3" have no plural
+            if not last_word.endswith("s"): variants.append(spelling + "s")
+            elif len(last_word) > 3 and not last_word.endswith(("ss", "us")): variants.append(spelling[:-1])
+    return [variant for variant in dict.fromkeys(variants) if variant]
+
+
+
+class JobRelevance:
+    '''
+    How relevant a job description is to your resume skills.
+    * `score` is from 0 to 1, 1 when it mentions as many of your most important skills as `expected_skills`
+    * `matched` are your skills it mentions, most important first, `missing` are your top skills it doesn't
+    * `reasons` explain the score in words
+    '''
+    def __init__(self, score: float, matched: list[str], missing: list[str], reasons: list[str]) -> None:
+        self.score = score
+        self.matched = matched
+        self.missing = missing
+        self.reasons = reasons
+
+
+    def __repr__(self) -> str:
+        return f"JobRelevance({self.score:.2f}, matched={self.matched!r})"
+
+
+
+class RelevanceScorer:
+    '''
+    Scores job descriptions by the resume skills they mention, without AI.
+    * A description is vectorized into which of `skills` it mentions as whole words, then scored with the skill weights in one dot product
+    * A skill weighs more the more often your headline, work experience and projects mention it
+    * `score_batch()` scores a page of descriptions as one matrix, `score_page()` keeps their scores for `score()` to reuse
+    '''
+    max_scored = 200
+
+    def __init__(self, skills: list[str], resume_text: str = "", expected_skills: int = 5) -> None:
+        self.skills = list(dict.fromkeys(skill for skill in skills if skill.strip()))
+        self.variants: dict[str, int] = {}
+        for index, skill in enumerate(self.skills):
+            for variant in skill_variants(skill):
+                self.variants.setdefault(variant, index)
+        self.matcher = KeywordMatcher(self.variants, whole_words=True)
+        self.weights = 1 + np.log1p(self.vectorize(resume_text, counts=True)).astype(np.float32)
+        self.order = np.argsort(-self.weights, kind="stable")
+        self.expected_weight = float(self.weights[self.order[:max(expected_skills, 1)]].sum()) if self.skills else 0
+        self.scored: dict[str, JobRelevance] = {}
+        self.lock = RLock()
+
+
+    def vectorize(self, text: str, counts: bool = False) -> np.ndarray:
+        '''
+        Returns which skills `text` mentions as whole words, or how many times if `counts`
+        '''
+        vector = np.zeros(len(self.skills), dtype=np.float32)
+        for _, variant in self.matcher.iter_matches(text):
+            if counts: vector[self.variants[variant]] += 1
+            else: vector[self.variants[variant]] = 1
+        return vector
+
+
+    def score_batch(self, descriptions: list[str]) -> list[JobRelevance]:
+        '''
+        Returns the relevance of each of `descriptions`
+        '''
+        if not self.skills:
+            return [JobRelevance(1.0, [], [], ["No skills in config/resume.py to check relevance with"]) for _ in descriptions]
+        mentions = np.array([self.vectorize(description) for description in descriptions], dtype=np.float32).reshape(len(descriptions), len(self.skills))
+        scores = np.minimum(mentions @ self.weights / self.expected_weight, 1)
+        results = []
+        for row, score in zip(mentions, scores):
+            matched = [self.skills[index] for index in self.order if row[index]]
+            missing = [self.skills[index] for index in self.order[:3] if not row[index]]
+            reasons = [f"Mentions {len(matched)} of your {len(self.skills)} skills" + (f": {', '.join(matched)}" if matched else "")]
+            if missing: reasons.append(f"Doesn't mention your top skills: {', '.join(missing)}")
+            results.append(JobRelevance(float(score), matched, missing, reasons))
+        return results
+
+
+    def score_page(self, descriptions: list[str]) -> None:
+        '''
+        Scores the `descriptions` of a results page as one batch and keeps their scores, dropping the oldest beyond `max_scored`
+        '''
+        descriptions = [description for description in dict.fromkeys(descriptions) if description and description.strip()]
+        if not descriptions: return
+        relevances = self.score_batch(descriptions)
+        with self.lock:
+            self.scored.update(zip(descriptions, relevances))
+            for description in list(self.scored)[:max(len(self.scored) - self.max_scored, 0)]:
+                del self.scored[description]
+
+
+    def score(self, description: str) -> JobRelevance:
+        with self.lock:
+            relevance = self.scored.get(description)
+        return relevance or self.score_batch([description])[0]
+
+
+
+__scorer: RelevanceScorer | None = None
+__lock = RLock()
+
+def get_relevance_scorer() -> RelevanceScorer:
+    '''
+    Returns the shared scorer of your resume skills in `config/resume.py`
+    '''
+    global __scorer
+    with __lock:
+        if __scorer is None:
+            resume_text = "\n".join([resume_headline]
+                                    + [f"{job.get('title', '')} {job.get('description', '')}" for job in work_experience]
+                                    + [f"{project.get('description', '')} {project.get('skills_used', '')}" for project in projects])
+            __scorer = RelevanceScorer(skills, resume_text, job_relevance_expected_skills)
+        return __scorer
+
+
+def check_relevance(description: str) -> tuple[bool, JobRelevance]:
+    '''
+    Returns `(relevant, relevance)` of `description`, relevant if its score is at least `job_relevance_threshold`
+    '''
+    relevance = get_relevance_scorer().score(description)
+    return relevance.score >= job_relevance_threshold, relevance
@@ -0,0 +1,128 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+from threading import Lock
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from config.settings import block_resources, blocked_url_patterns
+from modules.helpers import print_lg
+from modules.tracing import tracer, percentile
+
+
+
+timing_buffer_script = "if (performance.setResourceTimingBufferSize) performance.setResourceTimingBufferSize(5000);"
+'''
+Keeps timings of up to 5000 resources in a page instead of 250, so none are missed before the page is first read
+'''
+
+page_metrics_script = '''
+const state = window.__autoApplierMetrics = window.__autoApplierMetrics || { readAt: -1 };
+let bytes = 0, requests = 0, loadMs = null;
+for (const entry of performance.getEntriesByType("resource")) {
+    if (entry.responseEnd <= state.readAt) continue;
+    bytes += entry.transferSize || 0;
+    requests += 1;
+}
+const navigation = performance.getEntriesByType("navigation")[0];
+if (state.readAt < 0 && navigation) {
+    bytes += navigation.transferSize || 0;
+    if (navigation.loadEventEnd) loadMs = navigation.loadEventEnd - navigation.startTime;
+}
+state.readAt = performance.now();
+return { bytes: bytes, requests: requests, load_ms: loadMs };
+'''
+'''
+Returns bytes transferred and requests made since it last ran in this page, and the load time if the page loaded since then
+'''
+
+
+
+def prepare_page_metrics(driver: WebDriver) -> None:
+    '''
+    Runs `timing_buffer_script` in every page `driver` opens from now on, before the page's own scripts
+    '''
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": timing_buffer_script})
+    except Exception as e:
+        print_lg("Failed to enlarge the resource timing buffer, bytes and requests of busy pages may be undercounted!", e)
+
+
+def apply_resource_policy(driver: WebDriver) -> None:
+    '''
+    Stops `driver` from loading `blocked_url_patterns` if `block_resources` is on, with the DevTools `Network.setBlockedURLs` command.
+    Apply it after login, so you can see the login and verification pages.
+    '''
+    if not block_resources or not blocked_url_patterns: return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_url_patterns})
+    except Exception as e:
+        print_lg("Failed to block images, fonts, videos and trackers, loading pages with them!", e)
+
+
+
+class PageMetrics:
+    '''
+    Page loads, load times, bytes transferred and requests of the whole run.
+    Bytes are what the Resource Timing API reports, resources of other sites that don't allow timing them count as 0.
+    '''
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.load_ms: list[float] = []
+        self.bytes = 0
+        self.requests = 0
+        self.jobs = 0
+
+
+    def read(self, driver: WebDriver) -> dict:
+        '''
+        Returns `{"bytes", "requests", "load_ms"}` of the current page since the last read, empty if it couldn't be read
+        '''
+        try:
+            metrics = driver.execute_script(page_metrics_script)
+        except Exception:
+            return {}
+        with self.lock:
+            self.bytes += metrics["bytes"]
+            self.requests += metrics["requests"]
+            if metrics["load_ms"] is not None: self.load_ms.append(metrics["load_ms"])
+        return metrics
+
+
+    def record_job(self, driver: WebDriver) -> None:
+        '''
+        Adds what the current page loaded since the last read to the current job's trace, call it before the job ends
+        '''
+        metrics = self.read(driver)
+        if not metrics or getattr(tracer.state, "job", None) is None: return
+        with self.lock: self.jobs += 1
+        tracer.update_job(bytes=metrics["bytes"], requests=metrics["requests"], **({"load_ms": round(metrics["load_ms"])} if metrics["load_ms"] is not None else {}))
+
+
+    def summary(self) -> str:
+        with self.lock:
+            loads = f"{len(self.load_ms)} page loads, p50 {percentile(self.load_ms, 50) / 1000:.2f}s, p95 {percentile(self.load_ms, 95) / 1000:.2f}s"
+            per_job = f", {self.bytes / self.jobs / 1024:.0f} KB per job" if self.jobs else ""
+            return f"{loads}, {self.bytes / 1024 / 1024:.1f} MB in {self.requests} requests{per_job}" + (" (resources blocked)" if block_resources else "")
+
+
+
+page_metrics = PageMetrics()
+'''
+Shared page metrics of the bot
+'''
@@ -0,0 +1,128 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+from typing import Any, Mapping
+
+from modules.keywords import KeywordMatcher
+
+
+
+rule_kinds = ["select", "radio", "text", "textarea"]
+'''
+Question kinds a rule can answer
+'''
+
+context_names = ["previous_answer", "work_location", "current_city_or_work_location"]
+'''
+Names a rule can `use` that depend on the question or job being answered, they are passed to `RuleEngine.answer()`
+'''
+
+
+
+class Rule:
+    '''
+    A compiled answer rule, see `answer_rules` in `config/questions.py` for the format.
+    * `groups` are sets of keywords, at least one keyword of every group must be in the label
+    * `excluded` keywords must not be in the label
+    '''
+    def __init__(self, rule: dict, index: int) -> None:
+        if not isinstance(rule, dict): raise TypeError(f"Answer rule #{index + 1} must be a dict! Received {rule!r}")
+        unknown = set(rule) - {"kinds", "any", "all", "none", "answer", "use", "autocomplete", "priority"}
+        if unknown: raise ValueError(f"Answer rule #{index + 1} has unknown keys {sorted(unknown)}!")
+        self.index = index
+        self.kinds = set(rule.get("kinds", rule_kinds))
+        if not self.kinds or self.kinds - set(rule_kinds): raise ValueError(f"Answer rule #{index + 1} has invalid kinds {rule.get('kinds')}! Expecting values from {rule_kinds}")
+        self.groups = [frozenset(normalize_label(keyword) for keyword in group) for group in ([rule["any"]] if rule.get("any") else []) + [
+            [keyword] if isinstance(keyword, str) else keyword for keyword in rule.get("all", [])
+        ]]
+        if not self.groups or not all(self.groups): raise ValueError(f'Answer rule #{index + 1} needs keywords in "any" or "all"!')
+        self.excluded = frozenset(normalize_label(keyword) for keyword in rule.get("none", []))
+        if ("answer" in rule) == ("use" in rule): raise ValueError(f'Answer rule #{index + 1} needs exactly one of "answer" or "use"!')
+        self.answer = rule.get("answer")
+        self.use = rule.get("use")
+        self.autocomplete = rule.get("autocomplete", False)
+        self.priority = rule.get("priority", 0)
+        if not isinstance(self.priority, int): raise TypeError(f'"priority" of answer rule #{index + 1} must be an Integer!')
+
+
+    def keywords(self) -> set[str]:
+        return set().union(*self.groups, self.excluded)
+
+
+    def matches(self, found: set[str]) -> bool:
+        '''
+        Returns `True` if this rule matches a label that has the keywords `found`
+        '''
+        return all(group & found for group in self.groups) and not (self.excluded & found)
+
+
+    def __repr__(self) -> str:
+        return f"Rule(#{self.index + 1}, kinds={sorted(self.kinds)}, groups={[sorted(group) for group in self.groups]})"
+
+
+
+class RuleEngine:
+    '''
+    Answers questions from a list of rules.
+    * All keywords of all rules are compiled into one `KeywordMatcher`, so a label is scanned once whatever the number of rules
+    * Rules are tried from highest `priority` to lowest, and in the given order for equal priorities. The first match wins.
+    * The matched rule is memoized per kind and normalized label, so repeated questions are free
+    * `values` is where `use` names are looked up, like the bot's globals
+    '''
+    def __init__(self, rules: list[dict], values: Mapping[str, Any]) -> None:
+        if not isinstance(rules, list): raise TypeError("Answer rules must be a List of dicts!")
+        self.values = values
+        self.rules = sorted((Rule(rule, index) for index, rule in enumerate(rules)), key=lambda rule: (-rule.priority, rule.index))
+        for rule in self.rules:
+            if rule.use is not None and rule.use not in values and rule.use not in context_names:
+                raise ValueError(f'Answer rule #{rule.index + 1} uses "{rule.use}", which is not defined! Use one of your config variable names or {context_names}')
+        self.rules_by_kind = {kind: [rule for rule in self.rules if kind in rule.kinds] for kind in rule_kinds}
+        self.matcher = KeywordMatcher(set().union(*(rule.keywords() for rule in self.rules)))
+        self.cache: dict[tuple[str, str], Rule | None] = {}
+
+
+    def match(self, kind: str, label: str) -> Rule | None:
+        '''
+        Returns the rule that answers a question of `kind` with `label`, `None` if no rule matches
+        '''
+        key = (kind, normalize_label(label))
+        if key not in self.cache:
+            found = self.matcher.find_all(key[1])
+            self.cache[key] = next((rule for rule in self.rules_by_kind.get(kind, []) if rule.matches(found)), None)
+        return self.cache[key]
+
+
+    def answer(self, kind: str, label: str, default: Any = "", **context) -> tuple[Any, Rule | None]:
+        '''
+        Returns `(answer, rule)` for a question of `kind` with `label`, or `(default, None)` if no rule matches.
+        * `context` gives the values of `context_names` for this question
+        * A rule's `answer` can be a dict of answers per kind
+        '''
+        rule = self.match(kind, label)
+        if rule is None: return default, None
+        if rule.use is not None:
+            return (context[rule.use] if rule.use in context else self.values[rule.use]), rule
+        if isinstance(rule.answer, dict): return rule.answer.get(kind, default), rule
+        return rule.answer, rule
+
+
+
+def normalize_label(label: str) -> str:
+    '''
+    Lower cases `label` and collapses whitespace
+    '''
+    return " ".join(label.lower().split())
@@ -0,0 +1,245 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+import os
+import csv
+import json
+
+from time import perf_counter, time
+from threading import local, Lock
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Iterator
+from functools import wraps
+
+from config.settings import logs_folder_path, trace_format
+
+
+
+trace_fieldnames = ["time", "job_id", "span", "duration", "sleep", "status", "attributes"]
+'''
+Columns of the trace file, `duration` and `sleep` are in seconds
+'''
+
+trace_file_path = (logs_folder_path + "/trace." + ("jsonl" if trace_format == "json" else "csv")).replace("//", "/")
+
+
+
+class Span:
+    '''
+    A timed section of work. `sleep` is the part of `duration` spent in `buffer()` or `sleep()`.
+    '''
+    def __init__(self, name: str, attributes: dict) -> None:
+        self.name = name
+        self.job_id = None
+        self.attributes = attributes
+        self.started_at = time()
+        self.start = perf_counter()
+        self.duration = 0.0
+        self.sleep = 0.0
+        self.status = ""
+
+
+    def record(self) -> dict:
+        '''
+        Returns this span as a trace file row
+        '''
+        return {
+            "time": datetime.fromtimestamp(self.started_at).isoformat(timespec="milliseconds"), "job_id": self.job_id or "", "span": self.name,
+            "duration": round(self.duration, 4), "sleep": round(self.sleep, 4), "status": self.status, "attributes": self.attributes
+        }
+
+
+
+class Tracer:
+    '''
+    Collects per job and per phase spans.
+    * Spans nest per thread, sleep time is counted in every open span of the thread
+    * Finished spans are kept as durations for the summary and written to the trace file when their job ends,
+      so spans that finished before the Job ID was known still get it
+    '''
+    def __init__(self, path: str | None = trace_file_path if trace_format else None) -> None:
+        self.path = path
+        self.lock = Lock()
+        self.state = local()
+        self.started = perf_counter()
+        self.durations: dict[str, list[float]] = {}
+        self.sleeps: dict[str, float] = {}
+        self.job_statuses: dict[str, int] = {}
+        self.pending: list[dict] = []
+
+
+    def stack(self) -> list[Span]:
+        if not hasattr(self.state, "stack"):
+            self.state.stack = []
+        return self.state.stack
+
+
+    def start_job(self, job_id: str | None = None, **attributes) -> None:
+        '''
+        Starts the span of a job, ends the previous job of this thread if it's still open
+        '''
+        self.end_job()
+        self.state.job = Span("job", attributes)
+        self.state.job.job_id = job_id
+        self.state.job.status = "skipped"
+        self.state.job_spans = []
+        self.stack().append(self.state.job)
+
+
+    def update_job(self, job_id: str | None = None, **attributes) -> None:
+        '''
+        Sets the Job ID and adds `attributes` (like title, company) to the current job
+        '''
+        job = getattr(self.state, "job", None)
+        if job is None: return
+        if job_id: job.job_id = job_id
+        job.attributes.update(attributes)
+
+
+    def set_job_status(self, status: str) -> None:
+        '''
+        Sets the outcome of the current job, like "applied", "failed" or "skipped" (default)
+        '''
+        job = getattr(self.state, "job", None)
+        if job: job.status = status
+
+
+    def end_job(self) -> None:
+        '''
+        Ends the current job of this thread and writes its spans to the trace file
+        '''
+        job = getattr(self.state, "job", None)
+        if job is None: return
+        self.state.job = None
+        stack = self.stack()
+        if job in stack: del stack[stack.index(job):]
+        self.finish(job)
+        with self.lock:
+            self.job_statuses[job.status] = self.job_statuses.get(job.status, 0) + 1
+            if self.path:
+                for current in self.state.job_spans + [job]:
+                    current.job_id = job.job_id
+                    self.pending.append(current.record())
+        self.state.job_spans = []
+        self.flush()
+
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span]:
+        '''
+        Context manager to time the phase `name` of the current job
+        '''
+        current = Span(name, attributes)
+        stack = self.stack()
+        stack.append(current)
+        try:
+            yield current
+        finally:
+            if current in stack: stack.remove(current)
+            self.finish(current)
+
+
+    def trace(self, name: str) -> Callable:
+        '''
+        Decorator to time every call of a function as the phase `name`
+        '''
+        def decorator(function: Callable) -> Callable:
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+
+    def record_sleep(self, seconds: float) -> None:
+        '''
+        Adds `seconds` slept to all open spans of this thread
+        '''
+        for current in self.stack():
+            current.sleep += seconds
+
+
+    def finish(self, current: Span) -> None:
+        current.duration = perf_counter() - current.start
+        with self.lock:
+            self.durations.setdefault(current.name, []).append(current.duration)
+            self.sleeps[current.name] = self.sleeps.get(current.name, 0.0) + current.sleep
+        if current.name == "job": return
+        if getattr(self.state, "job", None) is not None:
+            self.state.job_spans.append(current)
+        elif self.path:
+            with self.lock:
+                self.pending.append(current.record())
+
+
+    def flush(self) -> None:
+        '''
+        Appends finished spans to the trace file
+        '''
+        with self.lock:
+            records, self.pending = self.pending, []
+        if not records or not self.path: return
+        try:
+            if self.path.endswith(".csv"):
+                with open(self.path, 'a', newline='', encoding="utf-8") as file:
+                    writer = csv.DictWriter(file, fieldnames=trace_fieldnames)
+                    if file.tell() == 0: writer.writeheader()
+                    writer.writerows({**record, "attributes": json.dumps(record["attributes"])} for record in records)
+            else:
+                with open(self.path, 'a', encoding="utf-8") as file:
+                    file.writelines(json.dumps(record, default=str) + "\n" for record in records)
+        except Exception as e:
+            print(f'Failed to write trace file "{self.path}"! {e}')
+
+
+    def summary(self) -> str:
+        '''
+        Returns a report of count, p50, p95, total and sleep seconds per phase, and jobs per hour
+        '''
+        self.end_job()
+        self.flush()
+        elapsed = perf_counter() - self.started
+        with self.lock:
+            lines = [f"{'Phase':<22}{'Count':>7}{'p50 (s)':>10}{'p95 (s)':>10}{'Total (s)':>11}{'Sleep (s)':>11}"]
+            for name, durations in sorted(self.durations.items(), key=lambda item: -sum(item[1])):
+                lines.append(f"{name:<22}{len(durations):>7}{percentile(durations, 50):>10.2f}{percentile(durations, 95):>10.2f}{sum(durations):>11.1f}{self.sleeps.get(name, 0.0):>11.1f}")
+            jobs = sum(self.job_statuses.values())
+            statuses = ", ".join(f"{status}: {count}" for status, count in sorted(self.job_statuses.items()))
+        hours = elapsed / 3600
+        lines.append(f"\nJobs processed: {jobs} ({statuses or 'none'}) in {elapsed / 60:.1f} min, {jobs / hours if hours else 0:.1f} jobs/hour")
+        if self.path: lines.append(f'Trace saved to "{os.path.abspath(self.path)}"')
+        return "\n".join(lines)
+
+
+
+def percentile(values: list[float], percent: float) -> float:
+    '''
+    Returns the nearest-rank `percent`th percentile of `values`, `0` if empty
+    '''
+    if not values: return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+
+
+tracer = Tracer()
+'''
+Shared tracer of the bot
+'''
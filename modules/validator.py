@@ -94,6 +94,7 @@ def validate_personals() -> None | ValueError | TypeError:
 
 
 from config.questions import *
+from modules.rules import Rule
 def validate_questions() -> None | ValueError | TypeError:
     '''
     Validates all variables in the `/config/questions.py` file.
@@ -120,6 +121,11 @@ def validate_questions() -> None | ValueError | TypeError:
     check_boolean(pause_at_failed_question, "pause_at_failed_question")
     check_boolean(overwrite_previous_answers, "overwrite_previous_answers")
 
+    if not isinstance(answer_rules, list): raise TypeError(f'The variable "answer_rules" in "{__validation_file_path}" must be a List of rules!')
+    for index, rule in enumerate(answer_rules): Rule(rule, index)
+    if not isinstance(question_answers, dict) or not all(isinstance(question, str) and isinstance(answer, str) for question, answer in question_answers.items()):
+        raise TypeError(f'The variable "question_answers" in "{__validation_file_path}" must be a Dictionary of questions and their answers, all in quotes!')
+
 
 from config.search import *
 def validate_search() -> None | ValueError | TypeError:
@@ -161,9 +167,16 @@ def validate_search() -> None | ValueError | TypeError:
     check_list(about_company_bad_words, "about_company_bad_words")
     check_list(about_company_good_words, "about_company_good_words")
     check_list(bad_words, "bad_words")
+    check_list(title_include_words, "title_include_words")
+    check_list(title_exclude_words, "title_exclude_words")
+    check_list(company_blacklist, "company_blacklist")
+    check_boolean(skip_seen_jobs, "skip_seen_jobs")
     check_boolean(security_clearance, "security_clearance")
     check_boolean(did_masters, "did_masters")
     check_int(current_experience, "current_experience", -1)
+    if not isinstance(job_relevance_threshold, (int, float)) or not 0 <= job_relevance_threshold <= 1:
+        raise ValueError(f'The variable "job_relevance_threshold" in "{__validation_file_path}" must be a number between 0 and 1! Received "{job_relevance_threshold}"')
+    check_int(job_relevance_expected_skills, "job_relevance_expected_skills", 1)
 
 
 
@@ -236,8 +249,64 @@ def validate_settings() -> None | ValueError | TypeError:
     check_string(file_name, "file_name", min_length=1)
     check_string(failed_file_name, "failed_file_name", min_length=1)
     check_string(logs_folder_path, "logs_folder_path", min_length=1)
+    check_string(chromedriver_cache_file, "chromedriver_cache_file", min_length=1)
+    check_string(log_level, "log_level", ["DEBUG", "INFO", "WARNING", "ERROR"])
+    check_string(log_format, "log_format", ["text", "json"])
+    check_int(log_max_size_mb, "log_max_size_mb", 0)
+    check_int(log_rotate_hours, "log_rotate_hours", 0)
+    check_int(log_backup_count, "log_backup_count", 0)
+    check_int(log_queue_size, "log_queue_size", 1)
+    check_string(trace_format, "trace_format", ["json", "csv", ""])
+    check_string(history_backend, "history_backend", ["sqlite", "csv"])
+    check_string(history_db_path, "history_db_path", min_length=1)
+    check_int(history_batch_size, "history_batch_size", 1)
+    check_boolean(history_export_csv, "history_export_csv")
+    check_string(ai_cache_db_path, "ai_cache_db_path", min_length=1)
+    check_boolean(ai_answer_cache, "ai_answer_cache")
+    check_int(ai_answer_cache_days, "ai_answer_cache_days", 0)
+    check_int(ai_answer_cache_size, "ai_answer_cache_size", 1)
+    check_list(ai_answer_cache_job_specific, "ai_answer_cache_job_specific", ["text", "textarea", "single_select", "multiple_select"])
+    check_string(ai_answer_review_file, "ai_answer_review_file")
+    check_boolean(ai_skills_cache, "ai_skills_cache")
+    check_int(ai_skills_cache_size_mb, "ai_skills_cache_size_mb", 1)
+    check_boolean(ai_skills_cache_shared, "ai_skills_cache_shared")
+    check_int(ai_max_concurrency, "ai_max_concurrency", 1)
+    check_int(ai_max_connections, "ai_max_connections", 1)
+    check_int(ai_request_timeout, "ai_request_timeout", 1)
+    check_boolean(semantic_match, "semantic_match")
+    if not isinstance(semantic_match_threshold, (int, float)) or not 0 <= semantic_match_threshold <= 1:
+        raise ValueError(f'The variable "semantic_match_threshold" in "{__validation_file_path}" must be a number between 0 and 1! Received "{semantic_match_threshold}"')
+    if not isinstance(semantic_match_overlap, (int, float)) or not 0 < semantic_match_overlap <= 1:
+        raise ValueError(f'The variable "semantic_match_overlap" in "{__validation_file_path}" must be a number above 0 and up to 1! Received "{semantic_match_overlap}"')
+    check_list(semantic_match_kinds, "semantic_match_kinds", ["text", "textarea"])
+    check_boolean(ai_batch_questions, "ai_batch_questions")
+    check_boolean(ai_compact_prompts, "ai_compact_prompts")
+    check_int(ai_job_digest_tokens, "ai_job_digest_tokens", 1)
+    check_int(ai_skills_description_tokens, "ai_skills_description_tokens", 1)
+    check_int(ai_user_information_tokens, "ai_user_information_tokens", 1)
+    check_int(ai_requests_per_minute, "ai_requests_per_minute", 0)
+    check_int(ai_tokens_per_minute, "ai_tokens_per_minute", 0)
+    check_int(ai_max_retries, "ai_max_retries", 0)
+    check_int(ai_retry_base_seconds, "ai_retry_base_seconds", 1)
+    check_int(ai_circuit_breaker_failures, "ai_circuit_breaker_failures", 0)
+    check_int(ai_circuit_breaker_seconds, "ai_circuit_breaker_seconds", 0)
+    check_int(ai_run_token_budget, "ai_run_token_budget", 0)
+    if not isinstance(ai_token_prices, dict) or not all(isinstance(prices, (list, tuple)) and len(prices) == 2 for prices in ai_token_prices.values()):
+        raise TypeError(f'The variable "ai_token_prices" in "{__validation_file_path}" must be a dict of model name to [input price, output price]!')
 
     check_int(click_gap, "click_gap", 0)
+    check_boolean(adaptive_waits, "adaptive_waits")
+    check_int(max_wait_seconds, "max_wait_seconds", 1)
+    check_int(dom_quiet_ms, "dom_quiet_ms", 0)
+    check_int(prefetch_jobs, "prefetch_jobs", 0)
+    check_int(prefetch_workers, "prefetch_workers", 1)
+    check_boolean(bulk_job_details, "bulk_job_details")
+    check_int(job_details_batch_size, "job_details_batch_size", 1)
+    if prefetch_jobs and not bulk_job_details:
+        print_lg(f'"prefetch_jobs" in "{__validation_file_path}" does nothing without "bulk_job_details = True", jobs are checked when they are opened!')
+    check_int(browser_sessions, "browser_sessions", 1)
+    check_int(max_applications_per_run, "max_applications_per_run", 0)
+    check_int(run_cooldown_minutes, "run_cooldown_minutes", 0)
 
     check_boolean(run_in_background, "run_in_background")
     check_boolean(disable_extensions, "disable_extensions")
@@ -245,6 +314,10 @@ def validate_settings() -> None | ValueError | TypeError:
     check_boolean(smooth_scroll, "smooth_scroll")
     check_boolean(keep_screen_awake, "keep_screen_awake")
     check_boolean(stealth_mode, "stealth_mode")
+    check_int(chrome_debugger_port, "chrome_debugger_port", 0)
+    check_string(chrome_profile_path, "chrome_profile_path", min_length=1)
+    check_boolean(block_resources, "block_resources")
+    check_list(blocked_url_patterns, "blocked_url_patterns")
 
 
 
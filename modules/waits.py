@@ -0,0 +1,127 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+# Imports
+
+from time import perf_counter
+from typing import Callable, Any
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from config.settings import adaptive_waits, max_wait_seconds, dom_quiet_ms
+from modules.helpers import print_lg, sleep
+from modules.tracing import tracer
+
+
+
+poll_seconds = 0.1
+'''
+How often wait conditions are checked, each check is one call to the browser
+'''
+
+__page_state_script = '''
+if (!window.__autoApplierWaits) {
+    const state = window.__autoApplierWaits = { lastChange: performance.now() };
+    new MutationObserver(() => { state.lastChange = performance.now(); })
+        .observe(document, { childList: true, subtree: true, attributes: true, characterData: true });
+}
+let lastResponse = 0;
+for (const entry of performance.getEntriesByType("resource")) lastResponse = Math.max(lastResponse, entry.responseEnd);
+return { ready: document.readyState, now: performance.now(), lastChange: window.__autoApplierWaits.lastChange, lastResponse: lastResponse };
+'''
+'''
+Installs a `MutationObserver` once per page and returns when the DOM last changed and the network last responded
+'''
+
+__element_state_script = '''
+const element = arguments[0];
+if (!element.isConnected) return null;
+const rect = element.getBoundingClientRect();
+return [rect.x, rect.y, rect.width, rect.height, element.childElementCount];
+'''
+
+
+
+def wait_for(driver: WebDriver, condition: Callable[[WebDriver], Any], name: str, timeout: float = max_wait_seconds, fallback: float = 0,
+             fallback_sleep: Callable[[float], None] = sleep) -> Any:
+    '''
+    Waits until `condition(driver)` returns a truthy value or `timeout` seconds pass.
+    * `fallback` is the fixed wait this replaces, `timeout` is capped at it if given, so it never waits longer than before
+    * Returns the value of the condition, or `False` if it timed out
+    * Time taken is recorded in the trace as phase `wait_{name}`
+    * If `adaptive_waits` is disabled in settings, waits `fallback_sleep(fallback)` instead and returns `True`
+    '''
+    if not adaptive_waits:
+        fallback_sleep(fallback)
+        return True
+    if fallback: timeout = min(timeout, fallback)
+    with tracer.span(f"wait_{name}") as span:
+        start = perf_counter()
+        try:
+            result = WebDriverWait(driver, timeout, poll_frequency=poll_seconds, ignored_exceptions=(WebDriverException,)).until(condition)
+        except TimeoutException:
+            result = False
+        span.status = "ready" if result else "timeout"
+    print_lg(f"Waited {perf_counter() - start:.2f}s for {name} ({span.status})", level="DEBUG")
+    return result
+
+
+def dom_quiet(quiet_ms: int = dom_quiet_ms) -> Callable[[WebDriver], bool]:
+    '''
+    Condition that's met when the page has loaded and neither the DOM changed nor a network request finished in the last `quiet_ms` milliseconds
+    '''
+    def condition(driver: WebDriver) -> bool:
+        state = driver.execute_script(__page_state_script)
+        if state["ready"] != "complete": return False
+        return state["now"] - max(state["lastChange"], state["lastResponse"]) >= quiet_ms
+    return condition
+
+
+def element_stable(element: WebElement, quiet_ms: int = dom_quiet_ms) -> Callable[[WebDriver], WebElement | bool]:
+    '''
+    Condition that's met when `element` is displayed and its position, size and children didn't change for `quiet_ms` milliseconds
+    '''
+    last = {"state": None, "since": 0.0}
+    def condition(driver: WebDriver) -> WebElement | bool:
+        state = driver.execute_script(__element_state_script, element)
+        now = perf_counter()
+        if state != last["state"] or not state or not state[2] or not state[3]:
+            last["state"], last["since"] = state, now
+            return False
+        return element if (now - last["since"]) * 1000 >= quiet_ms else False
+    return condition
+
+
+def wait_until_idle(driver: WebDriver, name: str = "page_idle", timeout: float = max_wait_seconds, fallback: float = 0,
+                    fallback_sleep: Callable[[float], None] = sleep) -> bool:
+    '''
+    Waits until the page is loaded, the network is idle and the DOM stopped changing.
+    * Returns `False` if it took more than `timeout` seconds (capped by `fallback`), the page is then used as it is
+    * `fallback_sleep(fallback)` is the fixed wait used when `adaptive_waits` is disabled
+    '''
+    return wait_for(driver, dom_quiet(), name, timeout, fallback, fallback_sleep)
+
+
+def wait_until_stable(element: WebElement, name: str = "element_stable", timeout: float = max_wait_seconds, fallback: float = 0,
+                      fallback_sleep: Callable[[float], None] = sleep) -> WebElement | bool:
+    '''
+    Waits until `element` is displayed and stopped moving or changing, like an input that's still being animated in.
+    * Returns the `element`, or `False` if it took more than `timeout` seconds (capped by `fallback`)
+    * `fallback_sleep(fallback)` is the fixed wait used when `adaptive_waits` is disabled
+    '''
+    return wait_for(element.parent, element_stable(element), name, timeout, fallback, fallback_sleep)
@@ -15,7 +15,6 @@ version:    24.12.29.12.30
 
 # Imports
 import os
-import csv
 import re
 import sys
 from pathlib import Path
@@ -59,7 +58,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support.select import Select
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException, NoSuchWindowException, ElementNotInteractableException
+from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException, NoSuchWindowException, ElementNotInteractableException, StaleElementReferenceException
 
 from config.personals import *
 from config.questions import *
@@ -67,17 +66,30 @@ from config.search import *
 from config.secrets import use_AI, username, password, ai_provider
 from config.settings import *
 
-from modules.ai.ollamaConnections import ollama_answer_question, ollama_create_client, ollama_extract_skills
 from modules.open_chrome import *
 from modules.helpers import *
 from modules.clickers_and_finders import *
 from modules.validator import validate_config
-from modules.ai.openaiConnections import ai_create_openai_client, ai_extract_skills, ai_answer_question, ai_close_openai_client
-from modules.ai.deepseekConnections import deepseek_create_client, deepseek_extract_skills, deepseek_answer_question
-##> ------ Manish Kumar : a.manish1689@gmail.com - Feature ------
-from modules.ai.geminiConnections import gemini_create_client, gemini_extract_skills, gemini_answer_question, gemini_close_client
-##<
-
+from modules.history import open_history
+from modules.waits import wait_until_idle, wait_for
+from modules.job_cards import job_card_xpath, get_job_cards, read_job_card, find_job_card
+from modules.forms import snapshot_form, normalize_space
+from modules.rules import RuleEngine
+from modules.ai.cache import get_answer_cache, get_skills_cache
+from modules.tracing import tracer
+from modules.ai.providers import AIProvider, get_provider, submit_ai_task, run_ai_task, close_providers
+from modules.ai.limits import usage_summary
+from modules.ai.semantic import match_answer, learn_answers, get_semantic_index
+from modules.prefetch import JobPrefetcher
+from modules.relevance import check_relevance, get_relevance_scorer
+from modules.filters import bad_words_filter, clearance_filter, company_bad_words_filter, company_good_words_filter, first_hit, describe_hits, CardFilter
+from modules.browser_pool import BrowserPool, Scheduler, SubmissionBudget, SessionProxy, current_session
+from modules.chromedriver import resolve_chromedriver, find_chrome
+from modules.resources import page_metrics, apply_resource_policy
+from modules.job_details import fetch_job_details
+
+from concurrent.futures import Future
+from threading import RLock
 from typing import Literal
 
 
@@ -100,13 +112,37 @@ full_name = first_name + " " + middle_name + " " + last_name if middle_name else
 useNewResume = True
 randomly_answered_questions = set()
 
-tabs_count = 1
 easy_applied_count = 0
 external_jobs_count = 0
 failed_count = 0
 skip_count = 0
+counts_lock = RLock()   # Browser sessions count on their own threads
 dailyEasyApplyLimitReached = False
 
+
+class SessionState:
+    '''
+    What a browser session changes while it applies, so it doesn't change how other sessions apply:
+    pauses turned off from its dialogs, whether it uploaded the new resume and how many tabs its window has.
+    '''
+    def __init__(self) -> None:
+        self.pause_before_submit = pause_before_submit
+        self.pause_at_failed_question = pause_at_failed_question
+        self.use_new_resume = useNewResume
+        self.tabs_count = 1
+
+session_states: dict[int, SessionState] = {}
+
+def get_session_state() -> SessionState:
+    '''
+    Returns the `SessionState` of the calling thread's browser session
+    '''
+    session = current_session()
+    index = session.index if session else 0
+    with counts_lock:
+        if index not in session_states: session_states[index] = SessionState()
+        return session_states[index]
+
 re_experience = re.compile(r'[(]?\s*(\d+)\s*[)]?\s*[-to]*\s*\d*[+]*\s*year[s]?', re.IGNORECASE)
 
 desired_salary_lakhs = str(round(desired_salary / 100000, 2))
@@ -121,7 +157,10 @@ notice_period_months = str(notice_period//30)
 notice_period_weeks = str(notice_period//7)
 notice_period = str(notice_period)
 
-aiClient = None
+aiClient: AIProvider | None = None
+prefetcher: JobPrefetcher | None = None
+history = open_history()
+answer_engine = RuleEngine(answer_rules, globals())
 ##> ------ Dheeraj Deshwal : dheeraj9811 Email:dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Feature ------
 about_company_for_ai = None # TODO extract about company for AI
 ##<
@@ -189,17 +228,13 @@ def login_LN() -> None:
 def get_applied_job_ids() -> set:
     '''
     Function to get a `set` of applied job's Job IDs
-    * Returns a set of Job IDs from existing applied jobs history csv file
+    * Returns the set of Job IDs from applied jobs history, it's loaded from the store only once and kept up to date
     '''
-    job_ids = set()
     try:
-        with open(file_name, 'r', encoding='utf-8') as file:
-            reader = csv.reader(file)
-            for row in reader:
-                job_ids.add(row[0])
-    except FileNotFoundError:
-        print_lg(f"The CSV file '{file_name}' does not exist.")
-    return job_ids
+        return history.applied_job_ids()
+    except Exception as e:
+        print_lg(f"Failed to read applied jobs history from '{history_backend}' store!", e)
+        return set()
 
 
 
@@ -225,6 +260,7 @@ def set_search_location() -> None:
             print_lg("Failed to update search location, continuing with default location!", e)
 
 
+@tracer.trace("filters")
 def apply_filters() -> None:
     '''
     Function to apply job search filters
@@ -274,7 +310,7 @@ def apply_filters() -> None:
         show_results_button.click()
 
         global pause_after_filters
-        if pause_after_filters and "Turn off Pause after search" == pyautogui.confirm("These are your configured search results and filter. It is safe to change them while this dialog is open, any changes later could result in errors and skipping this search run.", "Please check your results", ["Turn off Pause after search", "Look's good, Continue"]):
+        if pause_after_filters and "Turn off Pause after search" == on_main_thread(pyautogui.confirm, "These are your configured search results and filter. It is safe to change them while this dialog is open, any changes later could result in errors and skipping this search run.", "Please check your results", ["Turn off Pause after search", "Look's good, Continue"]):
             pause_after_filters = False
 
     except Exception as e:
@@ -300,9 +336,17 @@ def get_page_info() -> tuple[WebElement | None, int | None]:
 
 
 
-def get_job_main_details(job: WebElement, blacklisted_companies: set, rejected_jobs: set) -> tuple[str, str, str, str, str, bool]:
+job_pane_xpath = "//div[contains(@class, 'jobs-details')][.//a[contains(@href, '/jobs/view/{0}')]]//div[contains(@class, 'jobs-s-apply')]"
+'''
+Apply container of the job pane showing Job ID `{0}`, use `job_pane_xpath.format(job_id)`
+'''
+
+@tracer.trace("job_details")
+def get_job_main_details(card: dict, blacklisted_companies: set, rejected_jobs: set, applied_jobs: set, card_filter: CardFilter) -> tuple[str, str, str, str, str, bool]:
     '''
     # Function to get job main details.
+    Takes a job `card` from `get_job_cards()`, skip checks are done on it before anything is clicked.
+    Cards that weren't rendered on the results page are read and checked with `card_filter` here.
     Returns a tuple of (job_id, title, company, work_location, work_style, skip)
     * job_id: Job ID
     * title: Job title
@@ -311,65 +355,87 @@ def get_job_main_details(job: WebElement, blacklisted_companies: set, rejected_j
     * work_style: Work style of this job (Remote, On-site, Hybrid)
     * skip: A boolean flag to skip this job
     '''
-    job_details_button = job.find_element(By.TAG_NAME, 'a')  # job.find_element(By.CLASS_NAME, "job-card-list__title")  # Problem in India
-    scroll_to_view(driver, job_details_button, True)
-    job_id = job.get_dom_attribute('data-occludable-job-id')
-    title = job_details_button.text
-    title = title[:title.find("\n")]
-    # company = job.find_element(By.CLASS_NAME, "job-card-container__primary-description").text
-    # work_location = job.find_element(By.CLASS_NAME, "job-card-container__metadata-item").text
-    other_details = job.find_element(By.CLASS_NAME, 'artdeco-entity-lockup__subtitle').text
-    index = other_details.find(' · ')
-    company = other_details[:index]
-    work_location = other_details[index+3:]
-    work_style = work_location[work_location.rfind('(')+1:work_location.rfind(')')]
-    work_location = work_location[:work_location.rfind('(')].strip()
+    global skip_count
+    if card["link"] is None:
+        try:
+            scroll_to_view(driver, card["element"], True)
+            card = read_job_card(card["element"])
+        except StaleElementReferenceException:
+            card = read_job_card(find_job_card(driver, card["job_id"]))
+        reason = card_filter.check_card(card)
+    else: reason = None
+    job_id, title, company = card["job_id"], card["title"], card["company"]
+    work_location, work_style = card["work_location"], card["work_style"]
     
     # Skip if previously rejected due to blacklist or already applied
     skip = False
-    if company in blacklisted_companies:
+    if reason:
+        print_lg(f'Skipping "{title} | {company}" job ({reason}). Job ID: {job_id}!')
+        rejected_jobs.add(job_id)
+        with counts_lock: skip_count += 1
+        skip = True
+    elif company in blacklisted_companies:
         print_lg(f'Skipping "{title} | {company}" job (Blacklisted Company). Job ID: {job_id}!')
         skip = True
     elif job_id in rejected_jobs: 
         print_lg(f'Skipping previously rejected "{title} | {company}" job. Job ID: {job_id}!')
         skip = True
-    try:
-        if job.find_element(By.CLASS_NAME, "job-card-container__footer-job-state").text == "Applied":
-            skip = True
-            print_lg(f'Already applied to "{title} | {company}" job. Job ID: {job_id}!')
-    except: pass
+    elif card["applied"] or job_id in applied_jobs:
+        print_lg(f'Already applied to "{title} | {company}" job. Job ID: {job_id}!')
+        skip = True
+    if skip: return (job_id,title,company,work_location,work_style,skip)
+
+    job_details_button = card["link"]
     try: 
-        if not skip: job_details_button.click()
+        scroll_to_view(driver, job_details_button, True)
+        job_details_button.click()
+    except StaleElementReferenceException:
+        # The card was emptied after it was read, as LinkedIn does with cards scrolled out of view
+        job_details_button = find_job_card(driver, job_id).find_element(By.TAG_NAME, 'a')
+        job_details_button.click()
     except Exception as e:
         print_lg(f'Failed to click "{title} | {company}" job on details button. Job ID: {job_id}!') 
         # print_lg(e)
         discard_job()
         job_details_button.click() # To pass the error outside
     buffer(click_gap)
+    # The job's pane loads after the click, the Easy Apply button is searched in it
+    wait_for(driver, EC.presence_of_element_located((By.XPATH, job_pane_xpath.format(job_id))), "job_pane", timeout=5)
     return (job_id,title,company,work_location,work_style,skip)
 
 
+# Function to find the top card of the opened job, with its date posted
+def find_jobs_top_card() -> WebElement:
+    return try_find_by_classes(driver, ["job-details-jobs-unified-top-card__primary-description-container","job-details-jobs-unified-top-card__primary-description","jobs-unified-top-card__primary-description","jobs-details__main-content"])
+
+
 # Function to check for Blacklisted words in About Company
-def check_blacklist(rejected_jobs: set, job_id: str, company: str, blacklisted_companies: set) -> tuple[set, set, WebElement] | ValueError:
-    jobs_top_card = try_find_by_classes(driver, ["job-details-jobs-unified-top-card__primary-description-container","job-details-jobs-unified-top-card__primary-description","jobs-unified-top-card__primary-description","jobs-details__main-content"])
-    about_company_org = find_by_class(driver, "jobs-company__box")
-    scroll_to_view(driver, about_company_org)
-    about_company_org = about_company_org.text
-    about_company = about_company_org.lower()
-    skip_checking = False
-    for word in about_company_good_words:
-        if word.lower() in about_company:
-            print_lg(f'Found the word "{word}". So, skipped checking for blacklist words.')
-            skip_checking = True
-            break
-    if not skip_checking:
-        for word in about_company_bad_words: 
-            if word.lower() in about_company: 
-                rejected_jobs.add(job_id)
-                blacklisted_companies.add(company)
-                raise ValueError(f'\n"{about_company_org}"\n\nContains "{word}".')
-    buffer(click_gap)
-    scroll_to_view(driver, jobs_top_card)
+@tracer.trace("blacklist")
+def check_blacklist(rejected_jobs: set, job_id: str, company: str, blacklisted_companies: set, about_company: str | None = None) -> tuple[set, set, WebElement | None] | ValueError:
+    '''
+    Checks About Company for blacklisted words, it's read from the page unless `about_company` was fetched with the job's details.
+    Returns `jobs_top_card` only if it was read from the page.
+    '''
+    jobs_top_card = None
+    if about_company:
+        about_company_org = about_company
+    else:
+        jobs_top_card = find_jobs_top_card()
+        about_company_org = find_by_class(driver, "jobs-company__box")
+        scroll_to_view(driver, about_company_org)
+        about_company_org = about_company_org.text
+    good_hit = first_hit(company_good_words_filter, about_company_org)
+    if good_hit:
+        print_lg(f'Found the word "{good_hit[2]}". So, skipped checking for blacklist words.')
+    else:
+        bad_hits = company_bad_words_filter.find_hits(about_company_org)
+        if bad_hits:
+            rejected_jobs.add(job_id)
+            blacklisted_companies.add(company)
+            raise ValueError(f'\n"{about_company_org}"\n\nContains "{bad_hits[0][2]}".\n{describe_hits(about_company_org, bad_hits)}')
+    if jobs_top_card is not None:
+        buffer(click_gap)
+        scroll_to_view(driver, jobs_top_card)
     return rejected_jobs, blacklisted_companies, jobs_top_card
 
 
@@ -385,6 +451,57 @@ def extract_years_of_experience(text: str) -> int:
 
 
 
+# Function to check a job description for bad words, clearance and experience required
+def analyze_job_description(jobDescription: str) -> tuple[
+    int | Literal['Unknown'],
+    bool,
+    str | None,
+    str | None
+    ]:
+    '''
+    # Job Description Analysis
+    Checks `jobDescription` for bad words, security clearance, experience required and relevance to your skills. Doesn't use the browser.
+    ### Returns:
+    - `experience_required: int | 'Unknown'`
+    - `skip: bool`
+    - `skipReason: str | None`
+    - `skipMessage: str | None`
+    '''
+    experience_required = "Unknown"
+    found_masters = 0
+    jobDescriptionLow = jobDescription.lower()
+    skip = False
+    skipReason = None
+    skipMessage = None
+    bad_hits = bad_words_filter.find_hits(jobDescription)
+    if bad_hits:
+        skipMessage = f'\n{jobDescription}\n\nContains bad word "{bad_hits[0][2]}". Skipping this job!\n{describe_hits(jobDescription, bad_hits)}\n'
+        skipReason = "Found a Bad Word in About Job"
+        skip = True
+    if not skip and security_clearance == False and first_hit(clearance_filter, jobDescription):
+        skipMessage = f'\n{jobDescription}\n\nFound "Clearance" or "Polygraph". Skipping this job!\n'
+        skipReason = "Asking for Security clearance"
+        skip = True
+    if not skip:
+        if did_masters and 'master' in jobDescriptionLow:
+            print_lg(f'Found the word "master" in \n{jobDescription}')
+            found_masters = 2
+        experience_required = extract_years_of_experience(jobDescription)
+        if current_experience > -1 and experience_required > current_experience + found_masters:
+            skipMessage = f'\n{jobDescription}\n\nExperience required {experience_required} > Current Experience {current_experience + found_masters}. Skipping this job!\n'
+            skipReason = "Required experience is high"
+            skip = True
+    if not skip and job_relevance_threshold > 0 and jobDescription.strip():
+        relevant, relevance = check_relevance(jobDescription)
+        if not relevant:
+            skipMessage = f'\n{jobDescription}\n\nRelevance {relevance.score:.2f} < {job_relevance_threshold}. {". ".join(relevance.reasons)}. Skipping this job!\n'
+            skipReason = "Not relevant to your skills"
+            skip = True
+    return experience_required, skip, skipReason, skipMessage
+
+
+
+@tracer.trace("description")
 def get_job_description(
 ) -> tuple[
     str | Literal['Unknown'],
@@ -403,36 +520,16 @@ def get_job_description(
     - `skipReason: str | None`
     - `skipMessage: str | None`
     '''
+    ##> ------ Dheeraj Deshwal : dheeraj9811 Email:dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Feature ------
+    jobDescription = "Unknown"
+    ##<
+    experience_required = "Unknown"
+    skip = False
+    skipReason = None
+    skipMessage = None
     try:
-        ##> ------ Dheeraj Deshwal : dheeraj9811 Email:dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Feature ------
-        jobDescription = "Unknown"
-        ##<
-        experience_required = "Unknown"
-        found_masters = 0
         jobDescription = find_by_class(driver, "jobs-box__html-content").text
-        jobDescriptionLow = jobDescription.lower()
-        skip = False
-        skipReason = None
-        skipMessage = None
-        for word in bad_words:
-            if word.lower() in jobDescriptionLow:
-                skipMessage = f'\n{jobDescription}\n\nContains bad word "{word}". Skipping this job!\n'
-                skipReason = "Found a Bad Word in About Job"
-                skip = True
-                break
-        if not skip and security_clearance == False and ('polygraph' in jobDescriptionLow or 'clearance' in jobDescriptionLow or 'secret' in jobDescriptionLow):
-            skipMessage = f'\n{jobDescription}\n\nFound "Clearance" or "Polygraph". Skipping this job!\n'
-            skipReason = "Asking for Security clearance"
-            skip = True
-        if not skip:
-            if did_masters and 'master' in jobDescriptionLow:
-                print_lg(f'Found the word "master" in \n{jobDescription}')
-                found_masters = 2
-            experience_required = extract_years_of_experience(jobDescription)
-            if current_experience > -1 and experience_required > current_experience + found_masters:
-                skipMessage = f'\n{jobDescription}\n\nExperience required {experience_required} > Current Experience {current_experience + found_masters}. Skipping this job!\n'
-                skipReason = "Required experience is high"
-                skip = True
+        experience_required, skip, skipReason, skipMessage = analyze_job_description(jobDescription)
     except Exception as e:
         if jobDescription == "Unknown":    print_lg("Unable to extract job description!")
         else:
@@ -441,76 +538,89 @@ def get_job_description(
             # print_lg(e)
     finally:
         return jobDescription, experience_required, skip, skipReason, skipMessage
+
+
+
+skills_tasks: dict[str, Future] = {}
+skills_tasks_lock = RLock()
+
+# Function to start extracting skills of a job description with AI only once
+def extract_skills_once(jobDescription: str) -> Future:
+    '''
+    Starts extracting skills of `jobDescription`, or returns the extraction already running for it.
+    A prefetch worker may still be extracting them after the apply loop stopped waiting for it.
+    '''
+    with skills_tasks_lock:
+        task = skills_tasks.get(jobDescription)
+        if task is None:
+            task = skills_tasks[jobDescription] = submit_ai_task(aiClient.extract_skills(jobDescription))
+            task.add_done_callback(lambda _: skills_tasks.pop(jobDescription, None))    # Done ones are cached by the AI cache
+        return task
+
+
+# Function to analyze a prefetched job description on a prefetch worker
+def analyze_prefetched_job(jobDescription: str) -> tuple[int | Literal['Unknown', 'Error in extraction'], bool, str | None, str | None, Future | None]:
+    '''
+    Returns `analyze_job_description()` results and the AI skills extraction started for jobs that aren't skipped
+    '''
+    try:
+        experience_required, skip, skipReason, skipMessage = analyze_job_description(jobDescription)
+    except Exception as e:
+        print_lg("Unable to extract years of experience required!")
+        experience_required, skip, skipReason, skipMessage = "Error in extraction", False, None, None
+    skills = extract_skills_once(jobDescription) if use_AI and aiClient and not skip else None
+    return experience_required, skip, skipReason, skipMessage, skills
         
 
 
 # Function to upload resume
+@tracer.trace("resume_upload")
 def upload_resume(modal: WebElement, resume: str) -> tuple[bool, str]:
     try:
         modal.find_element(By.NAME, "file").send_keys(os.path.abspath(resume))
         return True, os.path.basename(default_resume_path)
     except: return False, "Previous resume"
 
-# Function to answer common questions for Easy Apply
-def answer_common_questions(label: str, answer: str) -> str:
-    if 'sponsorship' in label or 'visa' in label: answer = require_visa
-    return answer
-
-
 # Function to answer the questions for Easy Apply
+@tracer.trace("questions")
 def answer_questions(modal: WebElement, questions_list: set, work_location: str, job_description: str | None = None ) -> set:
-    # Get all questions from the page
-     
-    all_questions = modal.find_elements(By.XPATH, ".//div[@data-test-form-element]")
-    # all_questions = modal.find_elements(By.CLASS_NAME, "jobs-easy-apply-form-element")
-    # all_list_questions = modal.find_elements(By.XPATH, ".//div[@data-test-text-entity-list-form-component]")
-    # all_single_line_questions = modal.find_elements(By.XPATH, ".//div[@data-test-single-line-text-form-component]")
-    # all_questions = all_questions + all_list_questions + all_single_line_questions
-
-    for Question in all_questions:
+    # Get all questions from the page in one go, then only write the answers that changed
+    context = {"work_location": work_location, "current_city_or_work_location": current_city if current_city else work_location}
+    questions = snapshot_form(modal)
+
+    # Text questions no rule can answer are answered like similar questions answered before, the rest are sent to AI together in one request per page
+    known_answers = {}
+    unanswered = []
+    for question in questions:
+        if question.kind in ["text", "textarea"] and (not question.value or overwrite_previous_answers) \
+                and answer_engine.answer(question.kind, (question.label or "Unknown").lower(), "", previous_answer=question.value, **context)[0] == "":
+            answer = match_answer(question.label or "Unknown", question.kind)
+            if answer: known_answers[question.label or "Unknown"] = answer
+            else: unanswered.append((question.label or "Unknown", question.kind, None))
+    if use_AI and aiClient and ai_batch_questions and len(unanswered) > 1:
+        try:
+            answers = run_ai_task(aiClient.answer_questions(unanswered, job_description=job_description, user_information_all=user_information_all))
+            known_answers.update({label: answer for (label, _, _), answer in zip(unanswered, answers) if answer})
+        except Exception as e:
+            print_lg("Failed to get AI answers!", e)
+
+    for question in questions:
+        label_org = question.label or "Unknown"
+        label = label_org.lower()
+
         # Check if it's a select Question
-        select = try_xp(Question, ".//select", False)
-        if select:
-            label_org = "Unknown"
-            try:
-                label = Question.find_element(By.TAG_NAME, "label")
-                label_org = label.find_element(By.TAG_NAME, "span").text
-            except: pass
+        if question.kind == "select":
             answer = 'Yes'
-            label = label_org.lower()
-            select = Select(select)
-            selected_option = select.first_selected_option.text
-            optionsText = []
+            selected_option = question.value
+            optionsText = question.option_labels()
             options = '"List of phone country codes"'
             if label != "phone country code":
-                optionsText = [option.text for option in select.options]
                 options = "".join([f' "{option}",' for option in optionsText])
             prev_answer = selected_option
             if overwrite_previous_answers or selected_option == "Select an option":
-                ##> ------ WINDY_WINDWARD Email:karthik.sarode23@gmail.com - Added fuzzy logic to answer location based questions ------
-                if 'email' in label or 'phone' in label: 
-                    answer = prev_answer
-                elif 'gender' in label or 'sex' in label: 
-                    answer = gender
-                elif 'disability' in label: 
-                    answer = disability_status
-                elif 'proficiency' in label: 
-                    answer = 'Professional'
-                # Add location handling
-                elif any(loc_word in label for loc_word in ['location', 'city', 'state', 'country']):
-                    if 'country' in label:
-                        answer = country 
-                    elif 'state' in label:
-                        answer = state
-                    elif 'city' in label:
-                        answer = current_city if current_city else work_location
-                    else:
-                        answer = work_location
-                else: 
-                    answer = answer_common_questions(label,answer)
-                try: 
-                    select.select_by_visible_text(answer)
-                except NoSuchElementException as e:
+                answer, rule = answer_engine.answer("select", label, 'Yes', previous_answer=prev_answer, **context)
+                if normalize_space(answer) not in optionsText:
+                    ##> ------ WINDY_WINDWARD Email:karthik.sarode23@gmail.com - Added fuzzy logic to answer location based questions ------
                     # Define similar phrases for common answers
                     possible_answer_phrases = []
                     if answer == 'Decline':
@@ -533,50 +643,34 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
                         for option in optionsText:
                             # Check if phrase is in option or option is in phrase (bidirectional matching)
                             if phrase.lower() in option.lower() or option.lower() in phrase.lower():
-                                select.select_by_visible_text(option)
                                 answer = option
                                 foundOption = True
                                 break
+                        if foundOption: break
                     if not foundOption:
                         #TODO: Use AI to answer the question need to be implemented logic to extract the options for the question
                         print_lg(f'Failed to find an option with text "{answer}" for question labelled "{label_org}", answering randomly!')
-                        select.select_by_index(randint(1, len(select.options)-1))
-                        answer = select.first_selected_option.text
+                        answer = optionsText[randint(1, len(optionsText)-1)]
                         randomly_answered_questions.add((f'{label_org} [ {options} ]',"select"))
+                answer = normalize_space(answer)
+                if answer != selected_option: Select(question.element).select_by_visible_text(answer)
             questions_list.add((f'{label_org} [ {options} ]', answer, "select", prev_answer))
             continue
         
         # Check if it's a radio Question
-        radio = try_xp(Question, './/fieldset[@data-test-form-builder-radio-button-form-component="true"]', False)
-        if radio:
-            prev_answer = None
-            label = try_xp(radio, './/span[@data-test-form-builder-radio-button-form-component__title]', False)
-            try: label = find_by_class(label, "visually-hidden", 2.0)
-            except: pass
-            label_org = label.text if label else "Unknown"
+        if question.kind == "radio":
             answer = 'Yes'
-            label = label_org.lower()
-
-            label_org += ' [ '
-            options = radio.find_elements(By.TAG_NAME, 'input')
-            options_labels = []
-            
-            for option in options:
-                id = option.get_attribute("id")
-                option_label = try_xp(radio, f'.//label[@for="{id}"]', False)
-                options_labels.append( f'"{option_label.text if option_label else "Unknown"}"<{option.get_attribute("value")}>' ) # Saving option as "label <value>"
-                if option.is_selected(): prev_answer = options_labels[-1]
-                label_org += f' {options_labels[-1]},'
+            options = question.options
+            options_labels = [f'"{option.label or "Unknown"}"<{option.value}>' for option in options] # Saving option as "label <value>"
+            selected = question.selected_option()
+            prev_answer = options_labels[options.index(selected)] if selected else None
+            label_org += ' [ ' + "".join(f' {option_label},' for option_label in options_labels)
 
             if overwrite_previous_answers or prev_answer is None:
-                if 'citizenship' in label or 'employment eligibility' in label: answer = us_citizenship
-                elif 'veteran' in label or 'protected' in label: answer = veteran_status
-                elif 'disability' in label or 'handicapped' in label: 
-                    answer = disability_status
-                else: answer = answer_common_questions(label,answer)
-                foundOption = try_xp(radio, f".//label[normalize-space()='{answer}']", False)
+                answer, rule = answer_engine.answer("radio", label, 'Yes', previous_answer=prev_answer, **context)
+                foundOption = next((option for option in options if option.label_element and normalize_space(option.label) == answer), None)
                 if foundOption: 
-                    actions.move_to_element(foundOption).click().perform()
+                    if not foundOption.selected: actions.move_to_element(foundOption.label_element).click().perform()
                 else:    
                     possible_answer_phrases = ["Decline", "not wish", "don't wish", "Prefer not", "not want"] if answer == 'Decline' else [answer]
                     ele = options[0]
@@ -589,92 +683,27 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
                                 answer = f'Decline ({option_label})' if len(possible_answer_phrases) > 1 else option_label
                                 break
                         if foundOption: break
-                    # if answer == 'Decline':
-                    #     answer = options_labels[0]
-                    #     for phrase in ["Prefer not", "not want", "not wish"]:
-                    #         foundOption = try_xp(radio, f".//label[normalize-space()='{phrase}']", False)
-                    #         if foundOption:
-                    #             answer = f'Decline ({phrase})'
-                    #             ele = foundOption
-                    #             break
-                    actions.move_to_element(ele).click().perform()
+                    if not ele.selected: actions.move_to_element(ele.element).click().perform()
                     if not foundOption: randomly_answered_questions.add((f'{label_org} ]',"radio"))
             else: answer = prev_answer
             questions_list.add((label_org+" ]", answer, "radio", prev_answer))
             continue
         
         # Check if it's a text question
-        text = try_xp(Question, ".//input[@type='text']", False)
-        if text: 
-            do_actions = False
-            label = try_xp(Question, ".//label[@for]", False)
-            try: label = label.find_element(By.CLASS_NAME,'visually-hidden')
-            except: pass
-            label_org = label.text if label else "Unknown"
-            answer = "" # years_of_experience
-            label = label_org.lower()
-
-            prev_answer = text.get_attribute("value")
+        if question.kind == "text": 
+            text = question.element
+
+            prev_answer = question.value
+            value = prev_answer
             if not prev_answer or overwrite_previous_answers:
-                if 'experience' in label or 'years' in label: answer = years_of_experience
-                elif 'phone' in label or 'mobile' in label: answer = phone_number
-                elif 'street' in label: answer = street
-                elif 'city' in label or 'location' in label or 'address' in label:
-                    answer = current_city if current_city else work_location
-                    do_actions = True
-                elif 'signature' in label: answer = full_name # 'signature' in label or 'legal name' in label or 'your name' in label or 'full name' in label: answer = full_name     # What if question is 'name of the city or university you attend, name of referral etc?'
-                elif 'name' in label:
-                    if 'full' in label: answer = full_name
-                    elif 'first' in label and 'last' not in label: answer = first_name
-                    elif 'middle' in label and 'last' not in label: answer = middle_name
-                    elif 'last' in label and 'first' not in label: answer = last_name
-                    elif 'employer' in label: answer = recent_employer
-                    else: answer = full_name
-                elif 'notice' in label:
-                    if 'month' in label:
-                        answer = notice_period_months
-                    elif 'week' in label:
-                        answer = notice_period_weeks
-                    else: answer = notice_period
-                elif 'salary' in label or 'compensation' in label or 'ctc' in label or 'ctoc' in label or 'pay' in label: 
-                    if 'current' in label or 'present' in label:
-                        if 'month' in label:
-                            answer = current_ctc_monthly
-                        elif 'lakh' in label:
-                            answer = current_ctc_lakhs
-                        else:
-                            answer = current_ctc
-                    else:
-                        if 'month' in label:
-                            answer = desired_salary_monthly
-                        elif 'lakh' in label:
-                            answer = desired_salary_lakhs
-                        else:
-                            answer = desired_salary
-                elif 'linkedin' in label: answer = linkedIn
-                elif 'website' in label or 'blog' in label or 'portfolio' in label or 'link' in label: answer = website
-                elif 'scale of 1-10' in label: answer = confidence_level
-                elif 'headline' in label: answer = linkedin_headline
-                elif ('hear' in label or 'come across' in label) and 'this' in label and ('job' in label or 'position' in label): answer = "https://github.com/GodsScion/Auto_job_applier_linkedIn"
-                elif 'state' in label or 'province' in label: answer = state
-                elif 'zip' in label or 'postal' in label or 'code' in label: answer = zipcode
-                elif 'country' in label: answer = country
-                else: answer = answer_common_questions(label,answer)
+                answer, rule = answer_engine.answer("text", label, "", previous_answer=prev_answer, **context)
+                do_actions = rule is not None and rule.autocomplete
+                if answer == "": answer = known_answers.get(label_org, "")
                 ##> ------ Yang Li : MARKYangL - Feature ------
                 if answer == "":
                     if use_AI and aiClient:
                         try:
-                            if ai_provider.lower() == "openai":
-                                answer = ai_answer_question(aiClient, label_org, question_type="text", job_description=job_description, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "deepseek":
-                                answer = deepseek_answer_question(aiClient, label_org, options=None, question_type="text", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "ollama":
-                                answer = ollama_answer_question(aiClient, label_org, options=None, question_type="text", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "gemini":
-                                answer = gemini_answer_question(aiClient, label_org, options=None, question_type="text", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            else:
-                                randomly_answered_questions.add((label_org, "text"))
-                                answer = years_of_experience
+                            answer = run_ai_task(aiClient.answer_question(label_org, question_type="text", job_description=job_description, user_information_all=user_information_all))
                             if answer and isinstance(answer, str) and len(answer) > 0:
                                 print_lg(f'AI Answered received for question "{label_org}" \nhere is answer: "{answer}"')
                             else:
@@ -688,41 +717,31 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
                         randomly_answered_questions.add((label_org, "text"))
                         answer = years_of_experience
                 ##<
-                text.clear()
-                text.send_keys(answer)
-                if do_actions:
-                    sleep(2)
-                    actions.send_keys(Keys.ARROW_DOWN)
-                    actions.send_keys(Keys.ENTER).perform()
-            questions_list.add((label, text.get_attribute("value"), "text", prev_answer))
+                if str(answer) != prev_answer:
+                    text.clear()
+                    text.send_keys(answer)
+                    value = str(answer)
+                    if do_actions:
+                        sleep(2)
+                        actions.send_keys(Keys.ARROW_DOWN)
+                        actions.send_keys(Keys.ENTER).perform()
+                        value = text.get_attribute("value")
+            questions_list.add((label, value, "text", prev_answer))
             continue
 
         # Check if it's a textarea question
-        text_area = try_xp(Question, ".//textarea", False)
-        if text_area:
-            label = try_xp(Question, ".//label[@for]", False)
-            label_org = label.text if label else "Unknown"
-            label = label_org.lower()
-            answer = ""
-            prev_answer = text_area.get_attribute("value")
+        if question.kind == "textarea":
+            text_area = question.element
+            prev_answer = question.value
+            value = prev_answer
             if not prev_answer or overwrite_previous_answers:
-                if 'summary' in label: answer = linkedin_summary
-                elif 'cover' in label: answer = cover_letter
+                answer, rule = answer_engine.answer("textarea", label, "", previous_answer=prev_answer, **context)
+                if answer == "": answer = known_answers.get(label_org, "")
                 if answer == "":
                 ##> ------ Yang Li : MARKYangL - Feature ------
                     if use_AI and aiClient:
                         try:
-                            if ai_provider.lower() == "openai":
-                                answer = ai_answer_question(aiClient, label_org, question_type="textarea", job_description=job_description, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "deepseek":
-                                answer = deepseek_answer_question(aiClient, label_org, options=None, question_type="textarea", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "ollama":
-                                answer = ollama_answer_question(aiClient, label_org, options=None, question_type="textarea", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "gemini":
-                                answer = gemini_answer_question(aiClient, label_org, options=None, question_type="textarea", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            else:
-                                randomly_answered_questions.add((label_org, "textarea"))
-                                answer = ""
+                            answer = run_ai_task(aiClient.answer_question(label_org, question_type="textarea", job_description=job_description, user_information_all=user_information_all))
                             if answer and isinstance(answer, str) and len(answer) > 0:
                                 print_lg(f'AI Answered received for question "{label_org}" \nhere is answer: "{answer}"')
                             else:
@@ -734,25 +753,19 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
                             answer = ""
                     else:
                         randomly_answered_questions.add((label_org, "textarea"))
-            text_area.clear()
-            text_area.send_keys(answer)
-            if do_actions:
-                    sleep(2)
-                    actions.send_keys(Keys.ARROW_DOWN)
-                    actions.send_keys(Keys.ENTER).perform()
-            questions_list.add((label, text_area.get_attribute("value"), "textarea", prev_answer))
+                if str(answer) != prev_answer:
+                    text_area.clear()
+                    text_area.send_keys(answer)
+                    value = str(answer)
+            questions_list.add((label, value, "textarea", prev_answer))
             ##<
             continue
 
         # Check if it's a checkbox question
-        checkbox = try_xp(Question, ".//input[@type='checkbox']", False)
-        if checkbox:
-            label = try_xp(Question, ".//span[@class='visually-hidden']", False)
-            label_org = label.text if label else "Unknown"
-            label = label_org.lower()
-            answer = try_xp(Question, ".//label[@for]", False)  # Sometimes multiple checkboxes are given for 1 question, Not accounted for that yet
-            answer = answer.text if answer else "Unknown"
-            prev_answer = checkbox.is_selected()
+        if question.kind == "checkbox":
+            checkbox = question.element
+            answer = question.options[0].label or "Unknown"  # Sometimes multiple checkboxes are given for 1 question, Not accounted for that yet
+            prev_answer = question.value
             checked = prev_answer
             if not prev_answer:
                 try:
@@ -777,11 +790,13 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
 
 
 
+@tracer.trace("external_apply")
 def external_apply(pagination_element: WebElement, job_id: str, job_link: str, resume: str, date_listed, application_link: str, screenshot_name: str) -> tuple[bool, str, int]:
     '''
     Function to open new tab and save external job application links
     '''
-    global tabs_count, dailyEasyApplyLimitReached
+    global dailyEasyApplyLimitReached
+    tabs_count = get_session_state().tabs_count
     if easy_apply_only:
         try:
             if "exceeded the daily application limit" in driver.find_element(By.CLASS_NAME, "artdeco-inline-feedback__message").text: 
@@ -799,15 +814,15 @@ def external_apply(pagination_element: WebElement, job_id: str, job_link: str, r
         driver.switch_to.window(windows[-1])
         application_link = driver.current_url
         print_lg('Got the external application link "{}"'.format(application_link))
-        if close_tabs and driver.current_window_handle != linkedIn_tab: driver.close()
-        driver.switch_to.window(linkedIn_tab)
+        if close_tabs and driver.current_window_handle != main_tab(): driver.close()
+        driver.switch_to.window(main_tab())
         return False, application_link, tabs_count
     except Exception as e:
         # print_lg(e)
         print_lg("Failed to apply!")
         failed_job(job_id, job_link, resume, date_listed, "Probably didn't find Apply button or unable to switch tabs.", e, application_link, screenshot_name)
         global failed_count
-        failed_count += 1
+        with counts_lock: failed_count += 1
         return True, application_link, tabs_count
 
 
@@ -826,20 +841,24 @@ def follow_company(modal: WebDriver = driver) -> None:
 
 
 #< Failed attempts logging
+def history_error_alert(jobs: Literal["applied", "failed"]) -> None:
+    '''
+    Alerts the user that `jobs` couldn't be saved to history, they are retried on the next write
+    '''
+    on_main_thread(pyautogui.alert, f"Failed to update the excel of {jobs} jobs!\nProbably because of 1 of the following reasons:\n1. The file is currently open or in use by another program\n2. Permission denied to write to the file\n3. Failed to find the file", "Failed Logging")
+
+
+@tracer.trace("save")
 def failed_job(job_id: str, job_link: str, resume: str, date_listed, error: str, exception: Exception, application_link: str, screenshot_name: str) -> None:
     '''
     Function to update failed jobs list in excel
     '''
+    tracer.set_job_status("skipped" if application_link == "Skipped" else "failed")
     try:
-        with open(failed_file_name, 'a', newline='', encoding='utf-8') as file:
-            fieldnames = ['Job ID', 'Job Link', 'Resume Tried', 'Date listed', 'Date Tried', 'Assumed Reason', 'Stack Trace', 'External Job link', 'Screenshot Name']
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-            if file.tell() == 0: writer.writeheader()
-            writer.writerow({'Job ID':job_id, 'Job Link':job_link, 'Resume Tried':resume, 'Date listed':dateListed, 'Date Tried':datetime.now(), 'Assumed Reason':error, 'Stack Trace':exception, 'External Job link':application_link, 'Screenshot Name':screenshot_name})
-            file.close()
+        history.add_failed({'Job ID':job_id, 'Job Link':job_link, 'Resume Tried':resume, 'Date listed':date_listed, 'Date Tried':datetime.now(), 'Assumed Reason':error, 'Stack Trace':exception, 'External Job link':application_link, 'Screenshot Name':screenshot_name})
     except Exception as e:
         print_lg("Failed to update failed jobs list!", e)
-        pyautogui.alert("Failed to update the excel of failed jobs!\nProbably because of 1 of the following reasons:\n1. The file is currently open or in use by another program\n2. Permission denied to write to the file\n3. Failed to find the file", "Failed Logging")
+        history_error_alert("failed")
 
 
 def screenshot(driver: WebDriver, job_id: str, failedAt: str) -> str:
@@ -857,6 +876,7 @@ def screenshot(driver: WebDriver, job_id: str, failedAt: str) -> str:
 
 
 
+@tracer.trace("save")
 def submitted_jobs(job_id: str, title: str, company: str, work_location: str, work_style: str, description: str, experience_required: int | Literal['Unknown', 'Error in extraction'], 
                    skills: list[str] | Literal['In Development'], hr_name: str | Literal['Unknown'], hr_link: str | Literal['Unknown'], resume: str, 
                    reposted: bool, date_listed: datetime | Literal['Unknown'], date_applied:  datetime | Literal['Pending'], job_link: str, application_link: str, 
@@ -864,20 +884,16 @@ def submitted_jobs(job_id: str, title: str, company: str, work_location: str, wo
     '''
     Function to create or update the Applied jobs CSV file, once the application is submitted successfully
     '''
+    tracer.set_job_status("applied")
     try:
-        with open(file_name, mode='a', newline='', encoding='utf-8') as csv_file:
-            fieldnames = ['Job ID', 'Title', 'Company', 'Work Location', 'Work Style', 'About Job', 'Experience required', 'Skills required', 'HR Name', 'HR Link', 'Resume', 'Re-posted', 'Date Posted', 'Date Applied', 'Job Link', 'External Job link', 'Questions Found', 'Connect Request']
-            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-            if csv_file.tell() == 0: writer.writeheader()
-            writer.writerow({'Job ID':job_id, 'Title':title, 'Company':company, 'Work Location':work_location, 'Work Style':work_style, 
+        history.add_applied({'Job ID':job_id, 'Title':title, 'Company':company, 'Work Location':work_location, 'Work Style':work_style, 
                             'About Job':description, 'Experience required': experience_required, 'Skills required':skills, 
                                 'HR Name':hr_name, 'HR Link':hr_link, 'Resume':resume, 'Re-posted':reposted, 
                                 'Date Posted':date_listed, 'Date Applied':date_applied, 'Job Link':job_link, 
                                 'External Job link':application_link, 'Questions Found':questions_list, 'Connect Request':connect_request})
-        csv_file.close()
     except Exception as e:
         print_lg("Failed to update submitted jobs list!", e)
-        pyautogui.alert("Failed to update the excel of applied jobs!\nProbably because of 1 of the following reasons:\n1. The file is currently open or in use by another program\n2. Permission denied to write to the file\n3. Failed to find the file", "Failed Logging")
+        history_error_alert("applied")
 
 
 
@@ -892,14 +908,21 @@ def discard_job() -> None:
 
 
 # Function to apply to jobs
-def apply_to_jobs(search_terms: list[str]) -> None:
-    applied_jobs = get_applied_job_ids()
-    rejected_jobs = set()
-    blacklisted_companies = set()
-    global current_city, failed_count, skip_count, easy_applied_count, external_jobs_count, tabs_count, pause_before_submit, pause_at_failed_question, useNewResume
+def new_search_state() -> tuple[set, set, set, CardFilter]:
+    '''
+    Returns `(applied_jobs, rejected_jobs, blacklisted_companies, card_filter)` of a run, shared by all browser sessions
+    '''
+    blacklisted_companies = set(company_blacklist)
+    return get_applied_job_ids(), set(), blacklisted_companies, CardFilter(blacklisted_companies)
+
+
+def apply_to_jobs(search_terms: list[str], state: tuple[set, set, set, CardFilter] | None = None) -> None:
+    applied_jobs, rejected_jobs, blacklisted_companies, card_filter = state or new_search_state()
+    global current_city, failed_count, skip_count, easy_applied_count, external_jobs_count
     current_city = current_city.strip()
+    session_state = get_session_state()
 
-    if randomize_search_order:  shuffle(search_terms)
+    if randomize_search_order and state is None:  shuffle(search_terms)
     for searchTerm in search_terms:
         driver.get(f"https://www.linkedin.com/jobs/search/?keywords={searchTerm}")
         print_lg("\n________________________________________________________________________________________________________________________\n")
@@ -908,24 +931,72 @@ def apply_to_jobs(search_terms: list[str]) -> None:
         apply_filters()
 
         current_count = 0
+        claimed_job_id = None
         try:
             while current_count < switch_number:
-                # Wait until job listings are loaded
-                wait.until(EC.presence_of_all_elements_located((By.XPATH, "//li[@data-occludable-job-id]")))
-
-                pagination_element, current_page = get_page_info()
-
-                # Find all job listings in current page
-                buffer(3)
-                job_listings = driver.find_elements(By.XPATH, "//li[@data-occludable-job-id]")  
-
+                page_metrics.record_job(driver)
+                tracer.end_job()
+                with tracer.span("job_listings"):
+                    # Wait until job listings are loaded
+                    wait.until(EC.presence_of_all_elements_located((By.XPATH, job_card_xpath)))
+
+                    pagination_element, current_page = get_page_info()
+
+                    # Find all job listings in current page
+                    wait_until_idle(driver, "job_listings", fallback=3, fallback_sleep=buffer)
+                    job_listings = get_job_cards(driver)
+
+                    # Skip irrelevant jobs on their cards alone, without clicking them
+                    job_listings, skipped_cards = card_filter.filter(job_listings)
+                    for card, reason in skipped_cards:
+                        print_lg(f'Skipping "{card["title"]} | {card["company"]}" job ({reason}). Job ID: {card["job_id"]}!')
+                        if card["job_id"] not in card_filter.seen:
+                            rejected_jobs.add(card["job_id"])
+                            with counts_lock: skip_count += 1
+                            card_filter.mark_seen(card["job_id"])
+                    if skipped_cards: print_lg(f"Skipped {len(skipped_cards)} jobs of this page from their cards.")
+
+                    # Fetch details of all jobs of this page at once, so they aren't read from each job's page
+                    job_details = {}
+                    if bulk_job_details:
+                        try:
+                            job_details = fetch_job_details(driver, [card["job_id"] for card in job_listings if card["job_id"] and not card["applied"] and card["job_id"] not in applied_jobs])
+                        except Exception as e:
+                            print_lg("Failed to fetch job details, reading them from the job pages!", e)
+                    # Score relevance of all fetched descriptions of this page as one batch
+                    if job_relevance_threshold > 0 and job_details:
+                        get_relevance_scorer().score_page([details.description for details in job_details.values() if details.description])
             
-                for job in job_listings:
+                for index, job in enumerate(job_listings):
                     if keep_screen_awake: pyautogui.press('shiftright')
                     if current_count >= switch_number: break
                     print_lg("\n-@-\n")
+                    card_filter.mark_seen(job["job_id"])
+                    claimed_job_id = job["job_id"]
+                    if not card_filter.claim(job["job_id"]):
+                        print_lg(f'Skipping "{job["title"]} | {job["company"]}" job, another browser session has it. Job ID: {job["job_id"]}!')
+                        continue
+
+                    page_metrics.record_job(driver)
+                    tracer.start_job()
+                    prefetched = None
+                    if prefetcher:
+                        # Check this and the next few fetched jobs in the background while this one is applied to
+                        prefetcher.prefetch((card["job_id"], job_details[card["job_id"]].description) for card in job_listings[index:index + prefetch_jobs + 1]
+                                            if card["job_id"] in job_details and card["job_id"] not in rejected_jobs and card["company"] not in blacklisted_companies)
+                        prefetched = prefetcher.get(job["job_id"])
+                        if prefetched and prefetched.analysis[1]:
+                            _, _, reason, message, _ = prefetched.analysis
+                            tracer.update_job(job["job_id"], title=job["title"], company=job["company"])
+                            print_lg(message)
+                            failed_job(job["job_id"], "https://www.linkedin.com/jobs/view/"+job["job_id"], "Pending", "Unknown", reason, message, "Skipped", "Not Available")
+                            rejected_jobs.add(job["job_id"])
+                            with counts_lock: skip_count += 1
+                            continue
 
-                    job_id,title,company,work_location,work_style,skip = get_job_main_details(job, blacklisted_companies, rejected_jobs)
+                    job_id,title,company,work_location,work_style,skip = get_job_main_details(job, blacklisted_companies, rejected_jobs, applied_jobs, card_filter)
+                    details = job_details.get(job_id)
+                    tracer.update_job(job_id, title=title, company=company)
                     
                     if skip: continue
                     # Redundant fail safe check for applied jobs!
@@ -950,11 +1021,11 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                     screenshot_name = "Not Available"
 
                     try:
-                        rejected_jobs, blacklisted_companies, jobs_top_card = check_blacklist(rejected_jobs,job_id,company,blacklisted_companies)
+                        rejected_jobs, blacklisted_companies, jobs_top_card = check_blacklist(rejected_jobs,job_id,company,blacklisted_companies, details.about_company if details else None)
                     except ValueError as e:
                         print_lg(e, 'Skipping this job!\n')
                         failed_job(job_id, job_link, resume, date_listed, "Found Blacklisted words in About Company", e, "Skipped", screenshot_name)
-                        skip_count += 1
+                        with counts_lock: skip_count += 1
                         continue
                     except Exception as e:
                         print_lg("Failed to scroll to About Company!")
@@ -963,72 +1034,82 @@ def apply_to_jobs(search_terms: list[str]) -> None:
 
 
                     # Hiring Manager info
-                    try:
-                        hr_info_card = WebDriverWait(driver,2).until(EC.presence_of_element_located((By.CLASS_NAME, "hirer-card__hirer-information")))
-                        hr_link = hr_info_card.find_element(By.TAG_NAME, "a").get_attribute("href")
-                        hr_name = hr_info_card.find_element(By.TAG_NAME, "span").text
-                        # if connect_hr:
-                        #     driver.switch_to.new_window('tab')
-                        #     driver.get(hr_link)
-                        #     wait_span_click("More")
-                        #     wait_span_click("Connect")
-                        #     wait_span_click("Add a note")
-                        #     message_box = driver.find_element(By.XPATH, "//textarea")
-                        #     message_box.send_keys(connect_request_message)
-                        #     if close_tabs: driver.close()
-                        #     driver.switch_to.window(linkedIn_tab) 
-                        # def message_hr(hr_info_card):
-                        #     if not hr_info_card: return False
-                        #     hr_info_card.find_element(By.XPATH, ".//span[normalize-space()='Message']").click()
-                        #     message_box = driver.find_element(By.XPATH, "//div[@aria-label='Write a message…']")
-                        #     message_box.send_keys()
-                        #     try_xp(driver, "//button[normalize-space()='Send']")        
-                    except Exception as e:
-                        print_lg(f'HR info was not given for "{title}" with Job ID: {job_id}!')
-                        # print_lg(e)
+                    if details and details.hirers:
+                        hr_name, hr_link = details.hirers[0]
+                    else:
+                        try:
+                            with tracer.span("hr_card"):
+                                hr_info_card = WebDriverWait(driver,2).until(EC.presence_of_element_located((By.CLASS_NAME, "hirer-card__hirer-information")))
+                            hr_link = hr_info_card.find_element(By.TAG_NAME, "a").get_attribute("href")
+                            hr_name = hr_info_card.find_element(By.TAG_NAME, "span").text
+                            # if connect_hr:
+                            #     driver.switch_to.new_window('tab')
+                            #     driver.get(hr_link)
+                            #     wait_span_click("More")
+                            #     wait_span_click("Connect")
+                            #     wait_span_click("Add a note")
+                            #     message_box = driver.find_element(By.XPATH, "//textarea")
+                            #     message_box.send_keys(connect_request_message)
+                            #     if close_tabs: driver.close()
+                            #     driver.switch_to.window(linkedIn_tab) 
+                            # def message_hr(hr_info_card):
+                            #     if not hr_info_card: return False
+                            #     hr_info_card.find_element(By.XPATH, ".//span[normalize-space()='Message']").click()
+                            #     message_box = driver.find_element(By.XPATH, "//div[@aria-label='Write a message…']")
+                            #     message_box.send_keys()
+                            #     try_xp(driver, "//button[normalize-space()='Send']")        
+                        except Exception as e:
+                            print_lg(f'HR info was not given for "{title}" with Job ID: {job_id}!')
+                            # print_lg(e)
 
 
                     # Calculation of date posted
-                    try:
-                        # try: time_posted_text = find_by_class(driver, "jobs-unified-top-card__posted-date", 2).text
-                        # except: 
-                        time_posted_text = jobs_top_card.find_element(By.XPATH, './/span[contains(normalize-space(), " ago")]').text
-                        print("Time Posted: " + time_posted_text)
-                        if time_posted_text.__contains__("Reposted"):
-                            reposted = True
-                            time_posted_text = time_posted_text.replace("Reposted", "")
-                        date_listed = calculate_date_posted(time_posted_text)
-                    except Exception as e:
-                        print_lg("Failed to calculate the date posted!",e)
+                    if details and details.listed_at:
+                        date_listed, reposted = details.listed_at, details.reposted
+                    else:
+                        try:
+                            # try: time_posted_text = find_by_class(driver, "jobs-unified-top-card__posted-date", 2).text
+                            # except: 
+                            if jobs_top_card is None: jobs_top_card = find_jobs_top_card()  # Not read when About Company was fetched
+                            time_posted_text = jobs_top_card.find_element(By.XPATH, './/span[contains(normalize-space(), " ago")]').text
+                            print("Time Posted: " + time_posted_text)
+                            if time_posted_text.__contains__("Reposted"):
+                                reposted = True
+                                time_posted_text = time_posted_text.replace("Reposted", "")
+                            date_listed = calculate_date_posted(time_posted_text)
+                        except Exception as e:
+                            print_lg("Failed to calculate the date posted!",e)
 
 
-                    description, experience_required, skip, reason, message = get_job_description()
+                    if prefetched:
+                        description = prefetched.description
+                        experience_required, skip, reason, message, skills = prefetched.analysis
+                        if skills is None: skills = "Needs an AI"
+                    elif details and details.description:
+                        description = details.description
+                        try:
+                            experience_required, skip, reason, message = analyze_job_description(description)
+                        except Exception as e:
+                            print_lg("Unable to extract years of experience required!")
+                            experience_required, skip, reason, message = "Error in extraction", False, None, None
+                    else:
+                        description, experience_required, skip, reason, message = get_job_description()
                     if skip:
                         print_lg(message)
                         failed_job(job_id, job_link, resume, date_listed, reason, message, "Skipped", screenshot_name)
                         rejected_jobs.add(job_id)
-                        skip_count += 1
+                        with counts_lock: skip_count += 1
                         continue
 
                     
-                    if use_AI and description != "Unknown":
-                        ##> ------ Yang Li : MARKYangL - Feature ------
-                        try:
-                            if ai_provider.lower() == "openai":
-                                skills = ai_extract_skills(aiClient, description)
-                            elif ai_provider.lower() == "deepseek":
-                                skills = deepseek_extract_skills(aiClient, description)
-                            elif ai_provider.lower() == "ollama":
-                                skills = ollama_extract_skills(aiClient, description)
-                            elif ai_provider.lower() == "gemini":
-                                skills = gemini_extract_skills(aiClient, description)
-                            else:
-                                skills = "In Development"
-                            print_lg(f"Extracted skills using {ai_provider} AI")
-                        except Exception as e:
-                            print_lg("Failed to extract skills:", e)
-                            skills = "Error extracting skills"
-                        ##<
+                    if use_AI and aiClient and description != "Unknown" and not isinstance(skills, Future):
+                        # Skills are extracted while the form is filled, they are needed only when saving the application
+                        skills = extract_skills_once(description)
+
+                    if not submission_budget.reserve():
+                        card_filter.release(job_id)
+                        print_lg(f"\n###############  Limit of {max_applications_per_run} applications is reached!  ###############\n")
+                        return
 
                     uploaded = False
                     # Case 1: Easy Apply Button
@@ -1047,9 +1128,9 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                                 while next_button:
                                     next_counter += 1
                                     if next_counter >= 15: 
-                                        if pause_at_failed_question:
+                                        if session_state.pause_at_failed_question:
                                             screenshot(driver, job_id, "Needed manual intervention for failed question")
-                                            pyautogui.alert("Couldn't answer one or more questions.\nPlease click \"Continue\" once done.\nDO NOT CLICK Back, Next or Review button in LinkedIn.\n\n\n\n\nYou can turn off \"Pause at failed question\" setting in config.py", "Help Needed", "Continue")
+                                            on_main_thread(pyautogui.alert, "Couldn't answer one or more questions.\nPlease click \"Continue\" once done.\nDO NOT CLICK Back, Next or Review button in LinkedIn.\n\n\n\n\nYou can turn off \"Pause at failed question\" setting in config.py", "Help Needed", "Continue")
                                             next_counter = 1
                                             continue
                                         if questions_list: print_lg("Stuck for one or some of the following questions...", questions_list)
@@ -1057,7 +1138,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                                         errored = "stuck"
                                         raise Exception("Seems like stuck in a continuous loop of next, probably because of new questions.")
                                     questions_list = answer_questions(modal, questions_list, work_location, job_description=description)
-                                    if useNewResume and not uploaded: uploaded, resume = upload_resume(modal, default_resume_path)
+                                    if session_state.use_new_resume and not uploaded: uploaded, resume = upload_resume(modal, default_resume_path)
                                     try: next_button = modal.find_element(By.XPATH, './/span[normalize-space(.)="Review"]') 
                                     except NoSuchElementException:  next_button = modal.find_element(By.XPATH, './/button[contains(span, "Next")]')
                                     try: next_button.click()
@@ -1070,17 +1151,17 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                                     print_lg("Answered the following questions...", questions_list)
                                     print("\n\n" + "\n".join(str(question) for question in questions_list) + "\n\n")
                                 wait_span_click(driver, "Review", 1, scrollTop=True)
-                                cur_pause_before_submit = pause_before_submit
+                                cur_pause_before_submit = session_state.pause_before_submit
                                 if errored != "stuck" and cur_pause_before_submit:
-                                    decision = pyautogui.confirm('1. Please verify your information.\n2. If you edited something, please return to this final screen.\n3. DO NOT CLICK "Submit Application".\n\n\n\n\nYou can turn off "Pause before submit" setting in config.py\nTo TEMPORARILY disable pausing, click "Disable Pause"', "Confirm your information",["Disable Pause", "Discard Application", "Submit Application"])
+                                    decision = on_main_thread(pyautogui.confirm, '1. Please verify your information.\n2. If you edited something, please return to this final screen.\n3. DO NOT CLICK "Submit Application".\n\n\n\n\nYou can turn off "Pause before submit" setting in config.py\nTo TEMPORARILY disable pausing, click "Disable Pause"', "Confirm your information",["Disable Pause", "Discard Application", "Submit Application"])
                                     if decision == "Discard Application": raise Exception("Job application discarded by user!")
-                                    pause_before_submit = False if "Disable Pause" == decision else True
+                                    session_state.pause_before_submit = False if "Disable Pause" == decision else True
                                     # try_xp(modal, ".//span[normalize-space(.)='Review']")
                                 follow_company(modal)
                                 if wait_span_click(driver, "Submit application", 2, scrollTop=True): 
                                     date_applied = datetime.now()
                                     if not wait_span_click(driver, "Done", 2): actions.send_keys(Keys.ESCAPE).perform()
-                                elif errored != "stuck" and cur_pause_before_submit and "Yes" in pyautogui.confirm("You submitted the application, didn't you 😒?", "Failed to find Submit Application!", ["Yes", "No"]):
+                                elif errored != "stuck" and cur_pause_before_submit and "Yes" in on_main_thread(pyautogui.confirm, "You submitted the application, didn't you 😒?", "Failed to find Submit Application!", ["Yes", "No"]):
                                     date_applied = datetime.now()
                                     wait_span_click(driver, "Done", 2)
                                 else:
@@ -1095,25 +1176,43 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                             # print_lg(e)
                             critical_error_log("Somewhere in Easy Apply process",e)
                             failed_job(job_id, job_link, resume, date_listed, "Problem in Easy Applying", e, application_link, screenshot_name)
-                            failed_count += 1
+                            with counts_lock: failed_count += 1
+                            submission_budget.release()
+                            card_filter.release(job_id)
                             discard_job()
                             continue
                     else:
                         # Case 2: Apply externally
-                        skip, application_link, tabs_count = external_apply(pagination_element, job_id, job_link, resume, date_listed, application_link, screenshot_name)
+                        skip, application_link, session_state.tabs_count = external_apply(pagination_element, job_id, job_link, resume, date_listed, application_link, screenshot_name)
                         if dailyEasyApplyLimitReached:
+                            submission_budget.release()
+                            card_filter.release(job_id)
                             print_lg("\n###############  Daily application limit for Easy Apply is reached!  ###############\n")
                             return
-                        if skip: continue
+                        if skip:
+                            submission_budget.release()
+                            card_filter.release(job_id)
+                            continue
 
+                    if isinstance(skills, Future):
+                        with tracer.span("ai_skills"):
+                            try:
+                                skills = skills.result()
+                                print_lg(f"Extracted skills using {ai_provider} AI")
+                            except Exception as e:
+                                print_lg("Failed to extract skills:", e)
+                                skills = "Error extracting skills"
+                    try: learn_answers(questions_list, set(randomly_answered_questions))
+                    except Exception as e: print_lg("Failed to save answers to semantic index!", e)
                     submitted_jobs(job_id, title, company, work_location, work_style, description, experience_required, skills, hr_name, hr_link, resume, reposted, date_listed, date_applied, job_link, application_link, questions_list, connect_request)
-                    if uploaded:   useNewResume = False
+                    applied_jobs.add(job_id)
+                    if uploaded:   session_state.use_new_resume = False
 
                     print_lg(f'Successfully saved "{title} | {company}" job. Job ID: {job_id} info')
                     current_count += 1
-                    if application_link == "Easy Applied": easy_applied_count += 1
-                    else:   external_jobs_count += 1
-                    applied_jobs.add(job_id)
+                    with counts_lock:
+                        if application_link == "Easy Applied": easy_applied_count += 1
+                        else:   external_jobs_count += 1
 
 
 
@@ -1131,24 +1230,31 @@ def apply_to_jobs(search_terms: list[str]) -> None:
         except Exception as e:
             print_lg("Failed to find Job listings!")
             critical_error_log("In Applier", e)
-            print_lg(driver.page_source, pretty=True)
+            # Let other sessions retry the job this one failed on
+            if claimed_job_id and claimed_job_id not in applied_jobs and claimed_job_id not in rejected_jobs: card_filter.release(claimed_job_id)
+            if is_log_enabled("DEBUG"): print_lg(driver.page_source, pretty=True, level="DEBUG")
             # print_lg(e)
 
         
 def run(total_runs: int) -> int:
-    if dailyEasyApplyLimitReached:
+    if dailyEasyApplyLimitReached or submission_budget.exhausted:
         return total_runs
     print_lg("\n########################################################################################################################\n")
     print_lg(f"Date and Time: {datetime.now()}")
     print_lg(f"Cycle number: {total_runs}")
     print_lg(f"Currently looking for jobs posted within '{date_posted}' and sorting them by '{sort_by}'")
-    apply_to_jobs(search_terms)
+    if pool and len(pool.sessions) > 1:
+        if randomize_search_order:  shuffle(search_terms)
+        state = new_search_state()
+        Scheduler(pool, submission_budget).run(search_terms, lambda searchTerm: apply_to_jobs([searchTerm], state))
+    else:
+        apply_to_jobs(search_terms)
     print_lg("########################################################################################################################\n")
-    if not dailyEasyApplyLimitReached:
-        print_lg("Sleeping for 10 min...")
-        sleep(300)
-        print_lg("Few more min... Gonna start with in next 5 min...")
-        sleep(300)
+    if run_non_stop and not dailyEasyApplyLimitReached and run_cooldown_minutes:
+        print_lg(f"Sleeping for {run_cooldown_minutes} min...")
+        sleep(run_cooldown_minutes * 30)
+        print_lg(f"Few more min... Gonna start with in next {run_cooldown_minutes / 2:g} min...")
+        sleep(run_cooldown_minutes * 30)
     buffer(3)
     return total_runs + 1
 
@@ -1157,22 +1263,19 @@ def run(total_runs: int) -> int:
 chatGPT_tab = False
 linkedIn_tab = False
 
-def ai_close_ollama_client(client):
-    """
-    Function to close an OpenAI client.
-    * Takes in `client` of type `OpenAI`
-    * Returns no value
-    """
-    try:
-        if client:
-            print_lg("Closing Ollama client...")
-            client.close()
-    except Exception as e:
-        ai_error_alert("Error occurred while closing Ollama client.", e)
+pool: BrowserPool | None = None
+submission_budget = SubmissionBudget(max_applications_per_run)
+
+def main_tab() -> str:
+    '''
+    Returns the LinkedIn tab of the calling thread's browser session
+    '''
+    session = current_session()
+    return session.main_tab if session else linkedIn_tab
 
 def main() -> None:
     try:
-        global linkedIn_tab, tabs_count, useNewResume, aiClient
+        global linkedIn_tab, useNewResume, aiClient, prefetcher, pool, driver, wait, actions
         alert_title = "Error Occurred. Closing Browser!"
         total_runs = 1        
         validate_config()
@@ -1182,9 +1285,11 @@ def main() -> None:
             useNewResume = False
         
         # Login to LinkedIn
-        tabs_count = len(driver.window_handles)
+        get_session_state().tabs_count = len(driver.window_handles)
         driver.get("https://www.linkedin.com/login")
         if not is_logged_in_LN(): login_LN()
+        # Blocked only after login, so the login and verification pages load fully
+        apply_resource_policy(driver)
         
         linkedIn_tab = driver.current_window_handle
 
@@ -1202,18 +1307,16 @@ def main() -> None:
         if use_AI:
             ##> ------ Yang Li : MARKYangL - Feature ------
             print_lg(f"Initializing AI client for {ai_provider}...")
-            if ai_provider.lower() == "openai":
-                aiClient = ai_create_openai_client()
-            elif ai_provider.lower() == "deepseek":
-                aiClient = deepseek_create_client()
-            elif ai_provider.lower() == "ollama":
-                aiClient = ollama_create_client()
-            elif ai_provider.lower() == "gemini":
-                aiClient = gemini_create_client()
-            else:
-                print_lg(f"Unknown AI provider: {ai_provider}. Supported providers are: openai, deepseek")
-                aiClient = None
+            aiClient = get_provider(ai_provider)
             ##<
+        if prefetch_jobs and bulk_job_details:
+            prefetcher = JobPrefetcher(analyze_prefetched_job, prefetch_workers)
+        if browser_sessions > 1:
+            # Other sessions get the login of this one, code using `driver`, `wait` and `actions` uses the session of its thread
+            pool = BrowserPool(driver, open_chrome, browser_sessions)
+            for session in pool.sessions[1:]: apply_resource_policy(session.driver)
+            print_lg(f"Applying with {len(pool.sessions)} browser sessions")
+            driver, wait, actions = SessionProxy("driver", driver), SessionProxy("wait", wait), SessionProxy("actions", actions)
         # Start applying to jobs
         driver.switch_to.window(linkedIn_tab)
         total_runs = run(total_runs)
@@ -1228,7 +1331,7 @@ def main() -> None:
                 total_runs = run(total_runs)
                 sort_by = "Most recent" if sort_by == "Most relevant" else "Most relevant"
             total_runs = run(total_runs)
-            if dailyEasyApplyLimitReached:
+            if dailyEasyApplyLimitReached or submission_budget.exhausted:
                 break
         
 
@@ -1244,6 +1347,12 @@ def main() -> None:
         print_lg("Total applied or collected:     {}".format(easy_applied_count + external_jobs_count))
         print_lg("\nFailed jobs:                    {}".format(failed_count))
         print_lg("Irrelevant jobs skipped:        {}\n".format(skip_count))
+        print_lg("\nTime spent per phase:\n" + tracer.summary() + "\n")
+        if page_metrics.requests: print_lg(f"Pages: {page_metrics.summary()}\n")
+        if use_AI and get_answer_cache(): print_lg(f"AI answers cache: {get_answer_cache().stats()}\n")
+        if use_AI and get_skills_cache(): print_lg(f"AI skills cache: {get_skills_cache().stats()}\n")
+        if use_AI: print_lg(f"AI usage:\n{usage_summary()}\n")
+        if get_semantic_index(): print_lg(f"Semantic index: {get_semantic_index().stats()}\n")
         if randomly_answered_questions: print_lg("\n\nQuestions randomly answered:\n  {}  \n\n".format(";\n".join(str(question) for question in randomly_answered_questions)))
         quote = choice([
             "You're one step closer than before.", 
@@ -1262,27 +1371,24 @@ def main() -> None:
         msg = f"\n{quote}\n\n\nBest regards,\nSai Vignesh Golla\nhttps://www.linkedin.com/in/saivigneshgolla/\n\n"
         pyautogui.alert(msg, "Exiting..")
         print_lg(msg,"Closing the browser...")
-        if tabs_count >= 10:
+        if max((state.tabs_count for state in session_states.values()), default=0) >= 10:
             msg = "NOTE: IF YOU HAVE MORE THAN 10 TABS OPENED, PLEASE CLOSE OR BOOKMARK THEM!\n\nOr it's highly likely that application will just open browser and not do anything next time!" 
             pyautogui.alert(msg,"Info")
             print_lg("\n"+msg)
         ##> ------ Yang Li : MARKYangL - Feature ------
         if use_AI and aiClient:
-            try:
-                if ai_provider.lower() == "openai":
-                    ai_close_openai_client(aiClient)
-                elif ai_provider.lower() == "deepseek":
-                    ai_close_openai_client(aiClient)  
-                elif ai_provider.lower() == "ollama":
-                    ai_close_ollama_client(aiClient)  
-                elif ai_provider.lower() == "gemini":
-                    gemini_close_client(aiClient)  
-                
-                print_lg(f"Closed {ai_provider} AI client.")
-            except Exception as e:
-                print_lg("Failed to close AI client:", e)
+            close_providers()
+            print_lg(f"Closed {ai_provider} AI client.")
         ##<
-        try: driver.quit()
+        if prefetcher: prefetcher.close()
+        if pool: pool.close()
+        try: history.flush()
+        except Exception as e:
+            critical_error_log("When saving jobs history...", e)
+            history_error_alert("failed")
+        try: history.close()
+        except Exception as e: critical_error_log("When saving jobs history...", e)
+        try: close_chrome()
         except Exception as e: critical_error_log("When quitting...", e)
 
 
@@ -1292,14 +1398,9 @@ if __name__ == "__main__":
     from pathlib import Path
 
     def ensure_setup():
-        # Check if ChromeDriver exists and is executable
-        chrome_driver_exists = False
-        for path in os.environ["PATH"].split(os.pathsep):
-            chrome_driver = os.path.join(path, "chromedriver")
-            if os.path.exists(chrome_driver) and os.access(chrome_driver, os.X_OK):
-                chrome_driver_exists = True
-                break
-                
+        # Check if a ChromeDriver for the installed Chrome exists (remembered after the first start, bundled or in PATH), if Chrome is installed a matching one is downloaded when it starts
+        chrome_driver_exists = resolve_chromedriver(download=False) is not None or find_chrome() is not None
+
         if not chrome_driver_exists:
             print("ChromeDriver not found. Running setup script...")
             setup_script = os.path.join(Path(__file__).parent, "setup", "setup.py")
@@ -17,6 +17,7 @@ from datetime import datetime
 
 # TEST RELATED IMPORTS
 from modules.ai.openaiConnections import *
+from modules.helpers import print_lg
 from pprint import pprint
 
 #< Global Variables and logics
@@ -0,0 +1,138 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+import asyncio
+
+import pytest
+
+import modules.ai.cache as ai_cache
+from modules.ai.cache import AICache, answer_key, cache_answer, cache_skills, is_valid_answer, is_valid_skills, skills_key
+
+
+
+@pytest.fixture
+def answers(tmp_path, monkeypatch) -> AICache:
+    cache = AICache("answers", str(tmp_path / "cache.db"), max_entries=3, ttl_days=1)
+    monkeypatch.setattr(ai_cache, "get_answer_cache", lambda: cache)
+    monkeypatch.setattr(ai_cache, "ai_answer_review_file", str(tmp_path / "review.csv"))
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def skills(tmp_path, monkeypatch) -> AICache:
+    cache = AICache("skills", str(tmp_path / "cache.db"), max_bytes=100)
+    monkeypatch.setattr(ai_cache, "get_skills_cache", lambda: cache)
+    yield cache
+    cache.close()
+
+
+def test_get_put_and_forget(answers):
+    assert answers.get("key") is None
+    answers.put("key", "5", "years of java")
+    answers.put("other", {"a": [1]}, "years of java")
+    assert answers.get("key") == "5"
+    assert answers.get("other") == {"a": [1]}
+    assert answers.stats() == "2 hits, 1 misses (67% hit rate)"
+    assert answers.forget("years of java") == 2
+    assert answers.get("key") is None
+
+
+def test_expired_entries_are_not_used(answers):
+    answers.put("key", "5")
+    answers.connection.execute("UPDATE answers SET created = created - 2 * 24 * 3600")
+    assert answers.get("key") is None
+    assert answers.connection.execute("SELECT COUNT(*) FROM answers").fetchone()[0] == 0
+
+
+def test_least_recently_used_are_evicted(answers):
+    for key in ["a", "b", "c"]:
+        answers.put(key, key)
+    answers.connection.execute("UPDATE answers SET last_used = last_used - 10 WHERE key != 'a'")
+    answers.put("d", "d")
+    assert [answers.get(key) for key in ["a", "b", "c", "d"]] == ["a", None, "c", "d"]
+
+
+def test_answer_key_ignores_case_spacing_and_option_order():
+    key = answer_key("Years of  Java?", "single_select", ["Yes", "No"], "Job one", "About me")
+    assert key == answer_key("years of java?", "single_select", ["no", "yes"], "Job two", "about  me")
+    assert key != answer_key("Years of Java?", "single_select", ["Yes", "No"], "Job one", "Someone else")
+    assert answer_key("Why us?", "textarea", None, "Job one", "") != answer_key("Why us?", "textarea", None, "Job two", "")
+
+
+def test_only_valid_answers_are_cached(answers):
+    calls = []
+
+    @cache_answer
+    def answer_question(question: str, question_type: str = "text", options: list[str] | None = None, job_description: str | None = None, user_information_all: str | None = None):
+        calls.append(question)
+        return "Error: quota" if "fail" in question else "3"
+
+    assert answer_question("Years of Python?") == "3"
+    assert answer_question("years of  python?") == "3"
+    assert answer_question("Will this fail?") == "Error: quota"
+    assert answer_question("Will this fail?") == "Error: quota"
+    assert calls == ["Years of Python?", "Will this fail?", "Will this fail?"]
+    assert not is_valid_answer("  ") and not is_valid_answer({})
+
+
+def test_coroutines_are_cached(answers):
+    calls = []
+
+    @cache_answer
+    async def answer_question(question: str, question_type: str = "text"):
+        calls.append(question)
+        return "Immediately"
+
+    assert asyncio.run(answer_question("Notice period?")) == "Immediately"
+    assert asyncio.run(answer_question("Notice period?")) == "Immediately"
+    assert calls == ["Notice period?"]
+
+
+def test_skills_are_evicted_past_max_bytes(skills):
+    skills.put("old", "x" * 40)
+    skills.connection.execute("UPDATE skills SET last_used = last_used - 10")
+    skills.put("new", "y" * 40)
+    skills.put("newest", "z" * 40)
+    assert skills.get("old") is None
+    assert skills.get("new") and skills.get("newest")
+
+
+def test_skills_key_per_provider_and_model(monkeypatch):
+    key = skills_key("Python  Developer", "openai", "gpt-4o")
+    assert key == skills_key("python developer", "openai", "gpt-4o")
+    assert key != skills_key("Python Developer", "gemini", "gemini-pro")
+    monkeypatch.setattr(ai_cache, "ai_skills_cache_shared", True)
+    assert skills_key("Python Developer", "openai", "gpt-4o") == skills_key("Python Developer", "gemini", "gemini-pro")
+
+
+def test_only_valid_skills_are_cached(skills):
+    class Provider:
+        name, model = "openai", "gpt-4o"
+        calls = 0
+
+        @cache_skills()
+        def extract_skills(self, job_description: str):
+            self.calls += 1
+            return {"error": "quota"} if "fail" in job_description else {"tech_stack": ["Python"]}
+
+    provider = Provider()
+    assert provider.extract_skills("Python developer") == {"tech_stack": ["Python"]}
+    assert provider.extract_skills("python  developer") == {"tech_stack": ["Python"]}
+    provider.extract_skills("fail")
+    provider.extract_skills("fail")
+    assert provider.calls == 3
+    assert skills.connection.execute("SELECT label FROM skills").fetchall() == [("openai:gpt-4o",)]
+    assert not is_valid_skills(None) and not is_valid_skills({}) and is_valid_skills(["Python"])
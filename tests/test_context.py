@@ -0,0 +1,78 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+from modules.ai.context import strip_boilerplate, compact_description
+
+
+
+def test_keeps_requirements_about_benefit_domains():
+    description = """
+Requirements:
+5+ years of experience with health insurance claims processing
+Experience with dental and vision plan administration
+We build claims software for health insurance carriers
+Must pass a background check
+"""
+    assert strip_boilerplate(description) == [
+        "Requirements:",
+        "5+ years of experience with health insurance claims processing",
+        "Experience with dental and vision plan administration",
+        "We build claims software for health insurance carriers",
+        "Must pass a background check",
+    ]
+
+
+def test_drops_legal_lines_anywhere():
+    description = """
+Build APIs in Python.
+We are an equal opportunity employer and consider applicants without regard to race or national origin.
+Participation in E-Verify.
+"""
+    assert strip_boilerplate(description) == ["Build APIs in Python."]
+
+
+def test_drops_benefits_sections_and_lists():
+    description = """
+Responsibilities:
+Design data pipelines
+Benefits
+Health insurance
+401k matching
+What you'll need:
+Strong SQL
+Medical insurance, dental and vision insurance
+Paid time off and parental leave
+Gym membership
+Cloud experience
+"""
+    assert strip_boilerplate(description) == [
+        "Responsibilities:", "Design data pipelines", "What you'll need:", "Strong SQL", "Cloud experience",
+    ]
+
+
+def test_single_benefit_line_is_kept():
+    assert strip_boilerplate("Join our team building dental practice software\nPython") == [
+        "Join our team building dental practice software", "Python",
+    ]
+
+
+def test_headings_match_whole_words():
+    assert strip_boilerplate("Career growth\nLead a team") == ["Career growth", "Lead a team"]
+    assert strip_boilerplate("Privacy\nWe store your data\nRequirements:\nJava") == ["Requirements:", "Java"]
+
+
+def test_compact_description_keeps_requirements_first():
+    description = "\n".join(["About us, a long story about the company."] * 20 + ["Must have 5 years of Java experience."])
+    assert compact_description(description, 20).endswith("Must have 5 years of Java experience.")
@@ -0,0 +1,90 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+from threading import Thread
+
+import pytest
+
+import modules.filters as filters
+from modules.filters import CardFilter, describe_hits
+from modules.keywords import KeywordMatcher, noun_suffixes
+
+
+
+def make_card(job_id: str, title: str | None, company: str | None) -> dict:
+    return {"job_id": job_id, "title": title, "company": company}
+
+
+@pytest.fixture
+def card_filter(monkeypatch) -> CardFilter:
+    monkeypatch.setattr(filters, "bad_words", ["QA"])
+    monkeypatch.setattr(filters, "company_bad_words_filter", KeywordMatcher(["Staffing"], whole_words=True, suffixes=noun_suffixes))
+    monkeypatch.setattr(filters, "company_good_words_filter", KeywordMatcher(["Robert Half"], whole_words=True, suffixes=noun_suffixes))
+    return CardFilter({"Initech"}, include_titles=["Python", "Backend"], exclude_titles=["Intern"], skip_seen=True)
+
+
+@pytest.mark.parametrize("title, company, reason", [
+    ("Python Developer", "Acme", None),
+    ("Senior Backend Engineer", "acme", None),
+    ("Python Developer", "INITECH", "Blacklisted company"),
+    ("Python Developer", "Acme Staffing", 'Bad word "Staffing" in company name'),
+    ("Python Developer", "Robert Half Staffing", None),
+    ("Python Interns", "Acme", 'Excluded word "Intern" in title'),
+    ("Python QA Engineer", "Acme", 'Excluded word "QA" in title'),
+    ("Java Developer", "Acme", "Title has none of the included words"),
+    ("Pythonista", "Acme", "Title has none of the included words"),
+    (None, "Acme", None),
+])
+def test_check_card(card_filter, title, company, reason):
+    assert card_filter.check_card(make_card("1", title, company)) == reason
+
+
+def test_companies_added_later_are_skipped(card_filter):
+    card = make_card("1", "Python Developer", "Globex")
+    assert card_filter.check(card) is None
+    card_filter.companies.add("Globex")
+    assert card_filter.check(card) == "Blacklisted company"
+
+
+def test_seen_jobs_are_skipped(card_filter):
+    kept, skipped = card_filter.filter([make_card("1", "Python Developer", "Acme"), make_card("2", "Java Developer", "Acme")])
+    assert [card["job_id"] for card in kept] == ["1"]
+    assert [(card["job_id"], reason) for card, reason in skipped] == [("2", "Title has none of the included words")]
+    card_filter.mark_seen("1")
+    assert card_filter.check(make_card("1", "Python Developer", "Acme")) == "Seen for an earlier search term"
+    card_filter.skip_seen = False
+    assert card_filter.check(make_card("1", "Python Developer", "Acme")) is None
+
+
+def test_claims_are_per_thread(card_filter):
+    results = {}
+    def claim_in_thread(name: str, release: bool = False) -> None:
+        if release: card_filter.release("1")
+        results[name] = card_filter.claim("1")
+
+    assert card_filter.claim("1") and card_filter.claim("1")
+    other = Thread(target=claim_in_thread, args=("other", True))
+    other.start(); other.join()
+    assert results["other"] is False    # Another thread can't release or take this thread's claim
+    card_filter.release("1")
+    other = Thread(target=claim_in_thread, args=("after release",))
+    other.start(); other.join()
+    assert results["after release"] is True
+    assert not card_filter.claim("1")
+
+
+def test_describe_hits():
+    text = "We are looking for a QA engineer to join us"
+    assert describe_hits(text, [(21, 23, "QA")], margin=8) == '"QA" at 21: "...g for a QA enginee..."'
@@ -0,0 +1,137 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+import pytest
+
+import modules.history as history
+from modules.history import CSVHistory, SQLiteHistory, append_csv_rows, applied_fieldnames, decode_cursor, encode_cursor, matches_filters
+
+
+
+def make_job(job_id: str, title: str, company: str, date_applied: str) -> dict:
+    return {"Job ID": job_id, "Title": title, "Company": company, "Date Applied": date_applied, "Job Link": f"https://www.linkedin.com/jobs/view/{job_id}"}
+
+
+jobs = [
+    make_job("1", "Python Developer", "Acme", "2024-01-05 10:00:00"),
+    make_job("2", "Data Engineer", "Globex", "2024-02-10 09:30:00"),
+    make_job("3", "Backend Developer", "acme labs", "Pending"),
+    make_job("4", "QA Engineer", "Initech", "2024-03-01 12:00:00"),
+]
+
+
+@pytest.fixture
+def csv_paths(tmp_path, monkeypatch) -> tuple[str, str]:
+    applied_path, failed_path = str(tmp_path / "applied.csv"), str(tmp_path / "failed.csv")
+    monkeypatch.setattr(history, "file_name", applied_path)
+    monkeypatch.setattr(history, "failed_file_name", failed_path)
+    return applied_path, failed_path
+
+
+@pytest.fixture(params=["sqlite", "csv"])
+def store(request, tmp_path, csv_paths):
+    store = SQLiteHistory(str(tmp_path / "history.db"), export_csv=False) if request.param == "sqlite" else CSVHistory()
+    for job in jobs:
+        store.add_applied(job)
+    yield store
+    store.close()
+
+
+def list_ids(store, **options) -> list[str]:
+    return [job["Job ID"] for _, job in store.iter_applied_jobs(**options)]
+
+
+def test_cursor_round_trip():
+    for key in [[5], ["acme", 3], ["Ünïcode / 😀", 1]]:
+        assert decode_cursor(encode_cursor(key)) == key
+    for cursor in ["not a cursor", encode_cursor([])[:-1], "bnVsbA=="]:
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+def test_matches_filters():
+    assert matches_filters(jobs[0], {"company": "ACME", "title": "python"})
+    assert not matches_filters(jobs[1], {"company": "acme"})
+    assert matches_filters(jobs[1], {"date_from": "2024-02-10", "date_to": "2024-02-10"})
+    assert not matches_filters(jobs[2], {"date_from": "2000-01-01"})
+    assert matches_filters(jobs[2], None)
+
+
+def test_pages_continue_from_cursor(store):
+    first = list(store.iter_applied_jobs(limit=3))
+    assert [job["Job ID"] for _, job in first] == ["1", "2", "3"]
+    assert list_ids(store, cursor=first[-1][0]) == ["4"]
+    assert list_ids(store, descending=True, limit=2) == ["4", "3"]
+
+
+def test_sort_and_cursor_are_case_insensitive(store):
+    assert list_ids(store, sort_by="Company") == ["1", "3", "2", "4"]
+    first = list(store.iter_applied_jobs(sort_by="Company", limit=2))
+    assert list_ids(store, sort_by="Company", cursor=first[-1][0]) == ["2", "4"]
+    assert list_ids(store, sort_by="Title", descending=True, limit=2) == ["4", "1"]
+
+
+def test_filters(store):
+    assert list_ids(store, filters={"company": "acme"}) == ["1", "3"]
+    assert list_ids(store, filters={"title": "engineer", "date_from": "2024-03-01"}) == ["4"]
+    assert list_ids(store, filters={"date_to": "2024-02-10"}) == ["1", "2"]
+    assert list_ids(store, filters={"company": "%"}) == []
+
+
+def test_update_date_applied(store):
+    assert store.update_date_applied(["3", "99", "3"], "2024-04-01 08:00:00") == ["3"]
+    assert list_ids(store, filters={"date_from": "2024-04-01"}) == ["3"]
+
+
+def test_update_date_applied_patches_exported_csv(tmp_path, csv_paths):
+    store = SQLiteHistory(str(tmp_path / "history.db"), export_csv=True)
+    for job in jobs:
+        store.add_applied(job)
+    store.update_date_applied(["2", "99"], "2024-04-01 08:00:00")
+    rows = history.read_csv_rows(csv_paths[0], applied_fieldnames)
+    assert [row["Date Applied"] for row in rows] == ["2024-01-05 10:00:00", "2024-04-01 08:00:00", "Pending", "2024-03-01 12:00:00"]
+    store.close()
+
+
+def test_failed_jobs_are_written_in_batches(tmp_path, csv_paths):
+    store = SQLiteHistory(str(tmp_path / "history.db"), batch_size=2, export_csv=False)
+    count = lambda: store.connection.execute("SELECT COUNT(*) FROM failed_jobs").fetchone()[0]
+    store.add_failed({"Job ID": "1", "Date Tried": "2024-01-01 10:00:00"})
+    assert count() == 0
+    store.add_failed({"Job ID": "2", "Date Tried": "2024-01-01 10:05:00"})
+    assert count() == 2
+    store.close()
+
+
+def test_new_database_imports_csvs_once(tmp_path, csv_paths):
+    applied_path, failed_path = csv_paths
+    append_csv_rows(applied_path, applied_fieldnames, jobs[:2])
+    append_csv_rows(failed_path, history.failed_fieldnames, [{"Job ID": "9", "Date Tried": "2024-01-01 10:00:00"}])
+    store = SQLiteHistory(str(tmp_path / "history.db"), export_csv=False)
+    assert store.applied_job_ids() == {"1", "2"}
+    assert store.import_csv(applied_path, failed_path) == (2, 1)
+    assert store.connection.execute("SELECT COUNT(*) FROM applied_jobs").fetchone()[0] == 2
+    assert store.connection.execute("SELECT COUNT(*) FROM failed_jobs").fetchone()[0] == 1
+    store.close()
+
+
+def test_export_writes_every_applied_job(tmp_path, csv_paths):
+    store = SQLiteHistory(str(tmp_path / "history.db"), export_csv=False)
+    for job in jobs:
+        store.add_applied(job)
+    output = str(tmp_path / "export.csv")
+    assert store.export_csv_file(output) == 4
+    assert [row["Job ID"] for row in history.read_csv_rows(output, applied_fieldnames)] == ["1", "2", "3", "4"]
+    store.close()
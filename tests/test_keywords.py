@@ -0,0 +1,70 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+from modules.keywords import KeywordMatcher, noun_suffixes
+
+
+
+def test_finds_overlapping_keywords():
+    matcher = KeywordMatcher(["he", "she", "his", "hers"])
+    assert matcher.find_all("ushers") == {"she", "he", "hers"}
+    assert matcher.find_hits("ushers") == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+
+def test_keyword_inside_another():
+    matcher = KeywordMatcher(["name", "first name", "first"])
+    assert matcher.find_all("Your first name") == {"name", "first name", "first"}
+
+
+def test_same_as_substring_search():
+    keywords = ["salary", "pay", "ctc", "ctoc", "current", "month", "lakh", "scale of 1-10"]
+    matcher = KeywordMatcher(keywords)
+    for text in ["Current CTC per month", "Expected pay in lakhs", "On a scale of 1-10", "paycheck", "nothing here", ""]:
+        assert matcher.find_all(text) == {keyword for keyword in keywords if keyword in text.lower()}
+
+
+def test_ignores_case_by_default():
+    assert KeywordMatcher(["LinkedIn"]).find_all("your linkedin PROFILE") == {"LinkedIn"}
+    assert KeywordMatcher(["LinkedIn"], ignore_case=False).find_all("your linkedin profile") == set()
+    assert KeywordMatcher(["LinkedIn"], ignore_case=False).find_all("your LinkedIn profile") == {"LinkedIn"}
+
+
+def test_first_match_is_the_one_that_ends_first():
+    matcher = KeywordMatcher(["visa", "sponsorship"])
+    assert matcher.first_match("Do you need sponsorship for a visa?") == "sponsorship"
+    assert matcher.first_match("No keywords") is None
+
+
+def test_empty_and_duplicate_keywords_are_ignored():
+    matcher = KeywordMatcher(["", "java", "java"])
+    assert matcher.keywords == ["java"]
+    assert matcher.find_hits("java, java") == [(0, 4, "java"), (6, 10, "java")]
+
+
+def test_whole_words():
+    matcher = KeywordMatcher(["qa", "java", "c++", ".net", "machine learning"], whole_words=True)
+    assert matcher.find_all("aQAb and javascript") == set()
+    assert matcher.find_all("QA engineer, Java/C++") == {"qa", "java", "c++"}
+    assert matcher.find_all("ASP.NET and dotnet") == {".net"}
+    assert matcher.find_all("Machine Learning, machine learnings") == {"machine learning"}
+    assert KeywordMatcher(["qa"]).find_all("aQAb") == {"qa"}
+
+
+def test_whole_words_with_suffixes():
+    matcher = KeywordMatcher(["us citizen", "qa"], whole_words=True, suffixes=noun_suffixes)
+    assert matcher.find_all("US Citizenship required") == {"us citizen"}
+    assert matcher.find_all("Must be US Citizens") == {"us citizen"}
+    assert matcher.find_all("US Citizenships, QAs") == {"us citizen", "qa"}
+    assert matcher.find_all("US Citizenry, aQAs, QAship1") == set()
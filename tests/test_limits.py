@@ -0,0 +1,132 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+import asyncio
+
+import pytest
+
+import modules.ai.limits as limits
+from modules.ai.limits import CircuitBreaker, CircuitOpenError, RateLimiter, TokenBucket, retry_delay
+
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StatusError(Exception):
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(limits, "monotonic", clock)
+    return clock
+
+
+def test_bucket_waits_for_refill():
+    bucket = TokenBucket(6000)
+    bucket.charge(6000)
+    waited = asyncio.run(bucket.acquire(2))
+    assert 0.01 <= waited < 0.5
+    assert TokenBucket(0).tokens == 0 and asyncio.run(TokenBucket(0).acquire(100)) == 0
+
+
+def test_bucket_refills_up_to_capacity(clock):
+    bucket = TokenBucket(60)
+    bucket.charge(90)
+    assert bucket.tokens == -30
+    clock.now += 45
+    bucket.refill()
+    assert bucket.tokens == 15
+    clock.now += 3600
+    bucket.refill()
+    assert bucket.tokens == 60
+
+
+def test_breaker_opens_cools_down_and_probes(clock):
+    breaker = CircuitBreaker(threshold=2, cooldown=30)
+    breaker.failure()
+    breaker.check("openai")
+    breaker.failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.check("openai")
+    clock.now += 30
+    breaker.check("openai")
+    with pytest.raises(CircuitOpenError):
+        breaker.check("openai")     # Only one request tries it
+    breaker.release()
+    breaker.check("openai")
+    breaker.success()
+    breaker.check("openai")
+    assert breaker.failures == 0
+
+
+def test_breaker_with_zero_threshold_never_opens():
+    breaker = CircuitBreaker(threshold=0, cooldown=30)
+    for _ in range(10):
+        breaker.failure()
+    breaker.check("openai")
+
+
+@pytest.mark.parametrize("error, expected", [(StatusError(429), 0), (StatusError(503), 0), (asyncio.TimeoutError(), 0), (StatusError(400), None), (ValueError(), None)])
+def test_retry_delay(error, expected):
+    assert retry_delay(error) == expected
+
+
+def test_limiter_retries_and_opens_breaker(monkeypatch):
+    monkeypatch.setattr(limits, "ai_max_retries", 2)
+    monkeypatch.setattr(limits, "ai_retry_base_seconds", 0)
+    limiter = RateLimiter("test", "model")
+    limiter.breaker = CircuitBreaker(threshold=1, cooldown=60)
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3: raise StatusError(503)
+        return "answer", {"prompt_tokens": 10, "completion_tokens": 5}
+
+    assert asyncio.run(limiter.call(flaky, 8)) == "answer"
+    assert (limiter.usage.requests, limiter.usage.failures, limiter.usage.retries) == (3, 2, 2)
+    assert (limiter.usage.prompt_tokens, limiter.usage.completion_tokens) == (10, 5)
+
+    async def broken():
+        raise StatusError(400)
+
+    with pytest.raises(StatusError):
+        asyncio.run(limiter.call(broken, 8))
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(limiter.call(flaky, 8))
+
+
+def test_cancelled_probe_releases_breaker(clock):
+    limiter = RateLimiter("test", "model")
+    limiter.breaker = CircuitBreaker(threshold=1, cooldown=60)
+    limiter.breaker.failure()
+    clock.now += 60
+
+    async def slow():
+        await asyncio.sleep(10)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(asyncio.wait_for(limiter.call(slow, 1), 0.01))
+    assert not limiter.breaker.trying
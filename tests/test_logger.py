@@ -0,0 +1,75 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+import os
+import json
+
+from modules.logger import LogFile, LogWriter
+
+
+
+def read(path) -> str:
+    with open(path, encoding="utf-8") as file:
+        return file.read()
+
+
+def test_rotates_by_size_and_keeps_backups(tmp_path):
+    path = str(tmp_path / "log.txt")
+    log_file = LogFile(path, max_bytes=10, rotate_seconds=0, backup_count=2)
+    for line in ["first\n", "second\n", "third\n", "fourth\n"]:
+        log_file.write(line)
+    log_file.close()
+    assert read(path) == "fourth\n"
+    assert read(path + ".1") == "third\n"
+    assert read(path + ".2") == "second\n"
+    assert not os.path.exists(path + ".3")
+
+
+def test_rotates_old_log_on_open(tmp_path):
+    path = str(tmp_path / "log.txt")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("old\n")
+    os.utime(path, (0, 0))
+    log_file = LogFile(path, max_bytes=0, rotate_seconds=3600, backup_count=1)
+    log_file.write("new\n")
+    log_file.close()
+    assert read(path) == "new\n"
+    assert read(path + ".1") == "old\n"
+
+
+def test_writer_writes_queued_messages_on_close(tmp_path):
+    path = str(tmp_path / "log.txt")
+    writer = LogWriter(queue_size=2, json_lines=False, max_bytes=0, rotate_seconds=0)
+    writer.start()
+    for number in range(5):
+        writer.write(path, "INFO", f"message {number}")
+    writer.write(path, "INFO", "done", end="", timestamp=True)
+    writer.close()
+    lines = read(path).split("\n")
+    assert lines[:5] == [f"message {number}" for number in range(5)]
+    assert lines[5].startswith("[") and lines[5].endswith("] done")
+    writer.write(path, "INFO", "after close")
+    assert "after close" not in read(path)
+
+
+def test_writer_json_lines(tmp_path):
+    path = str(tmp_path / "log.jsonl")
+    writer = LogWriter(json_lines=True, max_bytes=0, rotate_seconds=0)
+    writer.start()
+    writer.write(path, "WARNING", "Ünïcode message")
+    writer.close()
+    record = json.loads(read(path))
+    assert (record["level"], record["message"]) == ("WARNING", "Ünïcode message")
+    assert "time" in record
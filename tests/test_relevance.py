@@ -0,0 +1,68 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+import pytest
+
+from modules.relevance import RelevanceScorer, skill_variants
+
+
+
+@pytest.fixture
+def scorer() -> RelevanceScorer:
+    resume = "Built REST APIs in Python and Django. Python services on AWS. Wrote Python tooling."
+    return RelevanceScorer(["Python", "Django", "REST APIs", "AWS", "Agile/Scrum", "CI/CD", "Node.js"], resume, expected_skills=3)
+
+
+@pytest.mark.parametrize("skill, variants", [
+    ("REST APIs", ["rest apis", "rest api", "rest-apis", "rest-api", "restapis", "restapi"]),
+    ("Agile/Scrum", ["agile", "agiles", "scrum", "scrums"]),
+    ("CI/CD", ["ci/cd"]),
+    ("Node.js", ["node.js"]),
+    ("Kubernetes", ["kubernetes", "kubernete"]),
+    ("Express", ["express"]),
+])
+def test_skill_variants(skill, variants):
+    assert skill_variants(skill) == variants
+
+
+def test_resume_mentions_weigh_skills(scorer):
+    assert scorer.skills[scorer.order[0]] == "Python"
+    assert scorer.weights[0] > scorer.weights[1] > scorer.weights[4]
+
+
+def test_scores_mentioned_skills(scorer):
+    full, partial, none = scorer.score_batch([
+        "We need Python, Django and a REST API designer",
+        "Scrum team using node.js and CI/CD",
+        "Java and Spring developer, javascript a plus",
+    ])
+    assert full.score == 1 and full.matched == ["Python", "Django", "REST APIs"] and not full.missing
+    assert 0 < partial.score < 0.7
+    assert partial.missing == ["Python", "Django", "REST APIs"]
+    assert none.score == 0 and none.matched == []
+    assert none.reasons[0] == "Mentions 0 of your 7 skills"
+
+
+def test_page_scores_are_reused_and_bounded(scorer):
+    scorer.max_scored = 2
+    scorer.score_page(["Python job", "Django job", "Python job", "", "AWS job"])
+    assert list(scorer.scored) == ["Django job", "AWS job"]
+    assert scorer.score("Django job") is scorer.scored["Django job"]
+    assert scorer.score("Python job").matched == ["Python"]
+
+
+def test_no_skills_is_always_relevant():
+    relevance = RelevanceScorer([" "]).score("Anything")
+    assert relevance.score == 1 and relevance.matched == []
@@ -0,0 +1,190 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+import random
+
+import pytest
+
+from config.questions import answer_rules
+from modules.rules import RuleEngine, context_names
+
+
+
+def make_engine(rules: list[dict], **values) -> RuleEngine:
+    return RuleEngine(rules, values)
+
+
+def test_first_rule_wins_in_order():
+    engine = make_engine([
+        {"any": ["name"], "answer": "full"},
+        {"any": ["first"], "answer": "first"},
+    ])
+    assert engine.answer("text", "First name")[0] == "full"
+
+
+def test_higher_priority_is_tried_first():
+    engine = make_engine([
+        {"any": ["visa"], "answer": "common", "priority": -1},
+        {"any": ["name"], "answer": "low"},
+        {"any": ["name"], "answer": "high", "priority": 5},
+    ])
+    assert engine.answer("text", "Visa name")[0] == "high"
+    assert engine.answer("text", "Need a visa?")[0] == "common"
+
+
+def test_any_all_and_none():
+    engine = make_engine([
+        {"all": ["name", "first"], "none": ["last"], "answer": "first"},
+        {"all": [["salary", "pay"], "month"], "answer": "monthly"},
+        {"any": ["salary", "pay"], "answer": "yearly"},
+    ])
+    assert engine.answer("text", "First name")[0] == "first"
+    assert engine.answer("text", "First and last name") == ("", None)
+    assert engine.answer("text", "Pay per month")[0] == "monthly"
+    assert engine.answer("text", "Salary per month")[0] == "monthly"
+    assert engine.answer("text", "Expected salary")[0] == "yearly"
+
+
+def test_kinds_and_answers_per_kind():
+    engine = make_engine([
+        {"kinds": ["radio"], "any": ["citizen"], "answer": "Yes"},
+        {"any": ["years"], "answer": {"select": "5+", "text": "5"}},
+    ])
+    assert engine.answer("radio", "Are you a citizen?")[0] == "Yes"
+    assert engine.answer("select", "Are you a citizen?", "default") == ("default", None)
+    assert engine.answer("select", "Years of experience")[0] == "5+"
+    assert engine.answer("text", "Years of experience")[0] == "5"
+    assert engine.answer("textarea", "Years of experience", "none")[0] == "none"
+
+
+def test_use_looks_up_values_and_context():
+    engine = make_engine([
+        {"any": ["phone"], "use": "phone_number"},
+        {"any": ["city"], "use": "current_city_or_work_location", "autocomplete": True},
+    ], phone_number="123")
+    assert engine.answer("text", "Phone")[0] == "123"
+    answer, rule = engine.answer("text", "City", current_city_or_work_location="Austin")
+    assert answer == "Austin" and rule.autocomplete
+
+
+def test_matched_rule_is_memoized_by_normalized_label():
+    engine = make_engine([{"any": ["phone"], "answer": "123"}])
+    rule = engine.match("text", "Phone  Number")
+    engine.matcher = None   # Would fail if the label was scanned again
+    assert engine.match("text", "  phone number ") is rule
+    assert list(engine.cache) == [("text", "phone number")]
+
+
+@pytest.mark.parametrize("rules, error", [
+    ([{"any": ["a"]}], ValueError),
+    ([{"any": ["a"], "answer": "x", "use": "y"}], ValueError),
+    ([{"answer": "x"}], ValueError),
+    ([{"any": ["a"], "answer": "x", "kinds": ["checkbox"]}], ValueError),
+    ([{"any": ["a"], "answer": "x", "typo": 1}], ValueError),
+    ([{"any": ["a"], "use": "undefined_setting"}], ValueError),
+    ([{"any": ["a"], "answer": "x", "priority": "high"}], TypeError),
+    ({"any": ["a"]}, TypeError),
+])
+def test_invalid_rules_are_rejected(rules, error):
+    with pytest.raises(error):
+        RuleEngine(rules, {})
+
+
+
+#< Parity of the default `answer_rules` with the if/elif chains they replaced
+def old_common(label: str, answer: str, v: dict) -> str:
+    if 'sponsorship' in label or 'visa' in label: answer = v["require_visa"]
+    return answer
+
+
+def old_select(label: str, v: dict) -> str:
+    if 'email' in label or 'phone' in label: return v["previous_answer"]
+    elif 'gender' in label or 'sex' in label: return v["gender"]
+    elif 'disability' in label: return v["disability_status"]
+    elif 'proficiency' in label: return 'Professional'
+    elif any(loc_word in label for loc_word in ['location', 'city', 'state', 'country']):
+        if 'country' in label: return v["country"]
+        elif 'state' in label: return v["state"]
+        elif 'city' in label: return v["current_city_or_work_location"]
+        else: return v["work_location"]
+    return old_common(label, 'Yes', v)
+
+
+def old_radio(label: str, v: dict) -> str:
+    if 'citizenship' in label or 'employment eligibility' in label: return v["us_citizenship"]
+    elif 'veteran' in label or 'protected' in label: return v["veteran_status"]
+    elif 'disability' in label or 'handicapped' in label: return v["disability_status"]
+    return old_common(label, 'Yes', v)
+
+
+def old_text(label: str, v: dict) -> str:
+    if 'experience' in label or 'years' in label: return v["years_of_experience"]
+    elif 'phone' in label or 'mobile' in label: return v["phone_number"]
+    elif 'street' in label: return v["street"]
+    elif 'city' in label or 'location' in label or 'address' in label: return v["current_city_or_work_location"]
+    elif 'signature' in label: return v["full_name"]
+    elif 'name' in label:
+        if 'full' in label: return v["full_name"]
+        elif 'first' in label and 'last' not in label: return v["first_name"]
+        elif 'middle' in label and 'last' not in label: return v["middle_name"]
+        elif 'last' in label and 'first' not in label: return v["last_name"]
+        elif 'employer' in label: return v["recent_employer"]
+        else: return v["full_name"]
+    elif 'notice' in label:
+        if 'month' in label: return v["notice_period_months"]
+        elif 'week' in label: return v["notice_period_weeks"]
+        else: return v["notice_period"]
+    elif 'salary' in label or 'compensation' in label or 'ctc' in label or 'ctoc' in label or 'pay' in label:
+        if 'current' in label or 'present' in label:
+            if 'month' in label: return v["current_ctc_monthly"]
+            elif 'lakh' in label: return v["current_ctc_lakhs"]
+            else: return v["current_ctc"]
+        else:
+            if 'month' in label: return v["desired_salary_monthly"]
+            elif 'lakh' in label: return v["desired_salary_lakhs"]
+            else: return v["desired_salary"]
+    elif 'linkedin' in label: return v["linkedIn"]
+    elif 'website' in label or 'blog' in label or 'portfolio' in label or 'link' in label: return v["website"]
+    elif 'scale of 1-10' in label: return v["confidence_level"]
+    elif 'headline' in label: return v["linkedin_headline"]
+    elif ('hear' in label or 'come across' in label) and 'this' in label and ('job' in label or 'position' in label): return "https://github.com/GodsScion/Auto_job_applier_linkedIn"
+    elif 'state' in label or 'province' in label: return v["state"]
+    elif 'zip' in label or 'postal' in label or 'code' in label: return v["zipcode"]
+    elif 'country' in label: return v["country"]
+    return old_common(label, "", v)
+
+
+def old_textarea(label: str, v: dict) -> str:
+    if 'summary' in label: return v["linkedin_summary"]
+    elif 'cover' in label: return v["cover_letter"]
+    return ""
+
+
+old_chains = {"select": old_select, "radio": old_radio, "text": old_text, "textarea": old_textarea}
+defaults = {"select": "Yes", "radio": "Yes", "text": "", "textarea": ""}
+
+
+def test_default_rules_answer_like_the_old_chains():
+    values = {rule["use"]: f"<{rule['use']}>" for rule in answer_rules if "use" in rule}
+    context = {name: f"<{name}>" for name in context_names}
+    engine = RuleEngine(answer_rules, values)
+    words = sorted({keyword for rule in engine.rules for keyword in rule.keywords()} | {"your", "the", "please", "enter"})
+    generator = random.Random(7)
+    labels = [" ".join(generator.sample(words, generator.randint(1, 4))) for _ in range(5000)] + words
+    for label in labels:
+        for kind, old_chain in old_chains.items():
+            answer, _ = engine.answer(kind, label, defaults[kind], **context)
+            assert answer == old_chain(label, {**values, **context}), (kind, label)
+#>
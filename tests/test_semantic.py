@@ -0,0 +1,57 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+import pytest
+
+from modules.ai.semantic import SemanticIndex
+
+
+
+@pytest.fixture
+def index(tmp_path) -> SemanticIndex:
+    index = SemanticIndex(str(tmp_path / "semantic.db"), threshold=0.5, min_overlap=0.5)
+    index.seed({"How many years of Java experience do you have?": "5"})
+    for question in ["How many years of Python experience do you have?", "Years of AWS experience", "What is your notice period?"]:
+        index.add(question, "text", "3")
+    yield index
+    index.close()
+
+
+@pytest.mark.parametrize("question", ["Java - years", "Years of experience in Java?", "Java experience (years)"])
+def test_matches_paraphrases(index, question):
+    answer, matched, similarity = index.match(question, "text")
+    assert (answer, matched) == ("5", "How many years of Java experience do you have?")
+    assert similarity >= 0.5
+
+
+@pytest.mark.parametrize("question", ["Years of experience with Python?", "How many years of professional Python programming experience do you have?"])
+def test_matches_paraphrases_with_other_words(index, question):
+    answer, matched, _ = index.match(question, "text")
+    assert (answer, matched) == ("3", "How many years of Python experience do you have?")
+
+
+def test_needs_enough_common_content_words_and_kind(index):
+    assert index.match("Years of Kotlin experience", "text") is None
+    assert index.match("Java - years", "textarea") is None
+    assert index.match("Years of experience?", "text") is None
+    assert index.match("Years of Python, Django and Flask experience", "text") is None
+
+
+def test_seeds_and_updates_are_saved(tmp_path, index):
+    index.seed({"How many years of Java experience do you have?": "6"})
+    reopened = SemanticIndex(str(tmp_path / "semantic.db"), threshold=0.5, min_overlap=0.5)
+    assert reopened.match("Java - years", "text")[0] == "6"
+    assert len(reopened.entries) == 4
+    reopened.close()
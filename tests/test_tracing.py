@@ -0,0 +1,60 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+
+import json
+
+import pytest
+
+from modules.tracing import Tracer, percentile
+
+
+
+@pytest.mark.parametrize("percent, expected", [(0, 1), (50, 5), (90, 9), (95, 10), (100, 10)])
+def test_percentile_is_nearest_rank(percent, expected):
+    assert percentile([10, 1, 9, 2, 8, 3, 7, 4, 6, 5], percent) == expected
+
+
+def test_percentile_of_few_values():
+    assert percentile([], 50) == 0
+    assert percentile([3.5], 95) == 3.5
+    assert percentile([1, 2], 50) == 1
+
+
+def test_spans_get_job_id_set_after_them(tmp_path):
+    path = str(tmp_path / "trace.jsonl")
+    tracer = Tracer(path)
+    tracer.start_job(title="Python Developer")
+    with tracer.span("open_job"):
+        tracer.record_sleep(0.5)
+    tracer.update_job("123")
+    tracer.set_job_status("applied")
+    tracer.end_job()
+    with open(path, encoding="utf-8") as file:
+        records = [json.loads(line) for line in file]
+    assert [(record["span"], record["job_id"]) for record in records] == [("open_job", "123"), ("job", "123")]
+    assert records[0]["sleep"] == 0.5 and records[1]["sleep"] == 0.5
+    assert records[1]["status"] == "applied"
+    assert records[1]["attributes"] == {"title": "Python Developer"}
+
+
+def test_summary_counts_phases_and_jobs():
+    tracer = Tracer(None)
+    for _ in range(3):
+        tracer.start_job()
+        with tracer.span("answer_questions"):
+            pass
+    lines = tracer.summary().split("\n")
+    assert {line.split()[0]: int(line.split()[1]) for line in lines[1:3]} == {"answer_questions": 3, "job": 3}
+    assert any(line.startswith("Jobs processed: 3 (skipped: 3)") for line in lines)